@@ -0,0 +1,143 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, pyqtSignal
+from launch_catalog import LAUNCH_CATALOG_FILE, LaunchCatalog, import_legacy_launches, channel_statistics
+from launch_storage import TIME_COLUMN, write_launch_samples
+
+READER_THREADS = 2
+
+# The launch archive shared by the whole app. Every write (sample files and
+# catalog rows) runs in submission order on one writer thread, so saves,
+# renames and tag edits never interleave. Reads use their own SQLite connection
+# per thread; in WAL mode each read sees a consistent snapshot of the last
+# committed state and neither blocks nor is blocked by the writer.
+#
+# Callbacks passed to the *_async methods are called with the result on the
+# GUI thread (through the `completed` signal). Every failure is reported through
+# `failed`; a write's own `on_error` is also called with the error message.
+class ArchiveService(QObject):
+    completed = pyqtSignal(object, object)  # callback, result
+    failed = pyqtSignal(str, str)           # operation, error message
+
+    def __init__(self, path=LAUNCH_CATALOG_FILE, legacy_json=None):
+        super().__init__()
+        self.path = path
+        # Created here so readers find the tables, then only used by the writer thread
+        self.writer_catalog = LaunchCatalog(path)
+        self.local = threading.local()
+        self.readers = []
+        self.readers_lock = threading.Lock()
+        self.queue = queue.Queue()
+        self.submitted = 0  # Writes queued so far
+        self.written = 0    # Writes finished so far
+        self.written_changed = threading.Condition()
+        self.pool = ThreadPoolExecutor(READER_THREADS, thread_name_prefix="archive-reader")
+        self.completed.connect(self._deliver)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        if legacy_json:
+            # The writer's first job, so every read waits for the import
+            self._submit("import", lambda catalog: import_legacy_launches(catalog, legacy_json), None)
+
+    # This thread's read-only connection to the catalog
+    def reader(self):
+        catalog = getattr(self.local, "catalog", None)
+        if catalog is None:
+            catalog = LaunchCatalog(self.path, readonly=True)
+            self.local.catalog = catalog
+            with self.readers_lock:
+                self.readers.append(catalog)
+        return catalog
+
+    # Synchronous reads, for small queries on the calling thread
+    def get(self, launch_id):
+        return self.reader().get(launch_id)
+
+    def all_launches(self):
+        return self.reader().all_launches()
+
+    def search(self, **kwargs):
+        return self.reader().search(**kwargs)
+
+    def count(self, **kwargs):
+        return self.reader().count(**kwargs)
+
+    # Runs fn(catalog) on a reader thread and hands the result to callback on the
+    # GUI thread. The read waits for writes submitted before it, so it always sees them.
+    def read_async(self, fn, callback=None):
+        after = self.submitted
+        self.pool.submit(self._read, fn, callback, after)
+
+    def _read(self, fn, callback, after):
+        with self.written_changed:
+            self.written_changed.wait_for(lambda: self.written >= after)
+        try:
+            result = fn(self.reader())
+        except Exception as e:
+            print(f"Archive read failed: {e}")
+            self.failed.emit("read", str(e))
+            return
+        if callback is not None:
+            self.completed.emit(callback, result)
+
+    # Writes the launch's sample files and its catalog entry. `series` is
+    # {name: CompactSeries} and must not be modified afterwards (see FlightRecorder.snapshot).
+    def save_launch_async(self, launch_id, launch, series, time_series, callback=None, on_error=None):
+        def save(catalog):
+            launch["samples"] = write_launch_samples(launch_id, dict(series, **{TIME_COLUMN: time_series}))
+            catalog.add_launch(launch_id, launch, channel_statistics(series))
+            return launch
+        self._submit("save", save, callback, on_error)
+
+    def add_launches_async(self, launches, callback=None):
+        self._submit("save", lambda catalog: catalog.add_launches(launches), callback)
+
+    def rename_many_async(self, names, callback=None):
+        self._submit("rename", lambda catalog: catalog.rename_many(names), callback)
+
+    def _submit(self, operation, fn, callback, on_error=None):
+        with self.written_changed:
+            self.submitted += 1
+            self.queue.put((operation, fn, callback, on_error))
+
+    def _run(self):
+        while True:
+            operation, fn, callback, on_error = self.queue.get()
+            if operation == "stop":
+                return
+            try:
+                result = fn(self.writer_catalog)
+            except Exception as e:
+                print(f"Archive {operation} failed: {e}")
+                self.failed.emit(operation, str(e))
+                if on_error is not None:
+                    self.completed.emit(on_error, str(e))
+            else:
+                if callback is not None:
+                    self.completed.emit(callback, result)
+            finally:
+                with self.written_changed:
+                    self.written += 1
+                    self.written_changed.notify_all()
+
+    def _deliver(self, callback, result):
+        callback(result)
+
+    # Block until every write submitted so far is on disk
+    def flush(self, timeout=None):
+        after = self.submitted
+        with self.written_changed:
+            return self.written_changed.wait_for(lambda: self.written >= after, timeout)
+
+    # Finish queued writes, then close every connection
+    def stop(self):
+        if self.thread.is_alive():
+            self.queue.put(("stop", None, None, None))
+            self.thread.join()
+        self.pool.shutdown(wait=True)
+        with self.readers_lock:
+            for catalog in self.readers:
+                catalog.close()
+            self.readers = []
+        self.writer_catalog.close()
@@ -0,0 +1,89 @@
+import re
+import sys
+
+# Whole line is "key:value" fields separated by commas, each with exactly one colon
+WELL_FORMED = re.compile(r"[^:,]*:[^:,]*(?:,[^:,]*:[^:,]*)*")
+
+# Schema-aware parser for the flight computer's "Key:value,Key:value" lines.
+# Known keys map straight to column slots of a caller-owned row; unknown and
+# malformed fields are counted and skipped instead of rejecting the whole line.
+class AsciiParser:
+    def __init__(self, schema):
+        # Only raw channels come off the wire; derived channels keep their slots in the row
+        self.slots = {sys.intern(channel.name): channel.index for channel in schema.raw_channels}
+        self.width = len(schema)
+        # The packet sequence number, if any, goes in one extra slot after the channels
+        self.sequence_slot = None
+        if schema.sequence_key:
+            self.sequence_slot = self.width
+            self.slots[sys.intern(schema.sequence_key)] = self.sequence_slot
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.lines_parsed = 0
+        self.lines_rejected = 0  # Lines without a single usable field
+        self.fields_parsed = 0
+        self.fields_unknown = 0
+        self.fields_malformed = 0
+
+    def new_row(self):
+        return [float("nan")] * (self.width + (self.sequence_slot is not None))
+
+    def parse_into(self, line, row):
+        if self.sequence_slot is not None:
+            row[self.sequence_slot] = float("nan")
+        # Fast path: a single replace + split yields alternating keys and values,
+        # valid only when every comma-separated field has exactly one colon
+        if not WELL_FORMED.fullmatch(line):
+            return self._parse_tolerant(line, row)
+        parts = line.replace(":", ",").split(",")
+
+        slots = self.slots
+        parsed = 0
+        it = iter(parts)
+        for key, value in zip(it, it):
+            slot = slots.get(key)
+            if slot is None:
+                self.fields_unknown += 1
+                continue
+            try:
+                row[slot] = float(value)
+                parsed += 1
+            except ValueError:
+                self.fields_malformed += 1
+        return self._finish_line(parsed)
+
+    def _parse_tolerant(self, line, row):
+        parsed = 0
+        for field in line.split(","):
+            key, sep, value = field.partition(":")
+            if not sep or ":" in value:
+                self.fields_malformed += 1
+                continue
+            slot = self.slots.get(key)
+            if slot is None:
+                self.fields_unknown += 1
+                continue
+            try:
+                row[slot] = float(value)
+                parsed += 1
+            except ValueError:
+                self.fields_malformed += 1
+        return self._finish_line(parsed)
+
+    def _finish_line(self, parsed):
+        if parsed:
+            self.lines_parsed += 1
+            self.fields_parsed += parsed
+        else:
+            self.lines_rejected += 1
+        return parsed
+
+    def counters(self):
+        return {
+            "lines_parsed": self.lines_parsed,
+            "lines_rejected": self.lines_rejected,
+            "fields_parsed": self.fields_parsed,
+            "fields_unknown": self.fields_unknown,
+            "fields_malformed": self.fields_malformed,
+        }
@@ -0,0 +1,185 @@
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+import tempfile
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import numpy as np
+from PyQt5.QtWidgets import QApplication
+from channels import Channel, ChannelSchema, load_channel_schema
+from synthetic_flight import generate_flight_lines
+from past_launches import PastLaunchesScreen
+from dashboard import Dashboard, SummaryScreen
+
+MEMORY_SAMPLE_S = 10.0  # Simulated seconds between memory samples
+
+def noop(*args):
+    pass
+
+class SimulatedClock:
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / 2 ** 20
+    except OSError:
+        # Peak rather than current RSS, ru_maxrss is in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+def traced_mb():
+    return tracemalloc.get_traced_memory()[0] / 2 ** 20 if tracemalloc.is_tracing() else 0.0
+
+# The configured schema plus `extra` derived channels, each in its own plot group,
+# standing in for a flight computer with many more sensors
+def wide_schema(extra):
+    schema = load_channel_schema(os.path.join(REPO_DIR, "channels.json"))
+    channels = list(schema)
+    for i in range(extra):
+        spec = {"name": f"Extra{i}", "kind": "moving_average", "source": "Velocity", "window": 2 + i, "unit": "m/s"}
+        channels.append(Channel.from_dict(spec, derived=True))
+    return ChannelSchema(channels, schema.sequence_key)
+
+# Drive a Dashboard through a simulated flight with no display and no serial port.
+# Each timer interval the harness feeds the lines that would have arrived at `rate`
+# lines/s, then runs one frame and lets Qt paint it offscreen.
+def run_flight(rate=50.0, duration=120.0, interval_ms=None, seed=0, trace_memory=False, app=None, fast_render=True,
+               combined=False, schema=None):
+    app = app or QApplication.instance() or QApplication([])
+    schema = schema or load_channel_schema(os.path.join(REPO_DIR, "channels.json"))
+    clock = SimulatedClock()
+
+    dashboard = Dashboard(noop, PastLaunchesScreen(noop, noop), schema, combined=combined)
+    dashboard.clock = clock
+    dashboard.start_time = clock()
+    dashboard.fast_button.setChecked(fast_render)
+    dashboard.resize(1200, 500)
+    dashboard.show()
+    app.processEvents()
+
+    interval_ms = interval_ms or dashboard.timer.interval()
+    interval = interval_ms / 1000.0
+    frames = int(duration / interval)
+    source = dashboard.link_stats.source("harness")
+    lines = generate_flight_lines(int(rate * duration) + 1, rate=rate, seed=seed)
+
+    if trace_memory:
+        # Python-level allocation tracking, slows frames down several times
+        tracemalloc.start()
+    memory = [(0.0, traced_mb(), rss_mb())]
+    frame_times = np.empty(frames)
+    missed = 0
+    fed = 0
+    next_memory_sample = MEMORY_SAMPLE_S
+
+    for frame in range(frames):
+        frame_end = (frame + 1) * interval
+        # Lines that arrived during this interval, stamped at their simulated arrival time
+        while fed < rate * frame_end:
+            clock.now = fed / rate
+            dashboard.process_serial_data(next(lines), source, clock.now)
+            fed += 1
+
+        clock.now = frame_end
+        start = time.perf_counter()
+        dashboard.render_frame()
+        app.processEvents()
+        cost = time.perf_counter() - start
+        frame_times[frame] = cost
+        # A frame longer than the timer interval swallows the ticks it overlaps
+        missed += int(cost // interval)
+
+        if frame_end >= next_memory_sample:
+            memory.append((frame_end, traced_mb(), rss_mb()))
+            next_memory_sample += MEMORY_SAMPLE_S
+
+    summary_screen = SummaryScreen(noop, schema, combined)
+    start = time.perf_counter()
+    summary_screen.update_graphs(dashboard.data_history, dashboard.time_history)
+    app.processEvents()
+    summary_ms = (time.perf_counter() - start) * 1000
+    if trace_memory:
+        tracemalloc.stop()
+
+    frame_ms = frame_times * 1000
+    elapsed_min = duration / 60.0
+    return {
+        "rate": rate,
+        "fast_render": fast_render,
+        "combined": combined,
+        "channels": len(schema),
+        "duration_s": duration,
+        "interval_ms": interval_ms,
+        "frames": frames,
+        "lines": fed,
+        "frame_ms": {
+            "mean": float(frame_ms.mean()),
+            "p50": float(np.percentile(frame_ms, 50)),
+            "p90": float(np.percentile(frame_ms, 90)),
+            "p99": float(np.percentile(frame_ms, 99)),
+            "max": float(frame_ms.max()),
+        },
+        "missed_frames": missed,
+        "memory": {
+            "rss_start_mb": memory[0][2],
+            "rss_end_mb": memory[-1][2],
+            "rss_growth_mb_per_min": (memory[-1][2] - memory[0][2]) / elapsed_min,
+            "traced_growth_mb_per_min": (memory[-1][1] - memory[0][1]) / elapsed_min,
+            "samples": memory,
+        },
+        "summary_ms": summary_ms,
+        "latency": dashboard.latency.as_dict(),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Offscreen Dashboard/SummaryScreen render harness.")
+    parser.add_argument("--rate", type=float, default=50.0, help="Telemetry lines per second")
+    parser.add_argument("--duration", type=float, default=120.0, help="Simulated flight length in seconds")
+    parser.add_argument("--interval", type=float, default=None, help="Frame interval in ms (default: dashboard timer)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--smooth", action="store_true", help="Render with spline smoothing instead of fast render")
+    parser.add_argument("--combined", action="store_true", help="Stack all plot groups in one widget")
+    parser.add_argument("--extra-channels", type=int, default=0, help="Add this many derived channels/plot groups")
+    parser.add_argument("--trace-memory", action="store_true", help="Track Python allocations with tracemalloc")
+    parser.add_argument("--json", help="Also write the report to this file")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    # Keep anything the screens write (archive files) out of the repo
+    os.chdir(tempfile.mkdtemp(prefix="telemetry-harness-"))
+    report = run_flight(args.rate, args.duration, args.interval, args.seed, args.trace_memory, app,
+                        not args.smooth, args.combined, wide_schema(args.extra_channels))
+
+    fm = report["frame_ms"]
+    mem = report["memory"]
+    print(f"{report['frames']} frames, {report['lines']} lines at {report['rate']:g} lines/s, "
+          f"{report['channels']} channels, {'fast' if report['fast_render'] else 'smooth'} render"
+          f"{', combined' if report['combined'] else ''}")
+    print(f"frame ms: mean {fm['mean']:.2f} p50 {fm['p50']:.2f} p90 {fm['p90']:.2f} p99 {fm['p99']:.2f} max {fm['max']:.2f}")
+    print(f"missed frames: {report['missed_frames']}")
+    print(f"RSS: {mem['rss_start_mb']:.1f} -> {mem['rss_end_mb']:.1f} MB ({mem['rss_growth_mb_per_min']:.2f} MB/min)")
+    if args.trace_memory:
+        print(f"traced Python memory growth: {mem['traced_growth_mb_per_min']:.2f} MB/min")
+    latency = report["latency"]
+    print(f"latency ms (simulated clock): total p50 {latency['total']['p50_ms']:.1f} p99 {latency['total']['p99_ms']:.1f}, "
+          f"queue p50 {latency['queue']['p50_ms']:.1f}")
+    print(f"summary render: {report['summary_ms']:.1f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=4)
+
+if __name__ == "__main__":
+    main()
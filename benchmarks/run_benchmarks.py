@@ -0,0 +1,263 @@
+import os
+import sys
+import json
+import time
+import glob
+import shutil
+import argparse
+import platform
+import tempfile
+import statistics
+import subprocess
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import numpy as np
+from PyQt5.QtWidgets import QApplication
+from channels import load_channel_schema
+from synthetic_flight import generate_flight, generate_flight_lines
+import past_launches
+from past_launches import PastLaunchesScreen
+from launch_storage import read_launch_samples, LAUNCH_DATA_DIR
+from launch_cache import LaunchCache
+from launch_catalog import LAUNCH_CATALOG_FILE
+from dashboard import Dashboard, SummaryScreen
+
+RESULTS_DIR = os.path.join(REPO_DIR, "benchmarks", "results")
+SIZES = {"1k": 1000, "100k": 100000, "10M": 10000000}
+DEFAULT_SIZES = ["1k", "100k"]
+REGRESSION_THRESHOLD = 1.2  # Flag metrics that got 20% worse than the previous run
+PARSE_CHUNK = 100000
+
+def noop(*args):
+    pass
+
+def median_time(fn, repeat):
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+def metric(value, unit, better):
+    return {"value": value, "unit": unit, "better": better}
+
+def dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    return total
+
+class BenchContext:
+    def __init__(self):
+        self.app = QApplication.instance() or QApplication([])
+        self.schema = load_channel_schema(os.path.join(REPO_DIR, "channels.json"))
+        self.workdir = tempfile.mkdtemp(prefix="telemetry-bench-")
+        self.previous_cwd = os.getcwd()
+        # The archive uses paths relative to the working directory
+        os.chdir(self.workdir)
+
+    def close(self):
+        past_launches.close_archive()
+        os.chdir(self.previous_cwd)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def reset_archive(self):
+        past_launches.close_archive()
+        for path in (past_launches.LAUNCH_DATA_FILE, LAUNCH_CATALOG_FILE,
+                     LAUNCH_CATALOG_FILE + "-wal", LAUNCH_CATALOG_FILE + "-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+        shutil.rmtree(LAUNCH_DATA_DIR, ignore_errors=True)
+
+    def dashboard(self):
+        screen = PastLaunchesScreen(noop, noop)
+        return Dashboard(noop, screen, self.schema)
+
+    # A dashboard whose history already holds n samples of a synthetic flight
+    def filled_dashboard(self, n):
+        dashboard = self.dashboard()
+        t, channels = generate_flight(n)
+        rows = np.full((n, len(self.schema)), np.nan)
+        for channel in self.schema:
+            if channel.name in channels:
+                rows[:, channel.index] = channels[channel.name]
+                dashboard.data[channel.index] = float(channels[channel.name][-1])
+        dashboard.history.append_rows(t, rows)
+        dashboard.recorder.add(t, rows)
+        return dashboard
+
+def bench_parse(ctx, n):
+    dashboard = ctx.dashboard()
+    total = 0.0
+    lines = generate_flight_lines(n, chunk=PARSE_CHUNK)
+    while True:
+        chunk = [line for _, line in zip(range(PARSE_CHUNK), lines)]
+        if not chunk:
+            break
+        start = time.perf_counter()
+        for line in chunk:
+            dashboard.process_serial_data(line)
+        total += time.perf_counter() - start
+    return {"lines_per_s": metric(n / total, "lines/s", "higher")}
+
+def bench_interpolate(ctx, n):
+    dashboard = ctx.filled_dashboard(max(n, 100))
+    channel = ctx.schema.channels[0]
+    x = dashboard.time_history.tail(100)
+    y = dashboard.data_history[channel.index].tail(100)
+    per_call = median_time(lambda: [dashboard.interpolate_data(x, y, num_points=50) for _ in range(100)], 5) / 100
+    return {"call_us": metric(per_call * 1e6, "us", "lower")}
+
+def bench_frame(ctx, n):
+    dashboard = ctx.filled_dashboard(n)
+    lines = generate_flight_lines(51, seed=1)
+
+    # Frames only redraw when something new arrived, so feed one line per frame
+    def frame():
+        dashboard.process_serial_data(next(lines))
+        dashboard.render_frame()
+
+    frame()  # Warm up pyqtgraph item caches
+    return {"frame_ms": metric(median_time(frame, 50) * 1000, "ms", "lower")}
+
+def bench_storage(ctx, n):
+    ctx.reset_archive()
+    dashboard = ctx.filled_dashboard(n)
+    # Saves run on the archive's writer thread, time them until they are on disk
+    save_s = median_time(lambda: (dashboard.save_current_launch(), past_launches.get_archive().flush()), 1)
+
+    def load():
+        launches = past_launches.load_past_launches()
+        for launch_id, launch in launches.items():
+            read_launch_samples(launch_id, launch)
+
+    load_s = median_time(load, 3)
+    size = os.path.getsize(LAUNCH_CATALOG_FILE) + dir_size(LAUNCH_DATA_DIR)
+    return {
+        "save_ms": metric(save_s * 1000, "ms", "lower"),
+        "load_ms": metric(load_s * 1000, "ms", "lower"),
+        "archive_bytes": metric(size, "bytes", "lower"),
+    }
+
+def bench_summary(ctx, n):
+    ctx.reset_archive()
+    dashboard = ctx.filled_dashboard(n)
+    dashboard.save_current_launch()
+    past_launches.get_archive().flush()
+    launch_id = next(iter(past_launches.load_past_launches()))
+    summary = SummaryScreen(noop, ctx.schema)
+    live_s = median_time(lambda: summary.update_graphs(dashboard.data_history, dashboard.time_history), 3)
+
+    launch = past_launches.load_past_launches()[launch_id]
+
+    # What the background loader does, followed by the GUI-thread plotting.
+    # Cold: nothing cached in memory or on disk; warm: reopening the same launch
+    def cold():
+        summary.loader.cache = LaunchCache(ctx.schema, persist=False)
+        summary.show_summary(summary.loader.cache.get(launch_id, launch))
+
+    archived_s = median_time(cold, 3)
+    warm_s = median_time(lambda: summary.show_summary(summary.loader.cache.get(launch_id, launch)), 3)
+    return {
+        "live_ms": metric(live_s * 1000, "ms", "lower"),
+        "archived_ms": metric(archived_s * 1000, "ms", "lower"),
+        "archived_cached_ms": metric(warm_s * 1000, "ms", "lower"),
+    }
+
+BENCHMARKS = {
+    "parse": bench_parse,
+    "interpolate": bench_interpolate,
+    "frame": bench_frame,
+    "storage": bench_storage,
+    "summary": bench_summary,
+}
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def latest_results(exclude=None):
+    paths = sorted(glob.glob(os.path.join(RESULTS_DIR, "*.json")))
+    paths = [path for path in paths if path != exclude]
+    if not paths:
+        return None
+    with open(paths[-1], "r") as f:
+        return json.load(f)
+
+# Compare against the previous stored run and return the metrics that regressed
+def compare(current, previous, threshold=REGRESSION_THRESHOLD):
+    regressions = []
+    for bench, sizes in current["results"].items():
+        for size, metrics in sizes.items():
+            for name, m in metrics.items():
+                old = previous["results"].get(bench, {}).get(size, {}).get(name)
+                if not old or not old["value"] or not m["value"]:
+                    continue
+                ratio = m["value"] / old["value"]
+                if m["better"] == "higher":
+                    ratio = 1.0 / ratio
+                marker = ""
+                if ratio > threshold:
+                    marker = "  REGRESSION"
+                    regressions.append((bench, size, name, ratio))
+                print(f"  {bench}/{size}/{name}: {old['value']:.4g} -> {m['value']:.4g} {m['unit']} (x{ratio:.2f} cost){marker}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ingest, parse, render and storage paths.")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, choices=list(SIZES),
+                        help="Dataset sizes to run (10M takes several minutes)")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Run only these benchmarks")
+    parser.add_argument("--no-save", action="store_true", help="Do not store results in benchmarks/results")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Exit non-zero when a metric regressed against the previous run")
+    args = parser.parse_args()
+
+    ctx = BenchContext()
+    results = {}
+    try:
+        for name in args.only or BENCHMARKS:
+            for size in args.sizes:
+                print(f"{name} @ {size}...", flush=True)
+                results.setdefault(name, {})[size] = BENCHMARKS[name](ctx, SIZES[size])
+    finally:
+        ctx.close()
+
+    current = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    for bench, sizes in results.items():
+        for size, metrics in sizes.items():
+            for name, m in metrics.items():
+                print(f"{bench}/{size}/{name}: {m['value']:.4g} {m['unit']}")
+
+    path = None
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}_{current['commit']}.json")
+        with open(path, "w") as f:
+            json.dump(current, f, indent=4)
+        print(f"Results saved to {path}")
+
+    previous = latest_results(exclude=path)
+    regressions = []
+    if previous:
+        print(f"Compared with {previous['commit']} ({previous['timestamp']}):")
+        regressions = compare(current, previous)
+    if regressions and args.fail_on_regression:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
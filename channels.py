@@ -0,0 +1,114 @@
+import os
+import json
+import numpy as np
+
+CHANNEL_SCHEMA_FILE = "channels.json"
+
+# Storage encoding for a channel: stored = round((value - offset) / scale) as dtype.
+# Float dtypes skip the rounding and just narrow the value.
+class ChannelEncoding:
+    def __init__(self, dtype="float32", scale=1.0, offset=0.0):
+        self.dtype = np.dtype(dtype)
+        self.scale = float(scale)
+        self.offset = float(offset)
+        self.is_integer = np.issubdtype(self.dtype, np.integer)
+        if self.is_integer:
+            info = np.iinfo(self.dtype)
+            self.raw_min, self.raw_max = info.min, info.max
+
+    def encode(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if not self.is_integer:
+            return ((values - self.offset) / self.scale).astype(self.dtype)
+        raw = np.rint((values - self.offset) / self.scale)
+        # NaN has no integer representation, store it as the dtype minimum
+        raw = np.where(np.isnan(raw), self.raw_min, np.clip(raw, self.raw_min + 1, self.raw_max))
+        return raw.astype(self.dtype)
+
+    # Pass `out` (float64, same length) to decode into an existing buffer without allocating
+    def decode(self, raw, out=None):
+        if out is None:
+            values = np.asarray(raw).astype(np.float64)
+        else:
+            values = out
+            np.copyto(values, raw, casting="unsafe")
+        if self.is_integer:
+            values[np.asarray(raw) == self.raw_min] = np.nan
+        values *= self.scale
+        values += self.offset
+        return values
+
+    def to_dict(self):
+        return {"dtype": self.dtype.name, "scale": self.scale, "offset": self.offset}
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(d.get("dtype", "float32"), d.get("scale", 1.0), d.get("offset", 0.0))
+
+TIME_ENCODING = ChannelEncoding("float64")
+
+class Channel:
+    def __init__(self, name, unit="", dtype="float32", scale=1.0, offset=0.0,
+                 color="#FFFFFF", group=None, rate=10.0, derived=None):
+        self.name = name
+        self.unit = unit
+        self.encoding = ChannelEncoding(dtype, scale, offset)
+        self.color = color
+        self.group = group or name
+        self.rate = float(rate)  # Expected samples per second
+        self.index = None  # Column index, assigned by ChannelSchema
+        # For computed channels: {"kind": ..., "source": ..., params}, see derived_channels.py
+        self.derived = derived
+
+    def label(self):
+        return f"{self.name} ({self.unit})" if self.unit else self.name
+
+    @classmethod
+    def from_dict(cls, d, derived=False):
+        return cls(d["name"], d.get("unit", ""), d.get("dtype", "float32"), d.get("scale", 1.0),
+                   d.get("offset", 0.0), d.get("color", "#FFFFFF"), d.get("group"), d.get("rate", 10.0),
+                   dict(d) if derived else None)
+
+# Ordered set of channels with precomputed column indices. Everything on the hot
+# path (parser, stores, plots) works with channel.index rather than names.
+class ChannelSchema:
+    def __init__(self, channels, sequence_key="Seq"):
+        self.channels = list(channels)
+        self.sequence_key = sequence_key  # Optional packet counter sent alongside the channels
+        self.names = [channel.name for channel in self.channels]
+        self.index = {}
+        self.groups = {}
+        for i, channel in enumerate(self.channels):
+            channel.index = i
+            self.index[channel.name] = i
+            self.groups.setdefault(channel.group, []).append(channel)
+        self.raw_channels = [channel for channel in self.channels if channel.derived is None]
+        self.derived_channels = [channel for channel in self.channels if channel.derived is not None]
+        self.expected_rate = max((channel.rate for channel in self.raw_channels), default=0.0)
+
+    def __len__(self):
+        return len(self.channels)
+
+    def __iter__(self):
+        return iter(self.channels)
+
+    def __getitem__(self, name):
+        return self.channels[self.index[name]]
+
+DEFAULT_CHANNELS = [
+    {"name": "Velocity", "unit": "m/s", "dtype": "int32", "scale": 0.01, "color": "#7BAFD4"},
+    {"name": "Altitude", "unit": "m", "dtype": "int32", "scale": 0.01, "color": "#990000"},
+    {"name": "Temperature", "unit": "degC", "dtype": "int16", "scale": 0.01, "color": "#0A843D"},
+    {"name": "Pressure", "unit": "hPa", "dtype": "int32", "scale": 0.01, "color": "#AE9142"},
+]
+
+# Load the channel schema, falling back to the four original fields if there is no file.
+# Derived channels are appended after the raw ones, in declaration order.
+def load_channel_schema(path=CHANNEL_SCHEMA_FILE):
+    config = {"channels": DEFAULT_CHANNELS}
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            config = json.load(f)
+    channels = [Channel.from_dict(d) for d in config["channels"]]
+    channels += [Channel.from_dict(d, derived=True) for d in config.get("derived", [])]
+    return ChannelSchema(channels, config.get("sequence_key", "Seq"))
@@ -0,0 +1,117 @@
+import os
+import json
+import time
+import serial
+from serial.tools import list_ports
+from ascii_parser import AsciiParser
+from serial_backends import LineFramer
+
+CONNECTION_CONFIG_FILE = "telemetry_config.json"
+
+BAUD_RATES = [9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600, 2000000]
+FRAMINGS = {"lf": b"\n", "crlf": b"\r\n", "cr": b"\r"}
+BACKENDS = ["thread", "asyncio"]
+PARITIES = {"N": serial.PARITY_NONE, "E": serial.PARITY_EVEN, "O": serial.PARITY_ODD}
+STOPBITS = {"1": serial.STOPBITS_ONE, "2": serial.STOPBITS_TWO}
+DATA_BITS = {"5": serial.FIVEBITS, "6": serial.SIXBITS, "7": serial.SEVENBITS, "8": serial.EIGHTBITS}
+DEFAULT_DATA_FORMAT = "8N1"
+
+# USB-serial chips and boards flight computers usually sit behind, tried first by auto-detect
+KNOWN_ADAPTERS = ("CP210", "CH340", "CH910", "FTDI", "FT232", "Arduino", "Teensy", "Feather", "USB Serial")
+
+class ConnectionConfig:
+    def __init__(self, port="COM4", baudrate=9600, framing="lf", data_format=DEFAULT_DATA_FORMAT,
+                 read_chunk_size=4096, rx_buffer_size=65536, tx_buffer_size=4096, backend="thread"):
+        self.port = port
+        self.baudrate = int(baudrate)
+        self.framing = framing          # Line terminator, see FRAMINGS
+        self.data_format = data_format  # Data bits, parity, stop bits, e.g. "8N1"
+        self.read_chunk_size = int(read_chunk_size)
+        self.rx_buffer_size = int(rx_buffer_size)
+        self.tx_buffer_size = int(tx_buffer_size)
+        self.backend = backend
+
+    def delimiter(self):
+        return FRAMINGS.get(self.framing, b"\n")
+
+    # Keyword arguments for serial.Serial matching data_format; ValueError if it is not one
+    def serial_kwargs(self):
+        data_format = str(self.data_format)
+        data_bits, parity, stop_bits = data_format[:1], data_format[1:2].upper(), data_format[2:]
+        if data_bits not in DATA_BITS or parity not in PARITIES or stop_bits not in STOPBITS:
+            raise ValueError(f"Unsupported data format {self.data_format!r}, expected e.g. {DEFAULT_DATA_FORMAT!r}")
+        return {
+            "baudrate": self.baudrate,
+            "bytesize": DATA_BITS[data_bits],
+            "parity": PARITIES[parity],
+            "stopbits": STOPBITS[stop_bits],
+        }
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, d):
+        known = cls().__dict__
+        return cls(**{key: value for key, value in d.items() if key in known})
+
+def load_connection_config(path=CONNECTION_CONFIG_FILE):
+    if not os.path.exists(path):
+        return ConnectionConfig()
+    with open(path, "r") as f:
+        config = ConnectionConfig.from_dict(json.load(f))
+    try:
+        config.serial_kwargs()
+    except ValueError as e:
+        print(f"{e} in {path}, using {DEFAULT_DATA_FORMAT}")
+        config.data_format = DEFAULT_DATA_FORMAT
+    return config
+
+# Written to a temporary file and swapped in, so a crash never leaves half a config
+def save_connection_config(config, path=CONNECTION_CONFIG_FILE):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(config.to_dict(), f, indent=4)
+    os.replace(tmp_path, path)
+
+# Available ports as (device, description), likely flight computer adapters first
+def list_serial_ports():
+    ports = [(p.device, p.description or "") for p in list_ports.comports()]
+    return sorted(ports, key=lambda p: not any(name.lower() in p[1].lower() for name in KNOWN_ADAPTERS))
+
+# Listen on one port/baud for a moment and return the fraction of lines that parse
+def probe_port(port, baudrate, schema, listen_s=1.0):
+    try:
+        ser = serial.Serial(port=port, baudrate=baudrate, timeout=0.1)
+    except (serial.SerialException, OSError):
+        return 0.0, 0
+    parser = AsciiParser(schema)
+    row = parser.new_row()
+    framer = LineFramer()
+    deadline = time.monotonic() + listen_s
+    skip_first = True  # Listening starts mid-line
+    try:
+        while time.monotonic() < deadline:
+            for line in framer.feed(ser.read(ser.in_waiting or 1)):
+                if skip_first:
+                    skip_first = False
+                    continue
+                try:
+                    parser.parse_into(line.decode("utf-8").strip(), row)
+                except UnicodeDecodeError:
+                    parser.lines_rejected += 1
+    finally:
+        ser.close()
+    total = parser.lines_parsed + parser.lines_rejected
+    return (parser.lines_parsed / total if total else 0.0), parser.lines_parsed
+
+# Find the port and baud rate the flight computer is talking on. At the wrong
+# baud the bytes decode to garbage, so the rate with cleanly parsing lines wins.
+def auto_detect(schema, ports=None, baudrates=None, listen_s=1.0, min_lines=2, min_ratio=0.8):
+    ports = ports if ports is not None else [device for device, _ in list_serial_ports()]
+    for port in ports:
+        for baudrate in baudrates or sorted(BAUD_RATES, reverse=True):
+            ratio, lines = probe_port(port, baudrate, schema, listen_s)
+            if lines >= min_lines and ratio >= min_ratio:
+                return port, baudrate
+    return None
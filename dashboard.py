@@ -1,9 +1,26 @@
 import sys
-from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QLabel, QWidget, QHBoxLayout, QPushButton, QStackedWidget, QGridLayout
-from PyQt5.QtCore import QTimer, Qt
+import argparse
+from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QLabel, QWidget, QHBoxLayout, QPushButton, QStackedWidget, QGridLayout, QComboBox
+from PyQt5.QtCore import QTimer, Qt, QEvent, pyqtSignal
 from mock_serial import MockSerial
 import serial
-from past_launches import PastLaunchesScreen, load_past_launches, save_past_launches
+from past_launches import PastLaunchesScreen, load_past_launches, get_archive, close_archive
+from channels import load_channel_schema
+from telemetry_store import RecordStore
+from ascii_parser import AsciiParser
+from link_stats import LinkStats, format_link_summary
+from instrumentation import instrumentation, format_snapshot, FlightProfiler, LatencyTracker
+from collections import deque
+from serial_backends import AsyncioSerialHub, LineFramer
+from connection_config import (BAUD_RATES, FRAMINGS, BACKENDS, load_connection_config, save_connection_config,
+                               list_serial_ports, auto_detect)
+from launch_cache import LaunchCache
+from launch_loader import LaunchLoader, prefetch_candidates
+from launch_compare import delta_curves, overlay_data
+from derived_channels import DerivedChannelEngine
+from event_detection import EVENT_COLORS, EventDetector
+from flight_recorder import FlightRecorder
+from multi_plot import MultiChannelPlot
 import pyqtgraph as pg
 import threading
 import time
@@ -12,9 +29,13 @@ import numpy as np
 from scipy.interpolate import make_interp_spline
 
 class MainMenu(QWidget):
-    def __init__(self, switch_to_dashboard, switch_to_past_launches):
+    detected = pyqtSignal(object)
+
+    def __init__(self, switch_to_dashboard, switch_to_past_launches, connection, schema):
         super().__init__()
         self.layout = QVBoxLayout(self)
+        self.connection = connection
+        self.schema = schema
 
         # Title label
         title_label = QLabel("[Rocket Name] Telemetry", self)
@@ -27,7 +48,7 @@ class MainMenu(QWidget):
         launch_button.setStyleSheet(
             "font-size: 36px; font-weight: bold; background-color: red; color: white; border-radius: 100px; padding: 50px;"
         )
-        launch_button.clicked.connect(switch_to_dashboard)
+        launch_button.clicked.connect(lambda: [self.apply_connection(), switch_to_dashboard()])
 
         # Center the button
         button_container = QHBoxLayout()
@@ -38,88 +59,289 @@ class MainMenu(QWidget):
         self.layout.addLayout(button_container)
         self.layout.addStretch()
 
+        # Serial connection settings, saved to telemetry_config.json on launch
+        connection_layout = QHBoxLayout()
+        self.port_box = QComboBox(self)
+        self.port_box.setEditable(True)
+        self.port_box.setMinimumWidth(200)
+        connection_layout.addWidget(QLabel("Port:", self))
+        connection_layout.addWidget(self.port_box)
+
+        self.baud_box = QComboBox(self)
+        self.baud_box.setEditable(True)
+        self.baud_box.addItems([str(rate) for rate in BAUD_RATES])
+        self.baud_box.setCurrentText(str(connection.baudrate))
+        connection_layout.addWidget(QLabel("Baud:", self))
+        connection_layout.addWidget(self.baud_box)
+
+        self.framing_box = QComboBox(self)
+        self.framing_box.addItems(list(FRAMINGS))
+        self.framing_box.setCurrentText(connection.framing)
+        connection_layout.addWidget(QLabel("Line end:", self))
+        connection_layout.addWidget(self.framing_box)
+
+        self.backend_box = QComboBox(self)
+        self.backend_box.addItems(BACKENDS)
+        self.backend_box.setCurrentText(connection.backend)
+        connection_layout.addWidget(QLabel("Reader:", self))
+        connection_layout.addWidget(self.backend_box)
+
+        refresh_button = QPushButton("Refresh", self)
+        refresh_button.clicked.connect(self.refresh_ports)
+        connection_layout.addWidget(refresh_button)
+
+        self.detect_button = QPushButton("Auto-detect", self)
+        self.detect_button.clicked.connect(self.start_auto_detect)
+        connection_layout.addWidget(self.detect_button)
+        self.layout.addLayout(connection_layout)
+
+        self.connection_status = QLabel("", self)
+        self.layout.addWidget(self.connection_status)
+        self.detected.connect(self.on_detected)
+        self.refresh_ports()
+
         # View past launches button
         past_launches_button = QPushButton("View Past Launches", self)
         past_launches_button.setStyleSheet("font-size: 24px;")
         past_launches_button.clicked.connect(switch_to_past_launches)
         self.layout.addWidget(past_launches_button)
 
+    def refresh_ports(self):
+        current = self.port_box.currentText() or self.connection.port
+        self.port_box.clear()
+        for device, description in list_serial_ports():
+            self.port_box.addItem(device)
+            self.port_box.setItemData(self.port_box.count() - 1, description, Qt.ToolTipRole)
+        self.port_box.setCurrentText(current)
+
+    def apply_connection(self):
+        self.connection.port = self.port_box.currentText().strip() or self.connection.port
+        try:
+            self.connection.baudrate = int(self.baud_box.currentText())
+        except ValueError:
+            self.baud_box.setCurrentText(str(self.connection.baudrate))
+        self.connection.framing = self.framing_box.currentText()
+        self.connection.backend = self.backend_box.currentText()
+        save_connection_config(self.connection)
+
+    def start_auto_detect(self):
+        self.detect_button.setEnabled(False)
+        self.connection_status.setText("Searching for the flight computer...")
+        # Probing takes about a second per port and baud rate, keep it off the GUI thread
+        threading.Thread(target=lambda: self.detected.emit(auto_detect(self.schema)), daemon=True).start()
+
+    def on_detected(self, result):
+        self.detect_button.setEnabled(True)
+        if result is None:
+            self.connection_status.setText("No flight computer found.")
+            return
+        port, baudrate = result
+        self.port_box.setCurrentText(port)
+        self.baud_box.setCurrentText(str(baudrate))
+        self.connection_status.setText(f"Found flight computer on {port} at {baudrate} baud.")
+
+# A loader decoding archived launches into their own cache
+def new_launch_loader(schema):
+    return LaunchLoader(LaunchCache(schema), lambda launch_id: get_archive().get(launch_id))
+
 class FlightDataApp(QMainWindow):
-    def __init__(self):
+    def __init__(self, port=None, combined=False):
         super().__init__()
         self.setWindowTitle("Flight Computer Data")
         self.setGeometry(100, 100, 800, 600)
 
+        # Channel schema is loaded once and shared by every screen
+        self.schema = load_channel_schema()
+        self.connection = load_connection_config()
+        if port:
+            # Serial device path/name from the command line, e.g. a pty from pty_standin.py
+            self.connection.port = port
+        # Stack every plot group in one widget with a shared time axis
+        self.combined = combined
+
         # Stacked widget to hold screens
         self.stacked_widget = QStackedWidget()
         self.setCentralWidget(self.stacked_widget)
 
         # Main menu screen
-        self.main_menu = MainMenu(self.switch_to_dashboard, self.switch_to_past_launches)
+        self.main_menu = MainMenu(self.switch_to_dashboard, self.switch_to_past_launches, self.connection, self.schema)
         self.stacked_widget.addWidget(self.main_menu)
 
         # Past launches screen
-        self.past_launches_screen = PastLaunchesScreen(self.switch_to_summary, self.switch_to_main_menu)
+        self.past_launches_screen = PastLaunchesScreen(self.switch_to_summary, self.switch_to_main_menu,
+                                                       self.switch_to_comparison)
         self.stacked_widget.addWidget(self.past_launches_screen)
 
-        # Dashboard screen (pass past_launches_screen reference)
-        self.dashboard = Dashboard(self.switch_to_summary, self.past_launches_screen)
-        self.stacked_widget.addWidget(self.dashboard)
+        # Decoded past launches, shared by prefetching and the summary screen
+        self.launch_loader = new_launch_loader(self.schema)
 
-        # Summary screen
-        self.summary_screen = SummaryScreen(self.switch_to_past_launches)
-        self.stacked_widget.addWidget(self.summary_screen)
+        # Dashboard and summary screens are built on first use
+        self.dashboard = None
+        self.summary_screen = None
 
         # Show the main menu by default
         self.stacked_widget.setCurrentWidget(self.main_menu)
 
+    def get_dashboard(self):
+        if self.dashboard is None:
+            # Pass past_launches_screen reference so saved launches show up in the list
+            self.dashboard = Dashboard(self.switch_to_summary, self.past_launches_screen, self.schema, self.connection,
+                                       self.combined)
+            self.stacked_widget.addWidget(self.dashboard)
+        return self.dashboard
+
+    def get_summary_screen(self):
+        if self.summary_screen is None:
+            self.summary_screen = SummaryScreen(self.switch_to_past_launches, self.schema, self.combined,
+                                                self.launch_loader)
+            self.stacked_widget.addWidget(self.summary_screen)
+        return self.summary_screen
+
     def switch_to_dashboard(self):
-        self.dashboard.start_serial_thread()
-        self.stacked_widget.setCurrentWidget(self.dashboard)
+        dashboard = self.get_dashboard()
+        dashboard.start_serial_thread()
+        self.stacked_widget.setCurrentWidget(dashboard)
 
     def switch_to_summary(self, launch_id=None):
+        summary_screen = self.get_summary_screen()
         if launch_id:
-            self.summary_screen.update_graphs_by_id(launch_id)
-        else:
-            self.summary_screen.update_graphs(self.dashboard.data_history, self.dashboard.time_history)
-        self.stacked_widget.setCurrentWidget(self.summary_screen)
+            summary_screen.update_graphs_by_id(launch_id, self.past_launches_screen.past_launches)
+        elif self.dashboard is not None:
+            summary_screen.update_graphs(self.dashboard.data_history, self.dashboard.time_history,
+                                         self.dashboard.event_detector.events)
+        self.stacked_widget.setCurrentWidget(summary_screen)
+
+    def switch_to_comparison(self, launch_ids, align="liftoff", deltas=False):
+        summary_screen = self.get_summary_screen()
+        summary_screen.compare_launches(launch_ids, self.past_launches_screen.past_launches, align, deltas)
+        self.stacked_widget.setCurrentWidget(summary_screen)
 
     def switch_to_past_launches(self):
         self.stacked_widget.setCurrentWidget(self.past_launches_screen)
+        # Decode the newest launches in the background while the user picks one
+        self.launch_loader.prefetch(prefetch_candidates(self.past_launches_screen.past_launches))
 
     def switch_to_main_menu(self):
         self.stacked_widget.setCurrentWidget(self.main_menu)
 
+    def closeEvent(self, event):
+        self.past_launches_screen.flush_renames()
+        if self.dashboard is not None:
+            self.dashboard.stop_serial_thread()
+        self.launch_loader.stop()
+        # Lets queued saves and renames finish before the process exits
+        close_archive()
+        super().closeEvent(event)
+
+LIVE_WINDOW_S = 15.0     # Seconds of history in the live view
+INGEST_INTERVAL_MS = 100  # How often parsed rows are folded into history, drawn or not
+PENDING_MAX_ROWS = 100000  # Parsed rows waiting for ingest; beyond this the oldest are dropped
+ZOOM_MAX_FRACTION = 0.5  # Raw samples are loaded only for views narrower than this share of the flight
+TITLE_INTERVAL_S = 0.5   # Plot titles are for reading, refreshing them faster only costs relayouts
+
 class Dashboard(QWidget):
-    def __init__(self, switch_to_summary, past_launches_screen):
+    def __init__(self, switch_to_summary, past_launches_screen, schema, connection=None, combined=False):
         super().__init__()
         self.layout = QVBoxLayout(self)
         self.switch_to_summary = switch_to_summary
         self.past_launches_screen = past_launches_screen  # Store reference to past_launches_screen
+        self.schema = schema
+
+        # Live link-quality overlay, with stats/profiling toggles next to it
+        status_layout = QHBoxLayout()
+        self.link_label = QLabel("Link: waiting for data", self)
+        self.link_label.setStyleSheet("font-size: 12px; font-family: monospace;")
+        status_layout.addWidget(self.link_label)
+        status_layout.addStretch()
+
+        self.stats_button = QPushButton("Stats", self)
+        self.stats_button.setCheckable(True)
+        self.stats_button.toggled.connect(self.toggle_stats)
+        status_layout.addWidget(self.stats_button)
+
+        self.latency_button = QPushButton("Latency", self)
+        self.latency_button.setCheckable(True)
+        self.latency_button.toggled.connect(self.toggle_latency)
+        status_layout.addWidget(self.latency_button)
+
+        # Fast render: raw rolling window drawn from preallocated buffers with streaming
+        # curve options, titles throttled. Off: the original 50-point spline smoothing.
+        self.fast_button = QPushButton("Fast Render", self)
+        self.fast_button.setCheckable(True)
+        self.fast_button.toggled.connect(self.set_fast_render)
+        status_layout.addWidget(self.fast_button)
+
+        self.profiler = FlightProfiler()
+        self.profile_button = QPushButton("Profile Flight", self)
+        self.profile_button.setCheckable(True)
+        self.profile_button.toggled.connect(self.toggle_profiling)
+        status_layout.addWidget(self.profile_button)
+        self.layout.addLayout(status_layout)
+
+        self.stats_panel = StatsPanel(self)
+        self.stats_panel.setVisible(False)
+        self.layout.addWidget(self.stats_panel)
+        self.stats_button.setChecked(instrumentation.enabled)
+
+        # Byte-to-pixel latency histogram, see LatencyTracker. Frames wait in
+        # unpainted_frames until Qt has actually painted the plots.
+        self.latency = LatencyTracker()
+        self.unpainted_frames = deque(maxlen=100)  # (stamps, frame start) per frame
+        self.paint_pending = False
+        self.latency_plot = pg.PlotWidget(title="Latency: ---")
+        self.latency_plot.setLabel("bottom", "log10 latency (ms)")
+        self.latency_plot.setLabel("left", "Samples")
+        self.latency_plot.setFixedHeight(160)
+        self.latency_bars = pg.BarGraphItem(x=[], height=[], width=0.09, brush="#7BAFD4")
+        self.latency_plot.addItem(self.latency_bars)
+        self.latency_plot.setVisible(False)
+        self.layout.addWidget(self.latency_plot)
+        self.latency_timer = QTimer(self)
+        self.latency_timer.setInterval(1000)
+        self.latency_timer.timeout.connect(self.update_latency_plot)
 
         # Create a horizontal layout for graphs
         self.graph_layout = QHBoxLayout()
         self.layout.addLayout(self.graph_layout)
 
-        # Create line graphs for each data field
-        self.graphs = {}
-        self.data_history = {"Velocity": [], "Altitude": [], "Temperature": [], "Pressure": []}
-        self.time_history = []
-
-        self.colors = {
-            "Velocity": "#7BAFD4",
-            "Altitude": "#990000",
-            "Temperature": "#0A843D",
-            "Pressure": "#AE9142"
-        }
-
-        for field in self.data_history:
-            plot_widget = pg.PlotWidget(title=f"{field}: ---", labels={'left': field, 'bottom': "Time (s)"})
-            plot_widget.setMinimumWidth(300)
-            plot_widget.setLabel("left", field)
-            plot_widget.setLabel("bottom", "Time", "s")
-            self.graph_layout.addWidget(plot_widget)
-            self.graphs[field] = (plot_widget.plot(pen=pg.mkPen(self.colors[field], width=2)), plot_widget)
+        # One row per parsed line across all channels, in each channel's compact storage dtype
+        self.history = RecordStore(schema)
+        self.data_history = self.history.series
+        self.time_history = self.history.time
+
+        # Create one line graph per plot group, with a curve per channel. Combined:
+        # all groups stacked in one MultiChannelPlot, which scales to many channels.
+        self.curves = [None] * len(schema)
+        self.group_widgets = {}
+        self.combined_plot = MultiChannelPlot(schema.groups, self) if combined else None
+        if self.combined_plot is not None:
+            self.graph_layout.addWidget(self.combined_plot)
+        for group, channels in schema.groups.items():
+            if self.combined_plot is not None:
+                plot_widget = self.combined_plot.plot_items[group]
+            else:
+                plot_widget = pg.PlotWidget(title=f"{group}: ---")
+                plot_widget.setMinimumWidth(300)
+                plot_widget.setLabel("left", group, channels[0].unit)
+                plot_widget.setLabel("bottom", "Time", "s")
+                self.graph_layout.addWidget(plot_widget)
+            for channel in channels:
+                self.curves[channel.index] = plot_widget.plot(pen=pg.mkPen(channel.color, width=2))
+            self.group_widgets[group] = (plot_widget, channels)
+        # Live window buffers, sized for LIVE_WINDOW_S at a few times the expected rate
+        # (a faster link just shows a shorter window)
+        live_samples = max(1000, int(LIVE_WINDOW_S * schema.expected_rate * 4))
+        # A paint of any plot view means the latest curves reached the screen
+        views = [self.combined_plot] if self.combined_plot is not None else \
+            [plot_widget for plot_widget, _ in self.group_widgets.values()]
+        for view in views:
+            view.viewport().installEventFilter(self)
+        self.plot_x = np.empty(live_samples)
+        self.plot_y = np.empty((len(schema), live_samples))
+        self.titles = {}
+        self.last_title_update = 0.0
+        self.fast_render = False
+        self.fast_button.setChecked(True)
 
         # Add summary button
         summary_button = QPushButton("VIEW SUMMARY", self)
@@ -127,49 +349,175 @@ class Dashboard(QWidget):
         summary_button.clicked.connect(lambda: [self.save_current_launch(), switch_to_summary()])
         self.layout.addWidget(summary_button)
 
-        # Initialize serial data
-        self.data = {}
+        # Initialize serial data, latest value per channel index
+        self.parser = AsciiParser(schema)
+        self.data = self.parser.new_row()
+        self.link_stats = LinkStats(schema.expected_rate)
+        # Computed channels (acceleration, filtered altitude, ...) are evaluated once
+        # per frame over every row that arrived since the last one
+        self.derived = DerivedChannelEngine(schema)
+        # Liftoff/burnout/apogee/landing, fed the same batches as the derived channels
+        self.event_detector = EventDetector(schema)
+        # What gets archived: full rate around the flight, thinned out on the pad
+        self.recorder = FlightRecorder(schema)
+        # (arrival, parsed, raw row) of samples not yet ingested, filled by the reader thread
+        self.pending_stamps = deque(maxlen=PENDING_MAX_ROWS)
+        self.pending_high_water = 0  # Most rows ever waiting at once
+        self.pending_dropped = 0  # Rows lost because ingest fell PENDING_MAX_ROWS behind
+        # (arrival, parsed) of ingested samples not yet drawn, for the latency histogram
+        self.undrawn_stamps = []
+        self.history_changed = False
+        # Port, baud rate, framing and reader backend, see connection_config.py
+        self.connection = connection or load_connection_config()
+        self.serial_hub = None
         self.serial_thread = None
         self.serial_running = threading.Event()
-        self.start_time = time.time()
+        self.clock = time.time  # Replaced by a simulated clock in the render harness
+        self.start_time = self.clock()
 
-        # Start a timer to update the GUI and graphs
+        # Timer to update the GUI and graphs, only running while the dashboard
+        # is visible and the serial thread is streaming
         self.timer = QTimer(self)
+        self.timer.setInterval(150)  # Update every 150ms
         self.timer.timeout.connect(self.update_gui)
-        self.timer.start(150)  # Update every 150ms
+        # Derived channels, events, recording and history keep up while streaming even
+        # when another screen is shown; frames only draw what ingest has stored
+        self.ingest_timer = QTimer(self)
+        self.ingest_timer.setInterval(INGEST_INTERVAL_MS)
+        self.ingest_timer.timeout.connect(self.update_ingest)
+
+    def set_fast_render(self, checked):
+        self.fast_render = checked
+        for channel in self.schema:
+            curve = self.curves[channel.index]
+            curve.setClipToView(checked)
+            curve.setDownsampling(auto=checked, method="peak")
+            # Software rasterizing wide lines costs several times more than 1 px ones
+            curve.setPen(pg.mkPen(channel.color, width=1 if checked else 2))
+        # The x range is set once per frame from the rolling window instead of autoranged
+        for plot_widget, _ in self.group_widgets.values():
+            plot_widget.enableAutoRange(x=not checked)
+
+    def toggle_stats(self, checked):
+        instrumentation.enabled = checked
+        self.stats_panel.setVisible(checked)
+
+    def toggle_latency(self, checked):
+        self.latency_plot.setVisible(checked)
+        if checked:
+            self.update_latency_plot()
+            self.latency_timer.start()
+        else:
+            self.latency_timer.stop()
+
+    def toggle_profiling(self, checked):
+        if checked:
+            self.profiler.start()
+        else:
+            path = self.profiler.stop()
+            if path:
+                print(f"Profile saved to {path}")
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_timer_state()
+        if self.latency_button.isChecked():
+            self.latency_timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_timer_state()
+        self.latency_timer.stop()
+
+    def is_streaming(self):
+        if self.serial_hub is not None and self.serial_hub.is_running():
+            return bool(self.serial_hub.sources)
+        return self.serial_thread is not None and self.serial_thread.is_alive()
+
+    def update_timer_state(self):
+        streaming = self.is_streaming()
+        if streaming and not self.ingest_timer.isActive():
+            self.ingest_timer.start()
+        elif not streaming and self.ingest_timer.isActive():
+            self.ingest_timer.stop()
+            self.ingest_pending()  # Rows that arrived just before the link stopped
+        if self.isVisible() and streaming:
+            if not self.timer.isActive():
+                self.timer.start()
+        elif self.timer.isActive():
+            self.timer.stop()
 
     def save_current_launch(self):
-        if not self.time_history:
+        series, time_series, segments, events = self.recorder.snapshot()
+        if not len(time_series):
             print("No data to save.")
             return
 
+        save_start = time.perf_counter()
+
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        past_launches = load_past_launches()
 
-        past_launches[timestamp] = {
+        # Archived times (and events) count from liftoff rather than from when the dashboard opened
+        launch = {
             "name": timestamp,
-            "data": [
-                f"Velocity:{v},Altitude:{a},Temperature:{t},Pressure:{p}"
-                for v, a, t, p in zip(
-                    self.data_history["Velocity"],
-                    self.data_history["Altitude"],
-                    self.data_history["Temperature"],
-                    self.data_history["Pressure"]
-                )
-            ]
+            "segments": segments,
+            "events": events,
+            "link_stats": self.link_quality(),
+            "latency": self.latency.as_dict()
         }
 
-        save_past_launches(past_launches)
+        # Sample files and the catalog entry are written on the archive's writer thread;
+        # the snapshot is a copy, so recording can carry on meanwhile
+        get_archive().save_launch_async(timestamp, launch, series, time_series,
+                                        lambda saved: self.on_launch_saved(timestamp, saved, save_start),
+                                        lambda error: self.on_launch_save_failed(timestamp, error))
+
+    def on_launch_saved(self, timestamp, launch, save_start):
+        instrumentation.record("save", time.perf_counter() - save_start)
         print(f"Launch data saved as {timestamp}")
+        self.past_launches_screen.add_new_launch(timestamp, launch)
 
-        # Use the reference to update past_launches_screen
-        self.past_launches_screen.add_new_launch(timestamp, past_launches[timestamp])
+    def on_launch_save_failed(self, timestamp, error):
+        print(f"Launch data {timestamp} was not saved: {error}")
+        self.past_launches_screen.on_save_failed(timestamp, error)
 
     def start_serial_thread(self):
-        if self.serial_thread is None or not self.serial_thread.is_alive():
+        if self.connection.backend == "asyncio" and AsyncioSerialHub.is_supported():
+            self.start_serial_hub()
+        elif self.serial_thread is None or not self.serial_thread.is_alive():
             self.serial_running.set()
             self.serial_thread = threading.Thread(target=self.read_serial_data, daemon=True)
             self.serial_thread.start()
+        self.update_timer_state()
+
+    def start_serial_hub(self):
+        config = self.connection
+        if self.serial_hub is None:
+            self.serial_hub = AsyncioSerialHub(clock=self.clock, read_chunk_size=config.read_chunk_size)
+        try:
+            serial_kwargs = config.serial_kwargs()
+        except ValueError as e:
+            self.on_serial_error(config.port, e)
+            return
+        self.serial_hub.start()
+        source = self.link_stats.source(config.port)
+        future = self.serial_hub.add_source(
+            config.port, lambda raw, arrival_time: self.handle_serial_line(raw, source, arrival_time),
+            self.on_serial_error, config.delimiter(), **serial_kwargs
+        )
+        try:
+            future.result(timeout=2.0)
+        except Exception as e:
+            print(f"Error opening serial port: {e}")
+
+    def on_serial_error(self, port, error):
+        print(f"Serial port {port} stopped: {error}")
+
+    def stop_serial_thread(self):
+        self.serial_running.clear()
+        if self.serial_hub is not None:
+            self.serial_hub.stop()
+        self.update_timer_state()
 
     '''
     def read_serial_data(self):
@@ -188,16 +536,33 @@ class Dashboard(QWidget):
                 self.process_serial_data(line)
     '''
     def read_serial_data(self):
+        config = self.connection
         try:
-            ser = serial.Serial(port='COM4', baudrate=9600, timeout=1)
-        except serial.SerialException as e:
+            ser = serial.Serial(port=config.port, timeout=1, **config.serial_kwargs())
+        except (serial.SerialException, ValueError) as e:
             print(f"Error opening serial port: {e}")
+            self.serial_running.clear()
             return
+        if hasattr(ser, "set_buffer_size"):
+            # Driver-side buffers can only be resized on Windows
+            ser.set_buffer_size(rx_size=config.rx_buffer_size, tx_size=config.tx_buffer_size)
 
+        source = self.link_stats.source(config.port)
+        framer = LineFramer(config.delimiter())
+        # Read whatever is buffered in one call instead of a readline() per line
         while self.serial_running.is_set():
-            line = ser.readline().decode('utf-8').strip()
-            if line:
-                self.process_serial_data(line)
+            data = ser.read(min(max(ser.in_waiting, 1), config.read_chunk_size))
+            if not data:
+                continue
+            arrival_time = self.clock()
+            if instrumentation.enabled:
+                instrumentation.gauge("serial_in_waiting", ser.in_waiting)
+            for raw in framer.feed(data):
+                self.handle_serial_line(raw, source, arrival_time)
+            if framer.overflows:
+                source.serial_errors += framer.overflows
+                framer.overflows = 0
+        ser.close()
         '''
         print(f"Reading from port at baud. Press Ctrl+C to stop.")
         try:
@@ -215,14 +580,39 @@ class Dashboard(QWidget):
         finally:
             ser.close()
         '''
-    def process_serial_data(self, data):
+    # Raw line from either serial backend, called on the reader's thread
+    def handle_serial_line(self, raw, source, arrival_time):
+        self.profiler.sync()
+        instrumentation.count("ingest_lines")
         try:
-            fields = data.split(',')
-            for field in fields:
-                key, value = field.split(':')
-                self.data[key] = float(value)  # Store values as floats for graphing
-        except ValueError:
-            print(f"Invalid data format: {data}")
+            line = raw.decode('utf-8').strip()
+        except UnicodeDecodeError:
+            source.serial_errors += 1
+            return
+        if line:
+            self.process_serial_data(line, source, arrival_time)
+
+    def process_serial_data(self, data, source=None, arrival_time=None):
+        # Bad fields are skipped and counted in self.parser rather than dropping the line
+        with instrumentation.stage("parse"):
+            parsed = self.parser.parse_into(data, self.data)
+        if parsed:
+            parsed_time = self.clock()
+            if len(self.pending_stamps) == PENDING_MAX_ROWS:
+                # The deque drops the oldest row on append; count it rather than lose it silently
+                if not self.pending_dropped:
+                    print(f"Ingest is {PENDING_MAX_ROWS} rows behind, dropping the oldest rows")
+                self.pending_dropped += 1
+            self.pending_stamps.append((parsed_time if arrival_time is None else arrival_time, parsed_time,
+                                        self.data[:len(self.schema)]))
+            self.pending_high_water = max(self.pending_high_water, len(self.pending_stamps))
+        if parsed and source is not None:
+            sequence = float("nan") if self.parser.sequence_slot is None else self.data[self.parser.sequence_slot]
+            source.observe(sequence, arrival_time)
+        return parsed
+
+    def link_quality(self):
+        return self.link_stats.summary(self.parser.counters())
 
     def interpolate_data(self, x, y, num_points=50):
         if len(x) < 2 or len(y) < 2:
@@ -241,84 +631,385 @@ class Dashboard(QWidget):
             return x, y
 
     def update_gui(self):
-        current_time = time.time() - self.start_time  # Calculate elapsed time
+        if not self.is_streaming():
+            # Serial thread stopped (e.g. port failed to open), stop redrawing
+            self.update_timer_state()
+            return
+        self.render_frame()
 
-        for key, (plot, plot_widget) in self.graphs.items():
-            if key in self.data:
-                self.data_history[key].append(self.data[key])
-                self.time_history.append(current_time)
+    def update_ingest(self):
+        if not self.is_streaming():
+            # The link died, possibly while another screen is shown and no frame
+            # notices; stop ingesting (after the last rows) and drawing
+            self.update_timer_state()
+            return
+        self.ingest_pending()
+
+    # Fold every parsed row into derived channels, events, the recorder and history.
+    # Runs on its own timer so none of it depends on the dashboard being on screen.
+    def ingest_pending(self):
+        # Backlog as the ingest finds it, on every tick and frame whichever backend is reading
+        instrumentation.gauge("pending_rows", len(self.pending_stamps))
+        instrumentation.gauge("pending_high_water", self.pending_high_water)
+        instrumentation.gauge("pending_dropped", self.pending_dropped)
+        stamps = []
+        while self.pending_stamps:
+            stamps.append(self.pending_stamps.popleft())
+        if not stamps:
+            return
 
-                if len(self.data_history[key]) > len(self.time_history):
-                    self.data_history[key] = self.data_history[key][-len(self.time_history):]
-                elif len(self.time_history) > len(self.data_history[key]):
-                    self.time_history = self.time_history[-len(self.data_history[key]):]
+        with instrumentation.stage("derive"):
+            # Samples are timed by when their bytes arrived, not when they are drawn
+            times = np.fromiter((stamp[0] for stamp in stamps), np.float64, len(stamps)) - self.start_time
+            rows = np.array([stamp[2] for stamp in stamps], dtype=np.float64)
+            latest = self.derived.process(times, rows)[-1]
+            for channel in self.schema.derived_channels:
+                self.data[channel.index] = latest[channel.index]
+        with instrumentation.stage("events"):
+            events = self.event_detector.process(times, rows)
+            for event in events:
+                print(f"{event['event'].capitalize()} at {event['time']:.2f} s")
+                for plot_widget, _ in self.group_widgets.values():
+                    add_event_marker(plot_widget, event)
+        with instrumentation.stage("record"):
+            self.recorder.add(times, rows, events)
+
+        with instrumentation.stage("store"):
+            self.history.append_rows(times, rows)
+        instrumentation.count("samples_stored", len(times))
+        self.history_changed = True
+        # Latency is measured to the frame that draws a sample; none is drawn while
+        # another screen is shown (isHidden: explicitly hidden, e.g. by the QStackedWidget)
+        if not self.isHidden():
+            self.undrawn_stamps += [stamp[:2] for stamp in stamps]
+
+    # One dashboard frame: ingest whatever is pending, then redraw the live window
+    def render_frame(self):
+        frame_start = time.perf_counter()
+        self.link_label.setText(format_link_summary(self.link_quality()))
+        frame_clock = self.clock()
+        self.ingest_pending()
+        if not self.history_changed:
+            return  # Nothing new arrived since the last frame
+        self.history_changed = False
+        stamps, self.undrawn_stamps = self.undrawn_stamps, []
+
+        x = self.time_history.tail_into(self.plot_x)
+        start = int(np.searchsorted(x, x[-1] - LIVE_WINDOW_S))
+        x = x[start:]
+
+        for channel in self.schema:
+            y = self.data_history[channel.index].tail_into(self.plot_y[channel.index])[start:]
+            if self.fast_render:
+                with instrumentation.stage("render"):
+                    # pyqtgraph's finite check is only needed before a channel's first value
+                    self.curves[channel.index].setData(x, y, skipFiniteCheck=not np.isnan(y).any())
+            else:
+                finite = np.isfinite(y)
+                with instrumentation.stage("interpolate"):
+                    smooth_time, smooth_data = self.interpolate_data(x[finite], y[finite], num_points=50)
+                with instrumentation.stage("render"):
+                    self.curves[channel.index].setData(smooth_time, smooth_data)
+
+        if self.fast_render and len(x) > 1:
+            if self.combined_plot is not None:
+                self.combined_plot.set_x_range(x[0], x[-1])
+            else:
+                for plot_widget, _ in self.group_widgets.values():
+                    plot_widget.setXRange(x[0], x[-1], padding=0)
+
+        now = time.perf_counter()
+        if not self.fast_render or now - self.last_title_update >= TITLE_INTERVAL_S:
+            self.last_title_update = now
+            with instrumentation.stage("titles"):
+                self.update_titles()
+
+        # Curves are updated here; Qt paints them when control returns to the event loop,
+        # and the frame is stamped as drawn after that paint (see eventFilter)
+        if stamps:
+            self.unpainted_frames.append((stamps, frame_clock))
+        instrumentation.record("frame", time.perf_counter() - frame_start)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self.unpainted_frames and not self.paint_pending:
+            # The filter sees the paint before it happens; a zero-delay timer runs once
+            # the whole window has been painted
+            self.paint_pending = True
+            QTimer.singleShot(0, self.on_frame_painted)
+        return False
+
+    def on_frame_painted(self):
+        self.paint_pending = False
+        drawn = self.clock()
+        while self.unpainted_frames:
+            stamps, frame_clock = self.unpainted_frames.popleft()
+            self.latency.add_frame(stamps, frame_clock, drawn)
+
+    def update_titles(self):
+        for group, (plot_widget, channels) in self.group_widgets.items():
+            values = [(channel, self.data[channel.index]) for channel in channels]
+            if all(value != value for _, value in values):
+                continue
+            title = " | ".join(f"{channel.name}: {value:.2f}" for channel, value in values)
+            # setTitle relayouts the plot, skip it when the text has not changed
+            if title != self.titles.get(group):
+                self.titles[group] = title
+                plot_widget.setTitle(title, color=channels[0].color)
+
+    def update_latency_plot(self):
+        total = self.latency.histograms["total"]
+        counts = total.counts[1:-1]
+        self.latency_bars.setOpts(x=np.log10(total.edges[:-1]) + 0.05, height=counts)
+        self.latency_plot.setTitle(
+            f"Latency p50 {total.percentile(50):.1f} ms | p99 {total.percentile(99):.1f} ms | "
+            f"queue p50 {self.latency.histograms['queue'].percentile(50):.1f} ms"
+        )
 
-                rolling_data = self.data_history[key][-100:]
-                rolling_time = self.time_history[-100:]
+# Vertical line with the event name at the time a flight event happened
+def add_event_marker(plot_widget, event):
+    color = EVENT_COLORS.get(event["event"], "#FFFFFF")
+    plot_widget.addItem(pg.InfiniteLine(pos=event["time"], angle=90, pen=pg.mkPen(color, style=Qt.DashLine),
+                                        label=event["event"], labelOpts={"color": color, "position": 0.9}))
+
+# Live per-stage latency/throughput table, refreshed once a second while visible
+class StatsPanel(QLabel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet("font-size: 11px; font-family: monospace;")
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.refresh)
 
-                smooth_time, smooth_data = self.interpolate_data(rolling_time, rolling_data, num_points=50)
-                plot.setData(smooth_time, smooth_data)
-                plot_widget.setTitle(f"{key}: {self.data[key]:.2f}", color=self.colors[key])
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
+
+    def refresh(self):
+        self.setText(format_snapshot(instrumentation.snapshot()))
 
 class SummaryScreen(QWidget):
-    def __init__(self, switch_to_past_launches):
+    def __init__(self, switch_to_past_launches, schema, combined=False, loader=None):
         super().__init__()
         self.layout = QGridLayout(self)
+        self.schema = schema
+        # Past launches are decoded on a worker thread, see launch_loader.py
+        self.loader = loader or new_launch_loader(schema)
+        self.loader.loaded.connect(self.on_launch_loaded)
+        self.loader.failed.connect(self.on_launch_failed)
+        self.loader.range_loaded.connect(self.on_range_loaded)
+        self.current_launch_id = None
+        self.current_launch = None
+        self.comparison = None  # {"ids", "align", "deltas", "summaries"} while comparing
+
+        # Zooming into a past launch swaps the decimated overview for full-resolution
+        # samples of the visible range, read through the launch's time index
+        self.summary_curves = {}  # channel name -> (curve, overview x, overview y)
+        self.zoom_requests = {}   # group -> latest request number
+        self.pending_zoom = {}    # group -> (start, stop) waiting for the debounce
+        self.zoomed = {}          # group -> (start, stop) of the last range requested
+        self.zoom_timer = QTimer(self)
+        self.zoom_timer.setSingleShot(True)
+        self.zoom_timer.setInterval(250)
+        self.zoom_timer.timeout.connect(self.load_zoomed_ranges)
+
+        self.status_label = QLabel("", self)
+        self.status_label.setStyleSheet("font-size: 14px;")
+        self.layout.addWidget(self.status_label, 0, 0, 1, 2)
 
         self.graphs = {}
-        fields = ["Velocity", "Altitude", "Temperature", "Pressure"]
-        for i, field in enumerate(fields):
-            plot_widget = pg.PlotWidget(title=field)
-            plot_widget.setLabel("left", field)
-            plot_widget.setLabel("bottom", "Time (s)")
-            self.layout.addWidget(plot_widget, i // 2, i % 2)
-            self.graphs[field] = plot_widget
+        if combined:
+            combined_plot = MultiChannelPlot(schema.groups, self)
+            self.layout.addWidget(combined_plot, 1, 0, 1, 2)
+            rows = 2
+            for group, channels in schema.groups.items():
+                self.graphs[group] = (combined_plot.plot_items[group], channels)
+        else:
+            for i, (group, channels) in enumerate(schema.groups.items()):
+                plot_widget = pg.PlotWidget(title=group)
+                plot_widget.setLabel("left", group, channels[0].unit)
+                plot_widget.setLabel("bottom", "Time (s)")
+                self.layout.addWidget(plot_widget, 1 + i // 2, i % 2)
+                self.graphs[group] = (plot_widget, channels)
+            rows = 1 + (len(self.graphs) + 1) // 2
+        for group, (plot_widget, _) in self.graphs.items():
+            plot_widget.getViewBox().sigXRangeChanged.connect(
+                lambda _, x_range, group=group: self.on_x_range_changed(group, x_range))
 
         back_button = QPushButton("Return to Past Launches", self)
         back_button.setStyleSheet("font-size: 18px; padding: 10px;")
         back_button.clicked.connect(switch_to_past_launches)
-        self.layout.addWidget(back_button, 2, 0, 1, 2)
-
-    def update_graphs(self, data_history, time_history):
-        for key, plot_widget in self.graphs.items():
-            if key in data_history:
-                x = np.array(time_history)
-                y = np.array(data_history[key])
-                unique_x, unique_indices = np.unique(x, return_index=True)
-                unique_y = y[unique_indices]
-
-                if len(unique_x) > 2:
-                    try:
-                        spline = make_interp_spline(unique_x, unique_y, k=1)
-                        smooth_x = np.linspace(unique_x[0], unique_x[-1], 500)
-                        smooth_y = spline(smooth_x)
-                    except Exception:
-                        smooth_x, smooth_y = unique_x, unique_y
-                else:
-                    smooth_x, smooth_y = unique_x, unique_y
-
-                plot_widget.plot(smooth_x, smooth_y, pen=pg.mkPen(width=2), clear=True)
-
-    def update_graphs_by_id(self, launch_id):
-        past_launches = load_past_launches()
+        self.layout.addWidget(back_button, rows, 0, 1, 2)
+
+    def update_graphs(self, data_history, time_history, events=()):
+        self.current_launch_id = None
+        self.comparison = None
+        self.summary_curves = {}
+        self.status_label.setText("")
+        x = time_history.to_float64()
+        for plot_widget, channels in self.graphs.values():
+            plot_widget.clear()
+            for channel in channels:
+                # Rows are time-ordered and aligned with the time column, so they plot as stored;
+                # pyqtgraph thins them to the pixels on screen
+                plot_widget.plot(x, data_history[channel.index].to_float64(), pen=pg.mkPen(channel.color, width=2),
+                                 connect="finite", autoDownsample=True, downsampleMethod="peak")
+            for event in events:
+                add_event_marker(plot_widget, event)
+
+    # Shows the launch once the loader has it; cached launches come back almost at once
+    def update_graphs_by_id(self, launch_id, past_launches=None):
+        if past_launches is None:
+            past_launches = load_past_launches()
         if launch_id not in past_launches:
             print(f"Launch ID {launch_id} not found.")
             return
 
-        launch_data = past_launches[launch_id]["data"]
-        time_history = list(range(len(launch_data)))
-        field_data = {"Velocity": [], "Altitude": [], "Temperature": [], "Pressure": []}
-
-        for line in launch_data:
-            parts = dict(pair.split(":") for pair in line.split(","))
-            for field in field_data:
-                field_data[field].append(float(parts[field]))
-
-        for field, plot_widget in self.graphs.items():
-            plot_widget.plot(time_history, field_data[field], pen=pg.mkPen(width=2), clear=True)
+        self.current_launch_id = launch_id
+        self.current_launch = past_launches[launch_id]
+        self.comparison = None
+        self.summary_curves = {}
+        self.status_label.setText(f"Loading {past_launches[launch_id].get('name', launch_id)}...")
+        self.loader.request(launch_id, past_launches[launch_id])
+        # Neighbours in the list are the likely next clicks
+        self.loader.prefetch(prefetch_candidates(past_launches, launch_id))
+
+    # Overlay several launches once all of them are loaded
+    def compare_launches(self, launch_ids, past_launches, align="liftoff", deltas=False):
+        self.current_launch_id = None
+        self.summary_curves = {}
+        self.comparison = {"ids": list(launch_ids), "align": align, "deltas": deltas, "summaries": {},
+                           "reference": launch_ids[0], "failed": []}
+        self.status_label.setText(f"Loading {len(launch_ids)} launches...")
+        for launch_id in launch_ids:
+            self.loader.request(launch_id, past_launches[launch_id])
+
+    def on_launch_loaded(self, launch_id, summary):
+        if self.comparison is not None and launch_id in self.comparison["ids"]:
+            self.comparison["summaries"][launch_id] = summary
+            if len(self.comparison["summaries"]) == len(self.comparison["ids"]):
+                self.show_comparison()
+            return
+        if launch_id != self.current_launch_id:
+            return  # The user moved on before this one finished
+        self.status_label.setText("")
+        self.show_summary(summary)
+
+    def on_launch_failed(self, launch_id, error):
+        if self.comparison is not None and launch_id in self.comparison["ids"]:
+            # Compare whatever did load
+            self.comparison["ids"].remove(launch_id)
+            self.comparison["failed"].append(launch_id)
+            if len(self.comparison["ids"]) == len(self.comparison["summaries"]):
+                self.show_comparison()
+        elif launch_id == self.current_launch_id:
+            self.status_label.setText(f"Could not load {launch_id}: {error}")
+
+    def show_comparison(self):
+        comparison = self.comparison
+        summaries = [comparison["summaries"][launch_id] for launch_id in comparison["ids"]]
+        if not summaries:
+            self.status_label.setText(f"Could not load any of the launches to compare: {', '.join(comparison['failed'])}")
+            return
+        colors = {summary.launch_id: pg.intColor(i, max(len(summaries), 2)) for i, summary in enumerate(summaries)}
+        align = comparison["align"]
+
+        for plot_widget, channels in self.graphs.values():
+            plot_widget.clear()
+            for i, channel in enumerate(channels):
+                # Launches are told apart by colour, channels sharing a plot by line style.
+                # Thin pens: with K launches overlaid, wide-line rasterizing dominates.
+                style = Qt.SolidLine if i == 0 else Qt.DashLine
+                if comparison["deltas"]:
+                    x, deltas = delta_curves(summaries, channel.name, align)
+                    for launch_id, delta in deltas.items():
+                        plot_widget.plot(x, delta, pen=pg.mkPen(colors[launch_id], width=1, style=style),
+                                         connect="finite")
+                else:
+                    for launch_id, x, y in overlay_data(summaries, channel.name, align):
+                        plot_widget.plot(x, y, pen=pg.mkPen(colors[launch_id], width=1, style=style),
+                                         connect="finite")
+            if align != "none":
+                add_event_marker(plot_widget, {"event": align, "time": 0.0})
+
+        legend = " ".join(f'<span style="color: {colors[summary.launch_id].name()}">{summary.launch_id}</span>'
+                          for summary in summaries)
+        mode = f"difference to {summaries[0].launch_id}" if comparison["deltas"] else "overlay"
+        if comparison["deltas"] and summaries[0].launch_id != comparison["reference"]:
+            mode += f" instead of {comparison['reference']}"
+        failed = f" (could not load {', '.join(comparison['failed'])})" if comparison["failed"] else ""
+        self.status_label.setText(f"Comparing ({mode}, aligned on {align}): {legend}{failed}")
+
+    def show_summary(self, summary):
+        self.summary_curves = {}
+        self.pending_zoom = {}
+        self.zoomed = {}
+        for plot_widget, channels in self.graphs.values():
+            plot_widget.clear()
+            for channel in channels:
+                if channel.name in summary.channels:
+                    x, y = summary.plot_data(channel.name)
+                    curve = plot_widget.plot(x, y, pen=pg.mkPen(channel.color, width=2), connect="finite")
+                    self.summary_curves[channel.name] = (curve, x, y)
+            for event in summary.events:
+                add_event_marker(plot_widget, event)
+
+    # Only user zooms load raw samples: autoranging (e.g. when a launch is first shown)
+    # and views covering most of the flight are served by the overview
+    def on_x_range_changed(self, group, x_range):
+        if not self.summary_curves or self.current_launch_id is None:
+            return
+        plot_widget, channels = self.graphs[group]
+        if plot_widget.getViewBox().autoRangeEnabled()[0]:
+            return
+        overviews = [self.summary_curves[channel.name][1] for channel in channels if channel.name in self.summary_curves]
+        if not overviews:
+            return
+        start, stop = x_range
+        span = max(x[-1] for x in overviews) - min(x[0] for x in overviews)
+        if stop - start > ZOOM_MAX_FRACTION * span or self.zoomed.get(group) == (start, stop):
+            return
+        self.pending_zoom[group] = (start, stop)
+        self.zoom_timer.start()
+
+    def load_zoomed_ranges(self):
+        for group, (start, stop) in self.pending_zoom.items():
+            names = [channel.name for channel in self.graphs[group][1] if channel.name in self.summary_curves]
+            request = self.zoom_requests.get(group, 0) + 1
+            self.zoom_requests[group] = request
+            self.zoomed[group] = (start, stop)
+            self.loader.request_range(self.current_launch_id, self.current_launch, names, start, stop,
+                                      (group, request))
+        self.pending_zoom = {}
+
+    def on_range_loaded(self, launch_id, result):
+        (group, request), data = result[0], result[1:]
+        if launch_id != self.current_launch_id or request != self.zoom_requests.get(group):
+            return  # Stale: another launch is shown or the view moved again
+        channels = [channel for channel in self.graphs[group][1] if channel.name in self.summary_curves]
+        for channel in channels:
+            curve, x, y = self.summary_curves[channel.name]
+            if data[0] is None:
+                # Range too wide for raw samples, the overview has enough detail
+                curve.setData(x, y, connect="finite")
+            elif channel.name in data[3]:
+                # Overview either side keeps the full flight in the data bounds, so autorange still zooms out
+                start, stop, time_range, values = data
+                left, right = x < start, x > stop
+                curve.setData(np.concatenate((x[left], time_range, x[right])),
+                              np.concatenate((y[left], values[channel.name], y[right])), connect="finite")
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = FlightDataApp()
+    arg_parser = argparse.ArgumentParser(description="Flight computer telemetry dashboard")
+    arg_parser.add_argument("--port", help="Serial port or device path (default COM4)")
+    arg_parser.add_argument("--combined", action="store_true",
+                            help="Show all plot groups stacked on one shared time axis")
+    args, qt_args = arg_parser.parse_known_args()
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = FlightDataApp(port=args.port, combined=args.combined)
     window.show()
     sys.exit(app.exec_())
@@ -0,0 +1,139 @@
+import numpy as np
+
+# Streaming filters for derived channels. Each filter keeps only the state it needs
+# from previous batches (a short tail or a filter state), so a tick costs
+# O(new samples) no matter how long the flight has been running.
+
+# Finite difference over `lag` samples: (v[i] - v[i-lag]) / (t[i] - t[i-lag])
+class DerivativeFilter:
+    def __init__(self, lag=1):
+        self.lag = max(1, int(lag))
+        self.tail_t = np.full(self.lag, np.nan)
+        self.tail_v = np.full(self.lag, np.nan)
+
+    def update(self, times, values):
+        t = np.concatenate((self.tail_t, times))
+        v = np.concatenate((self.tail_v, values))
+        dt = t[self.lag:] - t[:-self.lag]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = np.where(dt > 0, (v[self.lag:] - v[:-self.lag]) / dt, np.nan)
+        self.tail_t = t[-self.lag:]
+        self.tail_v = v[-self.lag:]
+        return out
+
+# Trailing mean over `window` samples, ignoring NaNs
+class MovingAverageFilter:
+    def __init__(self, window=10):
+        self.window = max(1, int(window))
+        self.tail = np.full(self.window - 1, np.nan)
+
+    def update(self, times, values):
+        v = np.concatenate((self.tail, values))
+        finite = np.isfinite(v)
+        sums = np.concatenate(([0.0], np.cumsum(np.where(finite, v, 0.0))))
+        counts = np.concatenate(([0], np.cumsum(finite)))
+        w = self.window
+        window_sums = sums[w:] - sums[:-w]
+        window_counts = counts[w:] - counts[:-w]
+        with np.errstate(invalid="ignore"):
+            out = np.where(window_counts > 0, window_sums / np.maximum(window_counts, 1), np.nan)
+        if w > 1:
+            self.tail = v[-(w - 1):]
+        return out
+
+# Barometric altitude (m) from pressure (hPa), international standard atmosphere
+class PressureAltitudeFilter:
+    def __init__(self, p0=1013.25):
+        self.p0 = float(p0)
+
+    def update(self, times, values):
+        with np.errstate(invalid="ignore"):
+            return 44330.0 * (1.0 - (values / self.p0) ** (1.0 / 5.255))
+
+# Constant-velocity Kalman filter on a noisy altitude. The recursion is inherently
+# sequential, so it loops over the batch; per-sample cost is a handful of flops.
+class KalmanAltitudeFilter:
+    def __init__(self, process_noise=5.0, measurement_noise=1.0, output="altitude"):
+        self.q = float(process_noise)
+        self.r = float(measurement_noise)
+        self.output = 0 if output == "altitude" else 1
+        self.x = None  # [altitude, vertical speed]
+        self.p = None
+        self.last_t = None
+
+    def update(self, times, values):
+        out = np.empty(len(values))
+        q, r = self.q, self.r
+        for i, (t, z) in enumerate(zip(times.tolist(), values.tolist())):
+            if self.x is None:
+                if z == z:
+                    self.x = [z, 0.0]
+                    self.p = [[r, 0.0], [0.0, 100.0]]
+                    self.last_t = t
+                out[i] = z if self.output == 0 else np.nan
+                continue
+
+            dt = max(t - self.last_t, 0.0)
+            self.last_t = t
+            x0, x1 = self.x[0] + dt * self.x[1], self.x[1]
+            (p00, p01), (p10, p11) = self.p
+            p00 = p00 + dt * (p10 + p01) + dt * dt * p11 + q * dt ** 4 / 4
+            p01 = p01 + dt * p11 + q * dt ** 3 / 2
+            p10 = p10 + dt * p11 + q * dt ** 3 / 2
+            p11 = p11 + q * dt * dt
+
+            if z == z:
+                s = p00 + r
+                k0, k1 = p00 / s, p10 / s
+                y = z - x0
+                x0, x1 = x0 + k0 * y, x1 + k1 * y
+                p00, p01, p10, p11 = (1 - k0) * p00, (1 - k0) * p01, p10 - k1 * p00, p11 - k1 * p01
+
+            self.x = [x0, x1]
+            self.p = [[p00, p01], [p10, p11]]
+            out[i] = self.x[self.output]
+        return out
+
+FILTERS = {
+    "derivative": lambda spec: DerivativeFilter(spec.get("lag", 1)),
+    "moving_average": lambda spec: MovingAverageFilter(spec.get("window", 10)),
+    "pressure_altitude": lambda spec: PressureAltitudeFilter(spec.get("p0", 1013.25)),
+    "kalman": lambda spec: KalmanAltitudeFilter(spec.get("process_noise", 5.0), spec.get("measurement_noise", 1.0),
+                                                spec.get("output", "altitude")),
+}
+
+# Evaluates the schema's derived channels over each batch of new rows, in
+# declaration order so a derived channel can feed another (e.g. vertical speed
+# from pressure altitude)
+class DerivedChannelEngine:
+    def __init__(self, schema):
+        self.steps = []
+        for channel in schema.derived_channels:
+            spec = channel.derived
+            if spec.get("kind") not in FILTERS or spec.get("source") not in schema.index:
+                print(f"Skipping derived channel {channel.name}: unknown kind or source")
+                continue
+            self.steps.append((channel.index, schema.index[spec["source"]], FILTERS[spec["kind"]](spec)))
+
+    # times: (n,), rows: (n, width) float64; derived columns are filled in place
+    def process(self, times, rows):
+        for index, source_index, derived_filter in self.steps:
+            rows[:, index] = derived_filter.update(times, rows[:, source_index])
+        return rows
+
+# Fill in derived channels for a whole recorded flight (e.g. an archive that
+# predates them, or stored them empty), given {name: values} and a time axis
+def derive_offline(schema, times, channels):
+    missing = [channel for channel in schema.derived_channels
+               if channel.name not in channels or not np.isfinite(channels[channel.name]).any()]
+    if not missing or len(times) == 0:
+        return channels
+    rows = np.full((len(times), len(schema)), np.nan)
+    for name, values in channels.items():
+        if name in schema.index:
+            rows[:, schema.index[name]] = values[:len(times)]
+    DerivedChannelEngine(schema).process(np.asarray(times, dtype=np.float64), rows)
+    channels = dict(channels)
+    for channel in missing:
+        channels[channel.name] = rows[:, channel.index]
+    return channels
@@ -0,0 +1,145 @@
+import numpy as np
+from derived_channels import DerivativeFilter
+
+# Flight phases in order; each event moves the detector to the next one
+PHASES = ["pad", "powered", "coast", "descent", "landed"]
+EVENTS = ["liftoff", "burnout", "apogee", "landing"]
+EVENT_COLORS = {"liftoff": "#2ECC71", "burnout": "#E67E22", "apogee": "#3498DB", "landing": "#9B59B6"}
+
+# Thresholds, each must hold for HOLD_S before the event fires (hysteresis against noise)
+LIFTOFF_VELOCITY = 10.0     # m/s
+LIFTOFF_ALTITUDE = 15.0     # m above the pad
+BURNOUT_ACCEL = 0.0         # m/s^2, thrust gone once vertical acceleration turns negative
+APOGEE_DROP = 5.0           # m below the highest altitude seen
+LANDING_SPEED = 2.0         # m/s
+LANDING_ALTITUDE = 30.0     # m above the pad
+LANDING_HOLD_S = 2.0
+HOLD_S = 0.3
+ACCEL_LAG = 5               # Samples spanned by the velocity derivative
+
+# A condition that has to hold for `hold_s` of consecutive samples; the run carries across batches
+class _Sustained:
+    def __init__(self, hold_s):
+        self.hold_s = hold_s
+        self.run_start = None
+
+    def reset(self):
+        self.run_start = None
+
+    # (index of the first sample at which cond has held for hold_s, start time of
+    # that run), or (None, None)
+    def first(self, times, cond):
+        if not len(cond):
+            return None, None
+        # Start time of the run each sample belongs to
+        breaks = np.flatnonzero(~cond)
+        run_ids = np.searchsorted(breaks, np.arange(len(cond)))
+        first_of_run = np.concatenate(([0], breaks + 1))[run_ids]
+        starts = times[np.minimum(first_of_run, len(times) - 1)]
+        if self.run_start is not None:
+            starts = np.where(run_ids == 0, self.run_start, starts)
+        held = cond & (times - starts >= self.hold_s)
+        hits = np.flatnonzero(held)
+        if len(hits):
+            self.run_start = None
+            return int(hits[0]), float(starts[hits[0]])
+        # Remember an unfinished run at the end of the batch
+        self.run_start = starts[-1] if cond[-1] else None
+        return None, None
+
+# Incremental liftoff/burnout/apogee/landing detector. process() takes the
+# samples of one batch and returns the events they trigger as
+# {"event", "time", "altitude", "velocity"}. Work per batch is a few vectorized
+# passes over the new samples only, so it runs live every frame and offline over
+# a whole archived flight with the same results.
+class EventDetector:
+    def __init__(self, schema, altitude_channel=None, velocity_channel="Velocity"):
+        if altitude_channel is None:
+            altitude_channel = "FilteredAltitude" if "FilteredAltitude" in schema.index else "Altitude"
+        self.altitude_index = schema.index.get(altitude_channel)
+        self.velocity_index = schema.index.get(velocity_channel)
+        self.accel = DerivativeFilter(ACCEL_LAG)
+        self.reset()
+
+    def reset(self):
+        self.phase = "pad"
+        self.events = []
+        self.pad_altitude = None
+        self.max_altitude = -np.inf
+        self.max_altitude_time = None
+        self.conditions = {
+            "liftoff": _Sustained(HOLD_S),
+            "burnout": _Sustained(HOLD_S),
+            "apogee": _Sustained(HOLD_S),
+            "landing": _Sustained(LANDING_HOLD_S),
+        }
+
+    def enabled(self):
+        return self.altitude_index is not None and self.velocity_index is not None
+
+    # times: (n,) seconds, rows: (n, width) float64 channel values
+    def process(self, times, rows):
+        if not self.enabled() or not len(times):
+            return []
+        altitude = rows[:, self.altitude_index]
+        velocity = rows[:, self.velocity_index]
+        accel = self.accel.update(times, velocity)
+        new_events = []
+        start = 0
+
+        while start < len(times) and self.phase != "landed":
+            t, alt, vel, acc = times[start:], altitude[start:], velocity[start:], accel[start:]
+            if self.pad_altitude is None:
+                valid = np.flatnonzero(np.isfinite(alt))
+                if not len(valid):
+                    break
+                self.pad_altitude = float(alt[valid[0]])
+            height = alt - self.pad_altitude
+            event = EVENTS[PHASES.index(self.phase)]
+
+            with np.errstate(invalid="ignore"):
+                if event == "liftoff":
+                    cond = (vel > LIFTOFF_VELOCITY) | (height > LIFTOFF_ALTITUDE)
+                elif event == "burnout":
+                    cond = acc < BURNOUT_ACCEL
+                elif event == "apogee":
+                    # Track the peak so the event is stamped where the rocket topped out
+                    peaks = np.fmax.accumulate(np.where(np.isfinite(alt), alt, -np.inf))
+                    peaks = np.maximum(peaks, self.max_altitude)
+                    cond = alt < peaks - APOGEE_DROP
+                else:
+                    cond = (np.abs(vel) < LANDING_SPEED) & (height < LANDING_ALTITUDE)
+
+            hit, run_start = self.conditions[event].first(t, cond)
+            if event == "apogee":
+                stop = len(t) if hit is None else hit + 1
+                segment = np.where(np.isfinite(alt[:stop]), alt[:stop], -np.inf)
+                peak = int(np.argmax(segment))
+                if segment[peak] > self.max_altitude:
+                    self.max_altitude = float(segment[peak])
+                    self.max_altitude_time = float(t[peak])
+            if hit is None:
+                break
+
+            if event == "apogee":
+                record = {"event": event, "time": self.max_altitude_time, "altitude": self.max_altitude,
+                          "velocity": 0.0}
+            else:
+                # Stamped where the condition started holding, values as of when it was confirmed
+                record = {"event": event, "time": run_start, "altitude": float(alt[hit]),
+                          "velocity": float(vel[hit])}
+            new_events.append(record)
+            self.phase = PHASES[PHASES.index(self.phase) + 1]
+            start += hit + 1
+
+        self.events.extend(new_events)
+        return new_events
+
+# Run the detector over a whole recorded flight given {name: values} and a time axis
+def detect_events(schema, times, channels):
+    times = np.asarray(times, dtype=np.float64)
+    rows = np.full((len(times), len(schema)), np.nan)
+    for name, values in channels.items():
+        if name in schema.index:
+            rows[:, schema.index[name]] = values[:len(times)]
+    return EventDetector(schema).process(times, rows)
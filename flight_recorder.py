@@ -0,0 +1,131 @@
+from collections import deque
+import numpy as np
+from channels import TIME_ENCODING
+from telemetry_store import CompactSeries
+
+PRE_TRIGGER_S = 10.0   # Full-rate history kept from before liftoff
+POST_LANDING_S = 5.0   # Full-rate history kept after landing
+IDLE_INTERVAL_S = 1.0  # One sample per interval while on the pad or landed
+RING_SLACK_S = 2.0     # Extra ring history, liftoff is confirmed a little after it happens
+
+# Decides which samples end up in the archive. On the pad only the last
+# PRE_TRIGGER_S seconds are held at full rate, in a ring of per-frame batches;
+# older pad samples are thinned to one per IDLE_INTERVAL_S. From liftoff (minus
+# the pre-trigger window) to POST_LANDING_S after landing every sample is kept,
+# after that the recorder goes back to thinning.
+class FlightRecorder:
+    def __init__(self, schema, pre_trigger_s=PRE_TRIGGER_S, post_landing_s=POST_LANDING_S,
+                 idle_interval_s=IDLE_INTERVAL_S):
+        self.schema = schema
+        self.pre_trigger_s = pre_trigger_s
+        self.post_landing_s = post_landing_s
+        self.idle_interval_s = idle_interval_s
+        self.time = CompactSeries(TIME_ENCODING)
+        self.series = [CompactSeries(channel.encoding) for channel in schema]
+        self.ring = deque()  # (times, rows) batches from the pre-trigger window
+        self.last_bucket = None
+        self.liftoff_time = None
+        self.full_rate_until = None  # Set at landing
+        self.full_rate_start = None
+        self.full_rate_end = None
+        self.events = []
+
+    def __len__(self):
+        return len(self.time)
+
+    def _store(self, times, rows):
+        if not len(times):
+            return
+        self.time.extend(times)
+        for channel in self.schema:
+            self.series[channel.index].extend(rows[:, channel.index])
+
+    # Keep the first sample of every idle interval
+    def _store_decimated(self, times, rows):
+        if not len(times):
+            return
+        buckets = np.floor(times / self.idle_interval_s)
+        keep = np.empty(len(buckets), dtype=bool)
+        keep[0] = buckets[0] != self.last_bucket
+        keep[1:] = buckets[1:] != buckets[:-1]
+        self.last_bucket = buckets[-1]
+        self._store(times[keep], rows[keep])
+
+    def _store_full(self, times, rows):
+        if not len(times):
+            return
+        if self.full_rate_start is None:
+            self.full_rate_start = float(times[0])
+        self.full_rate_end = float(times[-1])
+        self._store(times, rows)
+
+    # One batch of rows (all channels, derived included) plus the events it triggered
+    def add(self, times, rows, events=()):
+        self.events += events
+        for event in events:
+            if event["event"] == "liftoff" and self.liftoff_time is None:
+                self._trigger(event["time"])
+            elif event["event"] == "landing" and self.liftoff_time is not None:
+                self.full_rate_until = event["time"] + self.post_landing_s
+
+        if self.liftoff_time is None:
+            self.ring.append((times, rows))
+            # Age out whole batches that fell behind the pre-trigger window
+            while len(self.ring) > 1 and self.ring[0][0][-1] < times[-1] - self.pre_trigger_s - RING_SLACK_S:
+                self._store_decimated(*self.ring.popleft())
+        elif self.full_rate_until is None:
+            self._store_full(times, rows)
+        else:
+            split = int(np.searchsorted(times, self.full_rate_until, side="right"))
+            self._store_full(times[:split], rows[:split])
+            self._store_decimated(times[split:], rows[split:])
+
+    def _trigger(self, liftoff_time):
+        self.liftoff_time = liftoff_time
+        if not self.ring:
+            return
+        times = np.concatenate([batch[0] for batch in self.ring])
+        rows = np.concatenate([batch[1] for batch in self.ring])
+        self.ring.clear()
+        split = int(np.searchsorted(times, liftoff_time - self.pre_trigger_s))
+        self._store_decimated(times[:split], rows[:split])
+        self._store_full(times[split:], rows[split:])
+
+    # Series to archive ({name: CompactSeries}, time series, segment metadata, events).
+    # Every time in it (samples, segment bounds, events) is re-based here so that
+    # liftoff is t=0 when there was one; segments["time_origin"] records the shift.
+    # Samples still in the pre-trigger ring (no liftoff yet) are included at full rate.
+    def snapshot(self):
+        origin = self.liftoff_time or 0.0
+        series = self.series
+        times = self.time.to_float64()
+        full_rate = [self.full_rate_start, self.full_rate_end]
+        if self.ring:
+            ring_times = np.concatenate([batch[0] for batch in self.ring])
+            ring_rows = np.concatenate([batch[1] for batch in self.ring])
+            times = np.concatenate((times, ring_times))
+            full_rate = [full_rate[0] if full_rate[0] is not None else float(ring_times[0]), float(ring_times[-1])]
+            series = []
+            for channel in self.schema:
+                copy = CompactSeries(channel.encoding, len(times))
+                copy.extend(self.series[channel.index].to_float64())
+                copy.extend(ring_rows[:, channel.index])
+                series.append(copy)
+        else:
+            # Copied either way, so a snapshot can be saved on another thread while recording goes on
+            series = [s.copy() for s in series]
+        time_series = CompactSeries(TIME_ENCODING, len(times))
+        time_series.extend(times - origin)
+
+        def rebase(t):
+            return None if t is None else t - origin
+
+        segments = {
+            "time_origin": origin,
+            "liftoff": rebase(self.liftoff_time),
+            "full_rate": [rebase(t) for t in full_rate],
+            "pre_trigger_s": self.pre_trigger_s,
+            "idle_interval_s": self.idle_interval_s,
+        }
+        events = [dict(event, time=rebase(event["time"])) for event in self.events]
+        return {channel.name: series[channel.index] for channel in self.schema}, time_series, segments, events
@@ -0,0 +1,220 @@
+import os
+import time
+import threading
+import cProfile
+import pstats
+from collections import deque
+from contextlib import nullcontext
+from datetime import datetime
+import numpy as np
+
+PROFILE_DIR = "profiles"
+
+class _StageTimer:
+    __slots__ = ("stats", "start")
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.stats.add(time.perf_counter() - self.start)
+
+class StageStats:
+    def __init__(self, window):
+        self.durations = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, seconds):
+        self.durations.append(seconds)
+        self.count += 1
+
+    def percentiles_ms(self):
+        if not self.durations:
+            return 0.0, 0.0
+        p50, p99 = np.percentile(np.fromiter(self.durations, float), [50, 99]) * 1000.0
+        return float(p50), float(p99)
+
+# Timers, counters and gauges for the ingest/parse/store/render/save stages.
+# When disabled, stage() hands back a shared no-op context manager and
+# count()/gauge() return immediately, so the hooks can stay in the hot path.
+class Instrumentation:
+    def __init__(self, enabled=False, window=1024):
+        self.enabled = enabled
+        self.window = window
+        self.stages = {}
+        self.counters = {}
+        self.gauges = {}
+        self._null = nullcontext()
+        self._last_rates = {}
+        self._lock = threading.Lock()
+
+    def _stage_stats(self, name):
+        stats = self.stages.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self.stages.setdefault(name, StageStats(self.window))
+        return stats
+
+    def stage(self, name):
+        if not self.enabled:
+            return self._null
+        return _StageTimer(self._stage_stats(name))
+
+    def record(self, name, seconds):
+        if self.enabled:
+            self._stage_stats(name).add(seconds)
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def gauge(self, name, value):
+        if self.enabled:
+            self.gauges[name] = value
+
+    def reset(self):
+        with self._lock:
+            self.stages = {}
+            self.counters = {}
+            self.gauges = {}
+            self._last_rates = {}
+
+    # Per-stage p50/p99 in ms plus counter rates since the previous snapshot
+    def snapshot(self):
+        now = time.perf_counter()
+        stages = {}
+        for name, stats in list(self.stages.items()):
+            p50, p99 = stats.percentiles_ms()
+            stages[name] = {"count": stats.count, "p50_ms": p50, "p99_ms": p99}
+
+        rates = {}
+        for name, value in list(self.counters.items()):
+            last_time, last_value = self._last_rates.get(name, (None, 0))
+            if last_time is not None and now > last_time:
+                rates[name] = (value - last_value) / (now - last_time)
+            self._last_rates[name] = (now, value)
+
+        return {"stages": stages, "counters": dict(self.counters), "rates": rates, "gauges": dict(self.gauges)}
+
+def format_snapshot(snapshot):
+    lines = [f"{'stage':<12}{'count':>9}{'p50 ms':>10}{'p99 ms':>10}"]
+    for name, stage in sorted(snapshot["stages"].items()):
+        lines.append(f"{name:<12}{stage['count']:>9}{stage['p50_ms']:>10.3f}{stage['p99_ms']:>10.3f}")
+    for name, value in sorted(snapshot["counters"].items()):
+        rate = snapshot["rates"].get(name)
+        rate_text = f"  {rate:.1f}/s" if rate is not None else ""
+        lines.append(f"{name}: {value}{rate_text}")
+    for name, value in sorted(snapshot["gauges"].items()):
+        lines.append(f"{name}: {value}")
+    return "\n".join(lines)
+
+# Shared instance, enabled from the environment or the dashboard's stats toggle
+instrumentation = Instrumentation(enabled=os.environ.get("TELEMETRY_PROFILE") == "1")
+
+# cProfile capture for one flight. cProfile only sees the thread that enabled it,
+# so worker threads call sync() from their loops to join or leave a capture.
+class FlightProfiler:
+    def __init__(self, directory=PROFILE_DIR):
+        self.directory = directory
+        self.active = False
+        self.generation = 0
+        self._profiles = []
+        self._attached = {}  # thread ident -> (generation, profile)
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            self.generation += 1
+            self._profiles = []
+            self.active = True
+        self.sync()
+
+    def sync(self):
+        ident = threading.get_ident()
+        attached = self._attached.get(ident)
+        if attached is not None and (not self.active or attached[0] != self.generation):
+            attached[1].disable()
+            del self._attached[ident]
+            attached = None
+        if self.active and attached is None:
+            profile = cProfile.Profile()
+            with self._lock:
+                self._profiles.append(profile)
+                self._attached[ident] = (self.generation, profile)
+            profile.enable()
+
+    # Stop capturing and write one merged .prof file (open with snakeviz, flameprof, ...)
+    def stop(self, name=None):
+        with self._lock:
+            self.active = False
+            profiles = self._profiles
+            self._profiles = []
+        self.sync()
+        if not profiles:
+            return None
+
+        os.makedirs(self.directory, exist_ok=True)
+        name = name or datetime.now().strftime("flight_%Y-%m-%d_%H-%M-%S")
+        path = os.path.join(self.directory, f"{name}.prof")
+        stats = None
+        for profile in profiles:
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+        stats.dump_stats(path)
+        return path
+
+LATENCY_EDGES_MS = np.logspace(-1, 4, 51)  # 0.1 ms .. 10 s, log spaced
+
+# Fixed-bin latency histogram; cheap to update every frame and small enough to archive
+class LatencyHistogram:
+    def __init__(self, edges=LATENCY_EDGES_MS):
+        self.edges = edges
+        self.counts = np.zeros(len(edges) + 1, dtype=np.int64)  # Plus under/overflow bins
+        self.count = 0
+
+    def add(self, values_ms):
+        values_ms = np.asarray(values_ms, dtype=np.float64)
+        np.add.at(self.counts, np.searchsorted(self.edges, values_ms, side="right"), 1)
+        self.count += len(values_ms)
+
+    # Upper edge of the bin holding the q-th percentile
+    def percentile(self, q):
+        if not self.count:
+            return 0.0
+        i = int(np.searchsorted(np.cumsum(self.counts), self.count * q / 100.0))
+        return float(self.edges[min(i, len(self.edges) - 1)])
+
+    def as_dict(self):
+        return {
+            "edges_ms": self.edges.tolist(),
+            "counts": self.counts.tolist(),
+            "count": self.count,
+            "p50_ms": self.percentile(50),
+            "p99_ms": self.percentile(99),
+        }
+
+# Serial-byte-to-pixel latency per sample, split into the stages a sample goes
+# through: parse (arrival -> parsed), queue (parsed -> frame start), render
+# (frame start -> curves updated) and total (arrival -> curves updated)
+class LatencyTracker:
+    STAGES = ("parse", "queue", "render", "total")
+
+    def __init__(self):
+        self.histograms = {stage: LatencyHistogram() for stage in self.STAGES}
+
+    def add_frame(self, stamps, frame_start, drawn):
+        stamps = np.asarray(stamps, dtype=np.float64)
+        arrival, parsed = stamps[:, 0], stamps[:, 1]
+        self.histograms["parse"].add((parsed - arrival) * 1000.0)
+        self.histograms["queue"].add((frame_start - parsed) * 1000.0)
+        self.histograms["render"].add(np.full(len(stamps), (drawn - frame_start) * 1000.0))
+        self.histograms["total"].add((drawn - arrival) * 1000.0)
+
+    def as_dict(self):
+        return {stage: histogram.as_dict() for stage, histogram in self.histograms.items()}
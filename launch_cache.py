@@ -0,0 +1,184 @@
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+import numpy as np
+from launch_storage import TIME_COLUMN, launch_dir, read_launch_samples
+from derived_channels import derive_offline
+from event_detection import detect_events
+
+CACHE_MAX_BYTES = 256 * 2 ** 20
+SIDECAR_FILE = "summary_cache.npz"
+LEVEL_FACTOR = 4         # Each decimated level has 1/4 of the points of the one below
+MIN_LEVEL_POINTS = 1000  # Stop decimating below this many blocks
+
+# Fingerprint of everything a launch's summary is computed from: its metadata
+# (minus the user-editable name) and the size/mtime of each sample file. Any change
+# to the samples or detected events gives a new key and drops the cached entry.
+def content_key(launch_id, launch):
+    digest = hashlib.sha1(json.dumps({k: v for k, v in launch.items() if k != "name"},
+                                     sort_keys=True, default=str).encode("utf-8"))
+    samples = launch.get("samples") or {}
+    for meta in samples.get("channels", {}).values():
+        try:
+            st = os.stat(os.path.join(launch_dir(launch_id), meta["file"]))
+            digest.update(f"{meta['file']}:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+        except OSError:
+            digest.update(f"{meta['file']}:missing".encode("utf-8"))
+    return digest.hexdigest()
+
+# Min/max envelopes of y over blocks of LEVEL_FACTOR**k samples, k = 1, 2, ...
+# Each level is built from the previous one, so the whole pyramid costs O(n).
+def build_levels(x, y):
+    levels = []
+    lo = hi = y
+    xs = x
+    while len(xs) // LEVEL_FACTOR >= MIN_LEVEL_POINTS:
+        n = len(xs) // LEVEL_FACTOR * LEVEL_FACTOR
+        xs = xs[:n:LEVEL_FACTOR]
+        with np.errstate(invalid="ignore"):
+            lo = np.fmin.reduce(lo[:n].reshape(-1, LEVEL_FACTOR), axis=1)
+            hi = np.fmax.reduce(hi[:n].reshape(-1, LEVEL_FACTOR), axis=1)
+        levels.append((xs, lo, hi))
+    return levels
+
+# A past launch decoded for the summary screen: time axis, float64 channels
+# (derived ones included), events and a decimated pyramid per channel
+class LaunchSummary:
+    def __init__(self, launch_id, key, time, channels, events, levels=None):
+        self.launch_id = launch_id
+        self.key = key
+        self.time = time
+        self.channels = channels
+        self.events = events
+        self.levels = levels if levels is not None else {
+            name: build_levels(time, values) for name, values in channels.items()
+        }
+
+    def nbytes(self):
+        total = self.time.nbytes + sum(values.nbytes for values in self.channels.values())
+        for levels in self.levels.values():
+            total += sum(xs.nbytes + lo.nbytes + hi.nbytes for xs, lo, hi in levels)
+        return total
+
+    # (x, y) for a channel with at most about max_points points, taken from the
+    # coarsest level that still has enough detail; min and max are interleaved so
+    # spikes survive decimation
+    def plot_data(self, name, max_points=4000):
+        values = self.channels[name]
+        if len(values) <= max_points:
+            return self.time, values
+        for xs, lo, hi in self.levels.get(name, []):
+            if 2 * len(xs) <= max_points:
+                return np.repeat(xs, 2), np.column_stack((lo, hi)).ravel()
+        levels = self.levels.get(name)
+        if not levels:
+            return self.time, values
+        xs, lo, hi = levels[-1]
+        return np.repeat(xs, 2), np.column_stack((lo, hi)).ravel()
+
+    def save(self, path):
+        arrays = {"time": self.time}
+        for i, (name, values) in enumerate(self.channels.items()):
+            arrays[f"c{i}"] = values
+            for k, (xs, lo, hi) in enumerate(self.levels[name]):
+                arrays[f"c{i}_l{k}_x"], arrays[f"c{i}_l{k}_lo"], arrays[f"c{i}_l{k}_hi"] = xs, lo, hi
+        header = {"key": self.key, "names": list(self.channels),
+                  "levels": [len(self.levels[name]) for name in self.channels], "events": self.events}
+        arrays["header"] = np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8)
+        tmp_path = path + ".tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, launch_id, path, key):
+        with np.load(path) as data:
+            header = json.loads(data["header"].tobytes().decode("utf-8"))
+            if header["key"] != key:
+                return None
+            channels, levels = {}, {}
+            for i, name in enumerate(header["names"]):
+                channels[name] = data[f"c{i}"]
+                levels[name] = [(data[f"c{i}_l{k}_x"], data[f"c{i}_l{k}_lo"], data[f"c{i}_l{k}_hi"])
+                                for k in range(header["levels"][i])]
+            return cls(launch_id, key, data["time"], channels, header["events"], levels)
+
+# Decode a launch from its archive files into (time, {name: values}, events)
+def decode_launch(schema, launch_id, launch):
+    field_data = read_launch_samples(launch_id, launch)
+    length = min((len(values) for values in field_data.values()), default=0)
+    # Older archives have no time column, plot those against sample number
+    time = field_data.pop(TIME_COLUMN, np.arange(length, dtype=np.float64))[:length]
+    field_data = {name: values[:length] for name, values in field_data.items()}
+    # Archives from before a derived channel was configured get it computed here
+    field_data = derive_offline(schema, time, field_data)
+    events = launch.get("events")
+    if events is None:
+        events = detect_events(schema, time, field_data)
+    return time, field_data, events
+
+def build_summary(schema, launch_id, launch, key=None):
+    time, field_data, events = decode_launch(schema, launch_id, launch)
+    return LaunchSummary(launch_id, key or content_key(launch_id, launch), time, field_data, events)
+
+# In-memory LRU of LaunchSummary objects bounded by total bytes, optionally
+# backed by a sidecar file next to each launch's samples so a restart does not
+# have to decode and decimate again. Safe to use from several threads.
+class LaunchCache:
+    def __init__(self, schema, max_bytes=CACHE_MAX_BYTES, persist=True):
+        self.schema = schema
+        self.max_bytes = max_bytes
+        self.persist = persist
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def sidecar_path(self, launch_id):
+        return os.path.join(launch_dir(launch_id), SIDECAR_FILE)
+
+    def get(self, launch_id, launch):
+        key = content_key(launch_id, launch)
+        with self.lock:
+            entry = self.entries.get(launch_id)
+            if entry is not None and entry.key == key:
+                self.entries.move_to_end(launch_id)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        summary = self._load_sidecar(launch_id, key)
+        if summary is None:
+            summary = build_summary(self.schema, launch_id, launch, key)
+            if self.persist and "samples" in launch:
+                try:
+                    summary.save(self.sidecar_path(launch_id))
+                except OSError as e:
+                    print(f"Could not write summary cache for {launch_id}: {e}")
+        self._insert(summary)
+        return summary
+
+    def _load_sidecar(self, launch_id, key):
+        path = self.sidecar_path(launch_id)
+        if not self.persist or not os.path.exists(path):
+            return None
+        try:
+            return LaunchSummary.load(launch_id, path, key)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable summary cache {path}: {e}")
+            return None
+
+    def _insert(self, summary):
+        size = summary.nbytes()
+        with self.lock:
+            old = self.entries.pop(summary.launch_id, None)
+            if old is not None:
+                self.total_bytes -= old.nbytes()
+            self.entries[summary.launch_id] = summary
+            self.total_bytes += size
+            # Evict least recently used, but always keep the entry just added
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= evicted.nbytes()
@@ -0,0 +1,295 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from datetime import datetime
+from collections import OrderedDict
+import numpy as np
+from channels import load_channel_schema
+from launch_cache import decode_launch
+
+LAUNCH_CATALOG_FILE = "launch_catalog.db"
+PAGE_SIZE = 20
+SAMPLE_KEYS = ("samples", "data")  # Where a launch's samples are, or (legacy) the samples themselves
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS launches (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    created REAL NOT NULL,
+    length INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS launches_created ON launches (created);
+
+-- Kept out of the launches rows so renames and list queries never rewrite or page
+-- through the (possibly large) metadata
+CREATE TABLE IF NOT EXISTS launch_metadata (
+    launch_id TEXT PRIMARY KEY REFERENCES launches (id) ON DELETE CASCADE,
+    metadata TEXT NOT NULL
+);
+
+-- SAMPLE_KEYS of each launch: sample file layout, or a legacy launch's raw lines.
+-- Only read when a launch is opened, never by list queries.
+CREATE TABLE IF NOT EXISTS launch_data (
+    launch_id TEXT PRIMARY KEY REFERENCES launches (id) ON DELETE CASCADE,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS channel_stats (
+    launch_id TEXT NOT NULL REFERENCES launches (id) ON DELETE CASCADE,
+    channel TEXT NOT NULL,
+    min REAL, max REAL, mean REAL, count INTEGER,
+    PRIMARY KEY (launch_id, channel)
+);
+CREATE INDEX IF NOT EXISTS channel_stats_max ON channel_stats (channel, max);
+CREATE INDEX IF NOT EXISTS channel_stats_min ON channel_stats (channel, min);
+
+CREATE TABLE IF NOT EXISTS events (
+    launch_id TEXT NOT NULL REFERENCES launches (id) ON DELETE CASCADE,
+    event TEXT NOT NULL,
+    time REAL, altitude REAL, velocity REAL
+);
+CREATE INDEX IF NOT EXISTS events_altitude ON events (event, altitude);
+CREATE INDEX IF NOT EXISTS events_launch ON events (launch_id);
+
+CREATE TABLE IF NOT EXISTS tags (
+    launch_id TEXT NOT NULL REFERENCES launches (id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (launch_id, tag)
+);
+CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag);
+"""
+
+# Only these may be spliced into SQL; values always go through parameters
+STATS = {"min", "max", "mean"}
+OPERATORS = {">", ">=", "<", "<=", "="}
+
+# min/max/mean/count of the finite values of each series ({name: CompactSeries or array})
+def channel_statistics(series_by_name):
+    stats = {}
+    for name, series in series_by_name.items():
+        values = series.to_float64() if hasattr(series, "to_float64") else np.asarray(series, dtype=np.float64)
+        values = values[np.isfinite(values)]
+        if len(values):
+            stats[name] = (float(values.min()), float(values.max()), float(values.mean()), int(len(values)))
+        else:
+            stats[name] = (None, None, None, 0)
+    return stats
+
+# Launch IDs are save timestamps ("%Y-%m-%d_%H-%M-%S"); anything else sorts as now
+def _created(launch_id):
+    try:
+        return datetime.strptime(launch_id, "%Y-%m-%d_%H-%M-%S").timestamp()
+    except ValueError:
+        return time.time()
+
+def _launch(name, metadata, data=None):
+    launch = dict(json.loads(metadata), name=name)
+    if data is not None:
+        launch.update(json.loads(data))
+    return launch
+
+# A launch from search() carries no SAMPLE_KEYS; get() has the full launch
+def is_complete(launch):
+    return any(key in launch for key in SAMPLE_KEYS)
+
+# Embedded SQLite catalog of past launches: metadata, per-channel statistics,
+# detected events and tags. Every change is one transaction, so a crash leaves
+# either the old or the new state, and an edit touches only the launch's rows.
+class LaunchCatalog:
+    def __init__(self, path=LAUNCH_CATALOG_FILE, readonly=False):
+        self.path = path
+        self.lock = threading.RLock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        if readonly:
+            # Extra connections for reading an existing catalog next to its writer
+            self.db.execute("PRAGMA query_only = ON")
+            return
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM launches").fetchone()[0]
+
+    def add_launch(self, launch_id, launch, stats=None, tags=()):
+        with self.lock, self.db:
+            self._write_launch(launch_id, launch, stats, tags)
+
+    # Bulk import, e.g. the old past_launches.json, in a single transaction
+    def add_launches(self, launches, stats_by_id=None):
+        with self.lock, self.db:
+            for launch_id, launch in launches.items():
+                self._write_launch(launch_id, launch, (stats_by_id or {}).get(launch_id), ())
+
+    def _write_launch(self, launch_id, launch, stats, tags):
+        length = (launch.get("samples") or {}).get("length", len(launch.get("data", [])))
+        self.db.execute(
+            "INSERT INTO launches (id, name, created, length) VALUES (?, ?, ?, ?) ON CONFLICT (id) DO UPDATE"
+            " SET name = excluded.name, created = excluded.created, length = excluded.length",
+            (launch_id, launch.get("name", launch_id), _created(launch_id), length),
+        )
+        metadata = {key: value for key, value in launch.items() if key not in SAMPLE_KEYS}
+        data = {key: launch[key] for key in SAMPLE_KEYS if key in launch}
+        self.db.execute("INSERT OR REPLACE INTO launch_metadata (launch_id, metadata) VALUES (?, ?)",
+                        (launch_id, json.dumps(metadata)))
+        self.db.execute("INSERT OR REPLACE INTO launch_data (launch_id, data) VALUES (?, ?)",
+                        (launch_id, json.dumps(data)))
+        self.db.execute("DELETE FROM events WHERE launch_id = ?", (launch_id,))
+        self.db.executemany(
+            "INSERT INTO events (launch_id, event, time, altitude, velocity) VALUES (?, ?, ?, ?, ?)",
+            [(launch_id, e["event"], e.get("time"), e.get("altitude"), e.get("velocity"))
+             for e in launch.get("events") or []],
+        )
+        if stats is not None:
+            self.db.execute("DELETE FROM channel_stats WHERE launch_id = ?", (launch_id,))
+            self.db.executemany(
+                "INSERT INTO channel_stats (launch_id, channel, min, max, mean, count) VALUES (?, ?, ?, ?, ?, ?)",
+                [(launch_id, name) + tuple(values) for name, values in stats.items()],
+            )
+        self.db.executemany("INSERT OR IGNORE INTO tags (launch_id, tag) VALUES (?, ?)",
+                            [(launch_id, tag) for tag in tags])
+
+    # The name column is authoritative and is merged into the metadata on read, so a
+    # rename writes one small column whatever the size of the launch
+    def rename(self, launch_id, name):
+        self.rename_many({launch_id: name})
+
+    # Several renames, e.g. a burst of edits, committed as one transaction
+    def rename_many(self, names):
+        with self.lock, self.db:
+            self.db.executemany(
+                "UPDATE launches SET name = ? WHERE id = ?",
+                [(name, launch_id) for launch_id, name in names.items()],
+            )
+
+    def set_tags(self, launch_id, tags):
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM tags WHERE launch_id = ?", (launch_id,))
+            self.db.executemany("INSERT INTO tags (launch_id, tag) VALUES (?, ?)",
+                                [(launch_id, tag) for tag in tags])
+
+    def tags(self, launch_id):
+        with self.lock:
+            rows = self.db.execute("SELECT tag FROM tags WHERE launch_id = ? ORDER BY tag", (launch_id,))
+            return [tag for tag, in rows]
+
+    def delete(self, launch_id):
+        with self.lock, self.db:
+            self.db.execute("DELETE FROM launches WHERE id = ?", (launch_id,))
+
+    def get(self, launch_id):
+        with self.lock:
+            row = self.db.execute(
+                "SELECT name, metadata, data FROM launches JOIN launch_metadata ON launch_metadata.launch_id = id"
+                " LEFT JOIN launch_data ON launch_data.launch_id = id WHERE id = ?", (launch_id,)
+            ).fetchone()
+        return _launch(*row) if row else None
+
+    # Every launch, oldest first, as {launch_id: metadata}
+    def all_launches(self):
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT id, name, metadata, data FROM launches JOIN launch_metadata ON launch_metadata.launch_id = id"
+                " LEFT JOIN launch_data ON launch_data.launch_id = id ORDER BY created, id"
+            ).fetchall()
+        return OrderedDict((launch_id, _launch(name, metadata, data)) for launch_id, name, metadata, data in rows)
+
+    def statistics(self, launch_id):
+        with self.lock:
+            rows = self.db.execute("SELECT channel, min, max, mean, count FROM channel_stats WHERE launch_id = ?",
+                                   (launch_id,)).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+    # Launches matching every given filter, newest first, as {launch_id: metadata}
+    # in oldest-first order (the order the list screen expects). The metadata has
+    # no SAMPLE_KEYS, get() returns the complete launch. Filters:
+    #   text: name contains (case-insensitive); since/until: unix time of the launch
+    #   apogee_above: detected apogee altitude (m); tag: has this tag
+    #   stat_filters: [(channel, "min"|"max"|"mean", operator, value)], e.g. ("Altitude", "max", ">", 500)
+    def search(self, limit=PAGE_SIZE, offset=0, **filters):
+        where, params = self._filter_sql(**filters)
+        sql = ("SELECT id, name, metadata FROM launches JOIN launch_metadata ON launch_metadata.launch_id = id"
+               + where + " ORDER BY created DESC, id DESC LIMIT ? OFFSET ?")
+        with self.lock:
+            rows = self.db.execute(sql, params + [limit, offset]).fetchall()
+        return OrderedDict((launch_id, _launch(name, metadata)) for launch_id, name, metadata in reversed(rows))
+
+    # One page of search results with the total match count, both read in a single
+    # transaction so they agree. Returns (total, pages, page, launches); page is clamped.
+    def page(self, page, page_size=PAGE_SIZE, **filters):
+        with self.lock:
+            self.db.execute("BEGIN")
+            try:
+                total = self.count(**filters)
+                pages = max((total + page_size - 1) // page_size, 1)
+                page = min(max(page, 0), pages - 1)
+                return total, pages, page, self.search(limit=page_size, offset=page * page_size, **filters)
+            finally:
+                self.db.execute("COMMIT")
+
+    def count(self, **filters):
+        where, params = self._filter_sql(**filters)
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM launches" + where, params).fetchone()[0]
+
+    def _filter_sql(self, text=None, since=None, until=None, apogee_above=None, tag=None, stat_filters=()):
+        where, params = [], []
+        if text:
+            where.append("launches.name LIKE ? ESCAPE '\\'")
+            params.append("%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+        if since is not None:
+            where.append("launches.created >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("launches.created <= ?")
+            params.append(until)
+        if apogee_above is not None:
+            where.append("EXISTS (SELECT 1 FROM events WHERE events.launch_id = launches.id"
+                         " AND events.event = 'apogee' AND events.altitude > ?)")
+            params.append(apogee_above)
+        if tag:
+            where.append("EXISTS (SELECT 1 FROM tags WHERE tags.launch_id = launches.id AND tags.tag = ?)")
+            params.append(tag)
+        for channel, stat, operator, value in stat_filters:
+            if stat not in STATS or operator not in OPERATORS:
+                raise ValueError(f"Unsupported filter {stat} {operator}")
+            where.append(f"EXISTS (SELECT 1 FROM channel_stats WHERE channel_stats.launch_id = launches.id"
+                         f" AND channel_stats.channel = ? AND channel_stats.{stat} {operator} ?)")
+            params += [channel, value]
+        return (" WHERE " + " AND ".join(where) if where else ""), params
+
+# Channel statistics and detected events of a launch archived before the catalog
+def analyse_launch(schema, launch_id, launch):
+    try:
+        _, field_data, events = decode_launch(schema, launch_id, launch)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Could not read samples of {launch_id}: {e}")
+        return None, launch.get("events")
+    return channel_statistics(field_data), events
+
+# Import the old JSON archive into an empty catalog
+def import_legacy_launches(catalog, legacy_json, schema=None):
+    if len(catalog) or not os.path.exists(legacy_json):
+        return
+    with open(legacy_json, "r") as f:
+        launches = json.load(f)
+    schema = schema or load_channel_schema()
+    stats = {}
+    for launch_id, launch in launches.items():
+        stats[launch_id], launch["events"] = analyse_launch(schema, launch_id, launch)
+    catalog.add_launches(launches, stats)
+    print(f"Imported {len(launches)} launches from {legacy_json} into {catalog.path}")
+
+# Open the catalog, importing the old JSON archive the first time
+def open_catalog(path=LAUNCH_CATALOG_FILE, legacy_json=None, schema=None):
+    catalog = LaunchCatalog(path)
+    if legacy_json:
+        import_legacy_launches(catalog, legacy_json, schema)
+    return catalog
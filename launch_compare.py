@@ -0,0 +1,54 @@
+import numpy as np
+
+ALIGNMENTS = ["liftoff", "apogee", "none"]
+COMPARE_POINTS = 1500  # Points per curve when overlaying, taken from the cached levels
+
+# Time of the alignment event in a launch, 0 if it has none
+def alignment_offset(summary, align):
+    for event in summary.events:
+        if event["event"] == align:
+            return event["time"]
+    return 0.0
+
+# [(launch_id, x, y)] for one channel across launches, each shifted so the
+# alignment event is at t=0. Uses the decimated min/max levels, so the cost does
+# not depend on how long or how fast the flights were recorded.
+def overlay_data(summaries, name, align="liftoff", max_points=COMPARE_POINTS):
+    curves = []
+    for summary in summaries:
+        if name not in summary.channels:
+            continue
+        x, y = summary.plot_data(name, max_points)
+        curves.append((summary.launch_id, x - alignment_offset(summary, align), y))
+    return curves
+
+# Mean of the finite y values falling in each bin between consecutive edges,
+# NaN where a bin has none. The last edge is inclusive.
+def resample_mean(x, y, edges):
+    bins = len(edges) - 1
+    keep = np.isfinite(y) & (x >= edges[0]) & (x <= edges[-1])
+    index = np.clip(np.searchsorted(edges, x[keep], side="right") - 1, 0, bins - 1)
+    counts = np.bincount(index, minlength=bins)
+    sums = np.bincount(index, weights=y[keep], minlength=bins)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return sums / counts
+
+# Each launch minus the reference launch, with both resampled to the mean of the
+# full-rate samples in max_points bins over the reference's aligned time span.
+# The min/max envelopes from plot_data are for drawing only: subtracting them
+# would compare a bin's minimum against another bin's maximum.
+# Returns (bin centres, {launch_id: delta}); NaN where a launch has no data.
+def delta_curves(summaries, name, align="liftoff", reference=0, max_points=COMPARE_POINTS):
+    reference_summary = summaries[reference]
+    if name not in reference_summary.channels or len(reference_summary.time) < 2:
+        return np.empty(0), {}
+    reference_x = reference_summary.time - alignment_offset(reference_summary, align)
+    edges = np.linspace(reference_x[0], reference_x[-1], max_points + 1)
+    reference_y = resample_mean(reference_x, reference_summary.channels[name], edges)
+    deltas = {}
+    for summary in summaries:
+        if summary is reference_summary or name not in summary.channels:
+            continue
+        x = summary.time - alignment_offset(summary, align)
+        deltas[summary.launch_id] = resample_mean(x, summary.channels[name], edges) - reference_y
+    return (edges[:-1] + edges[1:]) / 2, deltas
@@ -0,0 +1,110 @@
+import queue
+import itertools
+import threading
+from PyQt5.QtCore import QObject, pyqtSignal
+from launch_storage import query_launch, query_rows
+from launch_catalog import is_complete
+
+REQUEST_PRIORITY = 0   # The launch the user just opened
+PREFETCH_PRIORITY = 1  # Launches they are likely to open next
+PREFETCH_RECENT = 3    # Most recent launches to keep warm
+ZOOM_MAX_ROWS = 200000  # Larger ranges are shown from the decimated levels instead
+
+# Decodes launches into the LaunchCache on a worker thread so the GUI thread
+# never waits on disk or parsing. Results come back through the `loaded`/`failed`
+# signals, which Qt delivers on the GUI thread.
+#
+# Launches listed from the catalog carry only metadata; `resolve(launch_id)`
+# fetches the complete launch (sample layout included) on the worker thread.
+class LaunchLoader(QObject):
+    loaded = pyqtSignal(str, object)        # launch_id, LaunchSummary
+    failed = pyqtSignal(str, str)           # launch_id, error message
+    range_loaded = pyqtSignal(str, object)  # launch_id, (tag, start, stop, time, {name: values}) or (tag, None)
+
+    def __init__(self, cache, resolve=None):
+        super().__init__()
+        self.cache = cache
+        self.resolve = resolve
+        self.resolved = (None, None)  # Last (launch_id, launch) resolved, zooms reuse it
+        self.queue = queue.PriorityQueue()
+        self.order = itertools.count()  # FIFO among equal priorities
+        self.thread = None
+
+    def _ensure_started(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+
+    def request(self, launch_id, launch):
+        self._put(REQUEST_PRIORITY, "summary", launch_id, launch)
+
+    # Warm the cache without notifying anyone; already cached launches cost a lookup
+    def prefetch(self, launches):
+        for launch_id, launch in launches:
+            self._put(PREFETCH_PRIORITY, "prefetch", launch_id, launch)
+
+    # Full-resolution samples of `channels` between start and stop seconds, read
+    # through the launch's time index. `tag` is handed back with the result.
+    def request_range(self, launch_id, launch, channels, start, stop, tag=None):
+        self._put(REQUEST_PRIORITY, "range", launch_id, launch, (channels, start, stop, tag))
+
+    def _put(self, priority, kind, launch_id, launch, args=None):
+        self._ensure_started()
+        self.queue.put((priority, next(self.order), kind, launch_id, launch, args))
+
+    def stop(self):
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.put((-1, next(self.order), "stop", None, None, None))
+            self.thread.join(2.0)
+
+    def _run(self):
+        while True:
+            _, _, kind, launch_id, launch, args = self.queue.get()
+            if kind == "stop":
+                return
+            try:
+                launch = self._complete(launch_id, launch)
+                if kind == "range":
+                    self.range_loaded.emit(launch_id, self._load_range(launch_id, launch, *args))
+                    continue
+                summary = self.cache.get(launch_id, launch)
+            except Exception as e:
+                print(f"Failed to load launch {launch_id}: {e}")
+                if kind != "prefetch":
+                    self.failed.emit(launch_id, str(e))
+                continue
+            if kind == "summary":
+                self.loaded.emit(launch_id, summary)
+
+    def _complete(self, launch_id, launch):
+        if is_complete(launch) or self.resolve is None:
+            return launch
+        if self.resolved[0] != launch_id:
+            complete = self.resolve(launch_id)
+            if complete is None:
+                raise KeyError(f"{launch_id} is not in the archive")
+            self.resolved = (launch_id, complete)
+        return self.resolved[1]
+
+    def _load_range(self, launch_id, launch, channels, start, stop, tag):
+        if query_rows(launch_id, launch, start, stop) > ZOOM_MAX_ROWS:
+            return tag, None
+        time, values = query_launch(launch_id, launch, channels, start, stop)
+        return tag, start, stop, time, values
+
+# Launches worth prefetching around `launch_id`: its neighbours in the list and
+# the most recent few, given launches in archive order
+def prefetch_candidates(launches, launch_id=None, recent=PREFETCH_RECENT):
+    ids = list(launches)
+    wanted = []
+    if launch_id in launches:
+        i = ids.index(launch_id)
+        wanted += ids[max(i - 1, 0):i] + ids[i + 1:i + 2]
+    wanted += ids[-recent:][::-1]
+    seen = {launch_id}
+    candidates = []
+    for candidate in wanted:
+        if candidate not in seen:
+            seen.add(candidate)
+            candidates.append((candidate, launches[candidate]))
+    return candidates
@@ -0,0 +1,168 @@
+import os
+import numpy as np
+from channels import ChannelEncoding
+
+LAUNCH_DATA_DIR = "launch_data"
+TIME_COLUMN = "Time"  # Seconds (from liftoff if there was one), stored like any other column
+INDEX_FILE = "index.npz"
+BLOCK_SAMPLES = 4096  # Rows per index block
+
+def launch_dir(launch_id):
+    return os.path.join(LAUNCH_DATA_DIR, launch_id)
+
+def _little_endian(dtype):
+    return np.dtype(dtype).newbyteorder("<")
+
+# Write each channel as a raw little-endian column file in its compact dtype and
+# return the metadata stored alongside the launch in past_launches.json
+def write_launch_samples(launch_id, series_by_name):
+    directory = launch_dir(launch_id)
+    os.makedirs(directory, exist_ok=True)
+    length = min((len(series) for series in series_by_name.values()), default=0)
+
+    channels = {}
+    for name, series in series_by_name.items():
+        filename = f"{name}.bin"
+        raw = series.raw()[:length]
+        raw.astype(_little_endian(raw.dtype), copy=False).tofile(os.path.join(directory, filename))
+        channels[name] = dict(series.encoding.to_dict(), file=filename)
+
+    samples = {"format": "compact", "length": length, "channels": channels}
+    if TIME_COLUMN in series_by_name:
+        _write_index(directory, series_by_name, length)
+        samples["index"] = {"file": INDEX_FILE, "block_samples": BLOCK_SAMPLES}
+    return samples
+
+# Per block of BLOCK_SAMPLES rows: first/last timestamp, and min/max/sum/count of
+# each channel's finite values. Time is non-decreasing, so a time range maps to
+# one contiguous run of blocks.
+def _write_index(directory, series_by_name, length):
+    blocks = -(-length // BLOCK_SAMPLES)
+    padded = blocks * BLOCK_SAMPLES
+    arrays = {}
+    for name, series in series_by_name.items():
+        values = np.full(padded, np.nan)
+        values[:length] = series.to_float64(0, length)
+        values = values.reshape(blocks, BLOCK_SAMPLES)
+        if name == TIME_COLUMN:
+            arrays["t_min"] = values[:, 0]
+            arrays["t_max"] = np.fmax.reduce(values, axis=1)
+            continue
+        finite = np.isfinite(values)
+        with np.errstate(invalid="ignore"):
+            arrays[f"{name}.min"] = np.fmin.reduce(values, axis=1)
+            arrays[f"{name}.max"] = np.fmax.reduce(values, axis=1)
+        arrays[f"{name}.sum"] = np.where(finite, values, 0.0).sum(axis=1)
+        arrays[f"{name}.count"] = finite.sum(axis=1)
+    tmp_path = os.path.join(directory, INDEX_FILE + ".tmp.npz")
+    np.savez(tmp_path, **arrays)
+    os.replace(tmp_path, os.path.join(directory, INDEX_FILE))
+
+def load_launch_index(launch_id, launch):
+    index = (launch.get("samples") or {}).get("index")
+    if index is None:
+        return None
+    with np.load(os.path.join(launch_dir(launch_id), index["file"])) as data:
+        return dict(data, block_samples=index["block_samples"])
+
+# Rows [start, stop) of one column, read with a seek instead of loading the file
+def _read_column(launch_id, meta, start, stop):
+    encoding = ChannelEncoding.from_dict(meta)
+    dtype = _little_endian(encoding.dtype)
+    raw = np.fromfile(os.path.join(launch_dir(launch_id), meta["file"]), dtype=dtype,
+                      count=max(stop - start, 0), offset=start * dtype.itemsize)
+    return encoding.decode(raw)
+
+# Row range [first, last) of the blocks overlapping [start, stop] seconds
+def _block_rows(index, length, start, stop):
+    blocks = np.flatnonzero((index["t_max"] >= start) & (index["t_min"] <= stop))
+    if not len(blocks):
+        return 0, 0
+    size = index["block_samples"]
+    return int(blocks[0]) * size, min((int(blocks[-1]) + 1) * size, length)
+
+# Just the requested channels between start and stop seconds (inclusive), as
+# (time, {name: values}). Launches with a time index only read the blocks that
+# overlap the range; older launches are read whole and filtered.
+def query_launch(launch_id, launch, channels=None, start=-np.inf, stop=np.inf):
+    index = load_launch_index(launch_id, launch)
+    if index is None:
+        field_data = read_launch_samples(launch_id, launch)
+        length = min((len(values) for values in field_data.values()), default=0)
+        time = field_data.pop(TIME_COLUMN, np.arange(length, dtype=np.float64))[:length]
+        mask = (time >= start) & (time <= stop)
+        names = channels or list(field_data)
+        return time[mask], {name: field_data[name][:length][mask] for name in names if name in field_data}
+
+    samples = launch["samples"]
+    first, last = _block_rows(index, samples["length"], start, stop)
+    time = _read_column(launch_id, samples["channels"][TIME_COLUMN], first, last)
+    lo, hi = np.searchsorted(time, start, side="left"), np.searchsorted(time, stop, side="right")
+    names = channels or [name for name in samples["channels"] if name != TIME_COLUMN]
+    result = {}
+    for name in names:
+        if name in samples["channels"]:
+            result[name] = _read_column(launch_id, samples["channels"][name], first + lo, first + hi)
+    return time[lo:hi], result
+
+# Number of rows a query over [start, stop] would read, from the index alone
+def query_rows(launch_id, launch, start=-np.inf, stop=np.inf):
+    index = load_launch_index(launch_id, launch)
+    if index is None:
+        return (launch.get("samples") or {}).get("length", len(launch.get("data", [])))
+    first, last = _block_rows(index, launch["samples"]["length"], start, stop)
+    return last - first
+
+# Per-block statistics of one channel over [start, stop] without reading any
+# samples: {"t_min", "t_max", "min", "max", "mean", "count"} arrays, one entry per block
+def query_block_stats(launch_id, launch, channel, start=-np.inf, stop=np.inf):
+    index = load_launch_index(launch_id, launch)
+    if index is None or f"{channel}.min" not in index:
+        return None
+    blocks = (index["t_max"] >= start) & (index["t_min"] <= stop)
+    count = index[f"{channel}.count"][blocks]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = index[f"{channel}.sum"][blocks] / count
+    return {
+        "t_min": index["t_min"][blocks],
+        "t_max": index["t_max"][blocks],
+        "min": index[f"{channel}.min"][blocks],
+        "max": index[f"{channel}.max"][blocks],
+        "mean": mean,
+        "count": count,
+    }
+
+def _parse_legacy_lines(lines):
+    field_data = {}
+    for line in lines:
+        for pair in line.split(","):
+            key, value = pair.split(":")
+            field_data.setdefault(key, []).append(float(value))
+    return {key: np.array(values) for key, values in field_data.items()}
+
+# Decode a launch's samples to float64 arrays, for both compact and legacy text launches
+def read_launch_samples(launch_id, launch):
+    samples = launch.get("samples")
+    if samples is None:
+        return _parse_legacy_lines(launch.get("data", []))
+
+    directory = launch_dir(launch_id)
+    length = samples["length"]
+    channels = {}
+    for name, meta in samples["channels"].items():
+        encoding = ChannelEncoding.from_dict(meta)
+        raw = np.fromfile(os.path.join(directory, meta["file"]), dtype=_little_endian(encoding.dtype), count=length)
+        channels[name] = encoding.decode(raw)
+    return channels
+
+# Text lines in the flight computer's own format, used for downloads
+def launch_lines(launch_id, launch):
+    if "samples" not in launch:
+        return list(launch.get("data", []))
+
+    channels = read_launch_samples(launch_id, launch)
+    names = [name for name in channels if name != TIME_COLUMN]
+    return [
+        ",".join(f"{name}:{round(float(value), 6)}" for name, value in zip(names, row))
+        for row in zip(*(channels[name] for name in names))
+    ]
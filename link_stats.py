@@ -0,0 +1,121 @@
+from collections import deque
+import statistics
+
+# Per-source packet accounting. Uses the sequence number when the flight computer
+# sends one, otherwise infers gaps from arrival times against the nominal interval.
+class SourceLinkStats:
+    def __init__(self, name, expected_rate=0.0, sequence_modulus=65536, window=64):
+        self.name = name
+        self.sequence_modulus = sequence_modulus
+        self.received = 0
+        self.dropped = 0         # Gaps in the sequence (radio / flight computer side)
+        self.inferred_gaps = 0   # Gaps inferred from timing when there is no sequence number
+        self.duplicates = 0
+        self.out_of_order = 0
+        self.resyncs = 0         # Sequence counter restarts, e.g. a flight computer reboot
+        self.serial_errors = 0   # Undecodable or truncated lines from the serial layer
+        self.next_sequence = None
+        self.recent = deque(maxlen=window)
+        self.missing = deque(maxlen=window)
+        self.last_time = None
+        self.intervals = deque(maxlen=32)
+        if expected_rate:
+            self.intervals.append(1.0 / expected_rate)
+
+    def observe(self, sequence, arrival_time):
+        self.received += 1
+        if sequence == sequence:  # Not NaN
+            self._observe_sequence(int(sequence))
+        else:
+            self._observe_timing(arrival_time)
+
+    def _observe_sequence(self, sequence):
+        modulus = self.sequence_modulus
+        if self.next_sequence is not None:
+            delta = (sequence - self.next_sequence) % modulus
+            if delta >= modulus // 2:
+                if modulus - delta > self.recent.maxlen:
+                    # Too far behind to be a late packet: the counter restarted, follow it
+                    self.resyncs += 1
+                    self.recent.clear()
+                    self.missing.clear()
+                    self.recent.append(sequence)
+                    self.next_sequence = (sequence + 1) % modulus
+                    return
+                # Behind the expected sequence: a repeat or a late packet
+                if sequence in self.recent:
+                    self.duplicates += 1
+                    return
+                self.out_of_order += 1
+                if sequence in self.missing:
+                    self.missing.remove(sequence)
+                    self.dropped -= 1
+                # Remembered so a repeat of the late packet counts as a duplicate
+                self.recent.append(sequence)
+                return
+            if delta:
+                self.dropped += delta
+                for i in range(max(0, delta - self.missing.maxlen), delta):
+                    self.missing.append((self.next_sequence + i) % modulus)
+        self.recent.append(sequence)
+        self.next_sequence = (sequence + 1) % modulus
+
+    def _observe_timing(self, arrival_time):
+        if self.last_time is not None:
+            dt = arrival_time - self.last_time
+            if self.intervals:
+                nominal = statistics.median(self.intervals)
+                if nominal > 0 and dt > 1.5 * nominal:
+                    self.inferred_gaps += int(round(dt / nominal)) - 1
+            if dt > 0:
+                self.intervals.append(dt)
+        self.last_time = arrival_time
+
+    def summary(self):
+        lost = self.dropped + self.inferred_gaps
+        expected = self.received - self.duplicates + lost
+        return {
+            "received": self.received,
+            "dropped": self.dropped,
+            "inferred_gaps": self.inferred_gaps,
+            "duplicates": self.duplicates,
+            "out_of_order": self.out_of_order,
+            "resyncs": self.resyncs,
+            "serial_errors": self.serial_errors,
+            "delivery_ratio": (self.received - self.duplicates) / expected if expected else 1.0,
+        }
+
+class LinkStats:
+    def __init__(self, expected_rate=0.0):
+        self.expected_rate = expected_rate
+        self.sources = {}
+
+    def source(self, name):
+        if name not in self.sources:
+            self.sources[name] = SourceLinkStats(name, self.expected_rate)
+        return self.sources[name]
+
+    # Combined view across sources plus parser-side rejects, as shown and archived
+    def summary(self, parser_counters=None):
+        totals = {"received": 0, "dropped": 0, "inferred_gaps": 0, "duplicates": 0,
+                  "out_of_order": 0, "resyncs": 0, "serial_errors": 0}
+        sources = {}
+        for name, source in self.sources.items():
+            sources[name] = source.summary()
+            for key in totals:
+                totals[key] += sources[name][key]
+        lost = totals["dropped"] + totals["inferred_gaps"]
+        expected = totals["received"] - totals["duplicates"] + lost
+        totals["delivery_ratio"] = (totals["received"] - totals["duplicates"]) / expected if expected else 1.0
+        totals["sources"] = sources
+        if parser_counters is not None:
+            totals["parser"] = dict(parser_counters)
+        return totals
+
+def format_link_summary(summary):
+    parser = summary.get("parser", {})
+    parse_errors = parser.get("lines_rejected", 0) + parser.get("fields_malformed", 0)
+    return (f"Link {summary['delivery_ratio'] * 100:.1f}% | rx {summary['received']} | "
+            f"lost {summary['dropped']} (+{summary['inferred_gaps']} inferred) | "
+            f"dup {summary['duplicates']} | ooo {summary['out_of_order']} | "
+            f"serial err {summary['serial_errors']} | parse err {parse_errors}")
@@ -0,0 +1,34 @@
+import pyqtgraph as pg
+
+# All plot groups stacked in one GraphicsLayoutWidget: one scene and one repaint
+# per frame instead of one per PlotWidget, and every x axis linked to the top plot
+# so a single range change moves them all. Only the bottom plot shows time labels.
+class MultiChannelPlot(pg.GraphicsLayoutWidget):
+    def __init__(self, groups, parent=None):
+        super().__init__(parent)
+        self.plot_items = {}
+        master = None
+        for i, (group, channels) in enumerate(groups.items()):
+            if i:
+                self.nextRow()
+            plot_item = self.addPlot(title=group)
+            plot_item.setLabel("left", group, channels[0].unit)
+            plot_item.showGrid(x=True, y=False, alpha=0.2)
+            if master is None:
+                master = plot_item
+            else:
+                plot_item.setXLink(master)
+            if i < len(groups) - 1:
+                plot_item.getAxis("bottom").setStyle(showValues=False)
+            self.plot_items[group] = plot_item
+        if master is not None:
+            plot_item.setLabel("bottom", "Time", "s")
+        self.master = master
+
+    def items(self):
+        return self.plot_items.items()
+
+    # One x range for every plot, linked plots follow the master
+    def set_x_range(self, start, stop):
+        if self.master is not None:
+            self.master.setXRange(start, stop, padding=0)
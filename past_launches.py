@@ -1,68 +1,187 @@
-import os
-import json
+import time
 from collections import OrderedDict
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-                             QScrollArea, QFileDialog)
-from PyQt5.QtCore import Qt
-
-LAUNCH_DATA_FILE = "past_launches.json"
+                             QScrollArea, QFileDialog, QCheckBox, QComboBox, QLabel)
+from PyQt5.QtGui import QDoubleValidator
+from PyQt5.QtCore import Qt, QTimer
+from launch_storage import launch_lines
+from launch_compare import ALIGNMENTS
+from launch_catalog import LAUNCH_CATALOG_FILE, PAGE_SIZE
+from archive_service import ArchiveService
+
+LAUNCH_DATA_FILE = "past_launches.json"  # Archive index before the catalog, imported on first open
+RENAME_DELAY_MS = 500  # Renames made within this long of each other are written together
+DATE_RANGES = [("Any time", None), ("Last 7 days", 7), ("Last 30 days", 30), ("Last 365 days", 365)]
+
+_archive = None
+
+# The one archive service of the process, started on first use
+def get_archive():
+    global _archive
+    if _archive is None:
+        _archive = ArchiveService(LAUNCH_CATALOG_FILE, LAUNCH_DATA_FILE)
+    return _archive
+
+# Finish pending writes and close the archive
+def close_archive():
+    global _archive
+    if _archive is not None:
+        _archive.stop()
+        _archive = None
 
 # Load past launch data
 def load_past_launches():
-    if os.path.exists(LAUNCH_DATA_FILE):
-        with open(LAUNCH_DATA_FILE, "r") as f:
-            return json.load(f)
-    return {}
+    return get_archive().all_launches()
 
-# Save past launch data
+# Save past launch data (queued on the archive's writer thread)
 def save_past_launches(data):
-    with open(LAUNCH_DATA_FILE, "w") as f:
-        json.dump(data, f, indent=4)
+    get_archive().add_launches_async(data)
 
 class PastLaunchesScreen(QWidget):
-    def __init__(self, switch_to_summary, switch_to_main_menu):
+    def __init__(self, switch_to_summary, switch_to_main_menu, switch_to_comparison=None):
         super().__init__()
         self.layout = QVBoxLayout(self)
 
         self.switch_to_summary = switch_to_summary
         self.switch_to_main_menu = switch_to_main_menu
-
-        # Load past launches
-        self.past_launches = load_past_launches()
+        self.switch_to_comparison = switch_to_comparison
+        self.compare_boxes = {}  # launch_id -> "Compare" checkbox
+
+        # Renames wait briefly so a burst of edits becomes one catalog write
+        self.pending_renames = {}
+        self.rename_timer = QTimer(self)
+        self.rename_timer.setSingleShot(True)
+        self.rename_timer.setInterval(RENAME_DELAY_MS)
+        self.rename_timer.timeout.connect(self.flush_renames)
+
+        # The page of launches currently listed, oldest first
+        self.past_launches = OrderedDict()
+        self.page = 0
+        self.page_request = 0  # Only the latest search's results are shown
+        self.shown_request = 0  # The search whose results are listed
+
+        # Search and filter the catalog
+        search_layout = QHBoxLayout()
+        self.search_field = QLineEdit()
+        self.search_field.setPlaceholderText("Search names")
+        self.search_field.returnPressed.connect(self.run_search)
+        search_layout.addWidget(self.search_field)
+        self.date_combo = QComboBox()
+        self.date_combo.addItems([label for label, _ in DATE_RANGES])
+        self.date_combo.currentIndexChanged.connect(self.run_search)
+        search_layout.addWidget(self.date_combo)
+        self.apogee_field = QLineEdit()
+        self.apogee_field.setPlaceholderText("Apogee above (m)")
+        self.apogee_field.setValidator(QDoubleValidator())
+        self.apogee_field.returnPressed.connect(self.run_search)
+        search_layout.addWidget(self.apogee_field)
+        search_button = QPushButton("Search")
+        search_button.clicked.connect(self.run_search)
+        search_layout.addWidget(search_button)
+        self.layout.addLayout(search_layout)
+
+        # Archive errors (failed saves, renames, searches) are shown here
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: #cc0000;")
+        self.layout.addWidget(self.status_label)
+        get_archive().failed.connect(self.on_archive_failed)
 
         # Scrollable area for past launches
         self.scroll_area = QScrollArea()
         self.scroll_widget = QWidget()
         self.scroll_layout = QVBoxLayout(self.scroll_widget)
 
-        self.populate_launches()
-
         self.scroll_widget.setLayout(self.scroll_layout)
         self.scroll_area.setWidget(self.scroll_widget)
         self.scroll_area.setWidgetResizable(True)
         self.layout.addWidget(self.scroll_area)
 
+        # Results are paged so the list stays small however big the archive gets
+        page_layout = QHBoxLayout()
+        self.prev_button = QPushButton("Previous")
+        self.prev_button.clicked.connect(lambda: self.show_page(self.page - 1))
+        page_layout.addWidget(self.prev_button)
+        self.page_label = QLabel()
+        self.page_label.setAlignment(Qt.AlignCenter)
+        page_layout.addWidget(self.page_label)
+        self.next_button = QPushButton("Next")
+        self.next_button.clicked.connect(lambda: self.show_page(self.page + 1))
+        page_layout.addWidget(self.next_button)
+        self.layout.addLayout(page_layout)
+
+        # Overlay the ticked launches, aligned on a flight event
+        if switch_to_comparison is not None:
+            compare_layout = QHBoxLayout()
+            compare_layout.addWidget(QLabel("Align on:"))
+            self.align_combo = QComboBox()
+            self.align_combo.addItems(ALIGNMENTS)
+            compare_layout.addWidget(self.align_combo)
+            self.deltas_box = QCheckBox("Show difference to first")
+            compare_layout.addWidget(self.deltas_box)
+            compare_button = QPushButton("Compare Selected")
+            compare_button.clicked.connect(self.compare_selected)
+            compare_layout.addWidget(compare_button)
+            self.layout.addLayout(compare_layout)
+
         # Add "Return to Main Menu" button
         back_button = QPushButton("Return to Main Menu", self)
         back_button.setStyleSheet("font-size: 18px; padding: 10px;")
         back_button.clicked.connect(switch_to_main_menu)
         self.layout.addWidget(back_button)
 
+        self.show_page(0)
+
+    # Catalog filters from the search controls
+    def filters(self):
+        filters = {"text": self.search_field.text().strip() or None}
+        days = DATE_RANGES[self.date_combo.currentIndex()][1]
+        if days is not None:
+            filters["since"] = time.time() - days * 86400
+        try:
+            filters["apogee_above"] = float(self.apogee_field.text())
+        except ValueError:
+            pass
+        return filters
+
+    def run_search(self):
+        self.status_label.setText("")
+        self.show_page(0)
+
+    # Queried on an archive reader thread; the list updates when the page arrives
+    def show_page(self, page):
+        self.flush_renames()
+        filters = self.filters()
+        self.page_request += 1
+        request = self.page_request
+        get_archive().read_async(lambda catalog: catalog.page(page, PAGE_SIZE, **filters),
+                                 lambda result: self.show_results(request, result))
+
+    def show_results(self, request, result):
+        if request != self.page_request:
+            return
+        self.shown_request = request
+        total, pages, self.page, self.past_launches = result
+        self.page_label.setText(f"Page {self.page + 1} of {pages} ({total} launches)")
+        self.prev_button.setEnabled(self.page > 0)
+        self.next_button.setEnabled(self.page < pages - 1)
+        self.populate_launches()
+
     def populate_launches(self):
-        print("Populating launches...")
-        print("Current launches:", self.past_launches)  # Debug
-
-        # Clear current launches
-        for i in reversed(range(self.scroll_layout.count())):
-            item = self.scroll_layout.itemAt(i)
-            widget = item.widget()
-            if widget:  # Only call setParent if the item has a widget
+        self.compare_boxes = {}
+
+        # Clear current launches (each row is one widget, see below)
+        while self.scroll_layout.count():
+            widget = self.scroll_layout.takeAt(0).widget()
+            if widget:
                 widget.setParent(None)
+                widget.deleteLater()
 
         # Add launches in reverse order for newest first
         for launch_id, launch in reversed(self.past_launches.items()):
-            print(f"Adding launch: {launch_id}")  # Debug
-            launch_layout = QHBoxLayout()
+            # A widget per row so clearing the list removes the whole row
+            row = QWidget()
+            launch_layout = QHBoxLayout(row)
+            launch_layout.setContentsMargins(0, 0, 0, 0)
 
             # Editable name field
             name_field = QLineEdit(launch.get("name", launch_id))
@@ -79,42 +198,54 @@ class PastLaunchesScreen(QWidget):
             download_button.clicked.connect(lambda _, id=launch_id: self.download_data(id))
             launch_layout.addWidget(download_button)
 
-            self.scroll_layout.addLayout(launch_layout)
+            # Compare checkbox
+            compare_box = QCheckBox("Compare")
+            self.compare_boxes[launch_id] = compare_box
+            launch_layout.addWidget(compare_box)
 
+            self.scroll_layout.addWidget(row)
 
+    # editingFinished also fires on focus changes and for rows of a page being
+    # replaced, so unchanged names and launches no longer listed are ignored
     def rename_launch(self, launch_id, new_name):
+        if launch_id not in self.past_launches or self.past_launches[launch_id].get("name", launch_id) == new_name:
+            return
         self.past_launches[launch_id]["name"] = new_name
-        save_past_launches(self.past_launches)
+        self.pending_renames[launch_id] = new_name
+        self.rename_timer.start()
+
+    def flush_renames(self):
+        self.rename_timer.stop()
+        if self.pending_renames:
+            get_archive().rename_many_async(self.pending_renames)
+            self.pending_renames = {}
+
+    def hideEvent(self, event):
+        self.flush_renames()
+        super().hideEvent(event)
 
     def download_data(self, launch_id):
         filename, _ = QFileDialog.getSaveFileName(self, "Save Launch Data", f"{launch_id}.txt", "Text Files (*.txt)")
         if filename:
             with open(filename, "w") as file:
-                file.write("\n".join(self.past_launches[launch_id]["data"]))
-
-    def add_new_launch(self, launch_id, launch_data):
-        # Store the new launch at the beginning of the dictionary
-        self.past_launches[launch_id] = launch_data
-        save_past_launches(self.past_launches)
+                # The listed launch is metadata only, the samples come with the full entry
+                file.write("\n".join(launch_lines(launch_id, get_archive().get(launch_id))))
 
-        # Create and insert only the new launch UI at the top
-        launch_layout = QHBoxLayout()
+    # Ticked launches in archive order, the first one is the reference for differences
+    def compare_selected(self):
+        launch_ids = [launch_id for launch_id in self.past_launches
+                      if launch_id in self.compare_boxes and self.compare_boxes[launch_id].isChecked()]
+        if len(launch_ids) < 2:
+            print("Select at least two launches to compare.")
+            return
+        self.switch_to_comparison(launch_ids, self.align_combo.currentText(), self.deltas_box.isChecked())
 
-        # Editable name field
-        name_field = QLineEdit(launch_data.get("name", launch_id))
-        name_field.editingFinished.connect(lambda id=launch_id, field=name_field: self.rename_launch(id, field.text()))
-        launch_layout.addWidget(name_field)
+    def on_archive_failed(self, operation, message):
+        self.status_label.setText(f"Archive {operation} failed: {message}")
 
-        # View button
-        view_button = QPushButton("View")
-        view_button.clicked.connect(lambda _, id=launch_id: self.switch_to_summary(id))
-        launch_layout.addWidget(view_button)
-
-        # Download button
-        download_button = QPushButton("Download")
-        download_button.clicked.connect(lambda _, id=launch_id: self.download_data(id))
-        launch_layout.addWidget(download_button)
-
-        # Insert new launch at the top of the UI
-        self.scroll_layout.insertLayout(0, launch_layout)
+    def on_save_failed(self, launch_id, message):
+        self.status_label.setText(f"Launch {launch_id} was not saved: {message}")
 
+    # A launch was just saved to the catalog: go back to the first page so it shows at the top
+    def add_new_launch(self, launch_id, launch_data):
+        self.show_page(0)
@@ -0,0 +1,145 @@
+import os
+import sys
+import tty
+import time
+import errno
+import argparse
+import itertools
+import threading
+from synthetic_flight import generate_flight_lines
+
+WRITE_CHUNK_BYTES = 16  # Bytes per write, so readers see lines split across reads
+
+# Local stand-in for the flight computer: plays telemetry lines into a Linux pty
+# at real UART timing (8N1, 10 bits per byte at the configured baud rate).
+# The dashboard connects to `device_path` exactly like a USB serial adapter.
+# Like a real UART, bytes the reader does not pick up in time are dropped once the
+# kernel buffer is full and counted as overrun, unless `block` is set.
+class PtyStandIn:
+    def __init__(self, lines, baudrate=9600, line_rate=None, loop=True, block=False,
+                 line_ending=b"\r\n", chunk_bytes=WRITE_CHUNK_BYTES):
+        self.lines = lines
+        self.baudrate = baudrate
+        self.line_rate = line_rate  # Optional cap in lines/s on top of the baud limit
+        self.loop = loop
+        self.block = block
+        self.line_ending = line_ending
+        self.chunk_bytes = chunk_bytes
+
+        self.master_fd, self.slave_fd = os.openpty()
+        # Raw mode: no echo and no newline translation on the reader's side
+        tty.setraw(self.slave_fd)
+        os.set_blocking(self.master_fd, block)
+        self.device_path = os.ttyname(self.slave_fd)
+
+        self.lines_sent = 0
+        self.bytes_sent = 0
+        self.overrun_bytes = 0
+        self.late_s = 0.0  # How far the writer fell behind its schedule in total
+        self.running = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.running.set()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self.device_path
+
+    def stop(self):
+        self.running.clear()
+        if self.thread is not None:
+            self.thread.join()
+
+    def close(self):
+        self.stop()
+        os.close(self.master_fd)
+        os.close(self.slave_fd)
+
+    def _write(self, data):
+        try:
+            written = os.write(self.master_fd, data)
+        except BlockingIOError:
+            written = 0
+        except OSError as e:
+            if e.errno != errno.EIO:
+                raise
+            written = 0
+        self.bytes_sent += written
+        self.overrun_bytes += len(data) - written
+
+    def _run(self):
+        byte_time = 10.0 / self.baudrate
+        min_line_time = 1.0 / self.line_rate if self.line_rate else 0.0
+        lines = itertools.cycle(self.lines) if self.loop else iter(self.lines)
+        next_time = time.perf_counter()
+
+        for line in lines:
+            if not self.running.is_set():
+                break
+            data = line.encode("utf-8") + self.line_ending
+            line_start = next_time
+            for i in range(0, len(data), self.chunk_bytes):
+                chunk = data[i:i + self.chunk_bytes]
+                next_time += len(chunk) * byte_time
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    self.late_s -= delay
+                self._write(chunk)
+            next_time = max(next_time, line_start + min_line_time)
+            self.lines_sent += 1
+        self.running.clear()
+
+    def stats(self):
+        return {
+            "lines_sent": self.lines_sent,
+            "bytes_sent": self.bytes_sent,
+            "overrun_bytes": self.overrun_bytes,
+            "late_s": self.late_s,
+        }
+
+def load_lines(args):
+    if args.file:
+        with open(args.file, "r") as f:
+            return [line.strip() for line in f if line.strip()]
+    if args.launch:
+        from past_launches import get_archive
+        from launch_storage import launch_lines
+        launch = get_archive().get(args.launch)
+        if launch is None:
+            sys.exit(f"Launch ID {args.launch} not found.")
+        return launch_lines(args.launch, launch)
+    return list(generate_flight_lines(args.samples, rate=args.sample_rate,
+                                      sequence_key="Seq" if args.sequence else None))
+
+def main():
+    parser = argparse.ArgumentParser(description="Play telemetry into a pty at serial baud-rate timing.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--file", help="Text file of telemetry lines (e.g. a downloaded launch)")
+    source.add_argument("--launch", help="Replay an archived launch by ID")
+    parser.add_argument("--samples", type=int, default=20000, help="Synthetic lines to generate")
+    parser.add_argument("--sample-rate", type=float, default=100.0, help="Synthetic flight sample rate (Hz)")
+    parser.add_argument("--sequence", action="store_true", help="Append a Seq field to synthetic lines")
+    parser.add_argument("--baud", type=int, default=9600)
+    parser.add_argument("--line-rate", type=float, help="Cap on lines per second")
+    parser.add_argument("--once", action="store_true", help="Stop at the end instead of looping")
+    parser.add_argument("--block", action="store_true",
+                        help="Wait for the reader instead of dropping bytes when the pty buffer is full")
+    args = parser.parse_args()
+
+    standin = PtyStandIn(load_lines(args), args.baud, args.line_rate, not args.once, args.block)
+    print(f"Serving telemetry on {standin.start()} at {args.baud} baud (Ctrl+C to stop)")
+    print(f"Connect with: python dashboard.py --port {standin.device_path}")
+    try:
+        while standin.running.is_set():
+            time.sleep(1.0)
+            print(standin.stats(), flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        standin.close()
+        print(standin.stats())
+
+if __name__ == "__main__":
+    main()
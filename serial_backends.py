@@ -0,0 +1,169 @@
+import os
+import time
+import asyncio
+import threading
+import serial
+
+READ_CHUNK_SIZE = 4096
+HIGH_WATER_LINES = 2048  # Stop reading a port when this many lines are waiting
+LOW_WATER_LINES = 256    # ... and resume once the consumer has caught up to here
+MAX_LINE_BYTES = 4096
+
+# Splits a byte stream into complete lines, keeping partial lines across reads
+class LineFramer:
+    def __init__(self, delimiter=b"\n", max_line_bytes=MAX_LINE_BYTES):
+        self.delimiter = delimiter
+        self.max_line_bytes = max_line_bytes
+        self.buffer = b""
+        self.overflows = 0
+
+    def feed(self, data):
+        self.buffer += data
+        *lines, self.buffer = self.buffer.split(self.delimiter)
+        if len(self.buffer) > self.max_line_bytes:
+            # No delimiter in sight, drop the garbage rather than grow forever
+            self.buffer = b""
+            self.overflows += 1
+        return lines
+
+# One serial port read with non-blocking reads driven by the hub's event loop
+class _AsyncSerialSource:
+    def __init__(self, hub, port, on_line, on_error, delimiter, serial_kwargs):
+        self.hub = hub
+        self.port = port
+        self.on_line = on_line
+        self.on_error = on_error
+        self.ser = serial.Serial(port=port, timeout=0, **serial_kwargs)
+        self.fd = self.ser.fileno()
+        self.framer = LineFramer(delimiter)
+        self.pending = asyncio.Queue()
+        self.reading = False
+        self.paused_count = 0
+        self.consumer = None
+
+    def start(self):
+        self._resume_reading()
+        self.consumer = self.hub.loop.create_task(self._consume())
+
+    def _resume_reading(self):
+        if not self.reading:
+            self.hub.loop.add_reader(self.fd, self._on_readable)
+            self.reading = True
+
+    def _pause_reading(self):
+        if self.reading:
+            # Leave further bytes in the kernel/driver buffer until we catch up
+            self.hub.loop.remove_reader(self.fd)
+            self.reading = False
+            self.paused_count += 1
+
+    def _on_readable(self):
+        try:
+            data = os.read(self.fd, self.hub.read_chunk_size)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            self.hub.loop.create_task(self.hub.remove_source(self.port, e))
+            return
+        if not data:
+            self.hub.loop.create_task(self.hub.remove_source(self.port, EOFError(f"{self.port} closed")))
+            return
+
+        arrival_time = self.hub.clock()
+        for line in self.framer.feed(data):
+            self.pending.put_nowait((line, arrival_time))
+        if self.pending.qsize() >= self.hub.high_water:
+            self._pause_reading()
+
+    async def _consume(self):
+        while True:
+            line, arrival_time = await self.pending.get()
+            self.on_line(line, arrival_time)
+            # Drain whatever else is already queued before yielding to the loop
+            while not self.pending.empty():
+                line, arrival_time = self.pending.get_nowait()
+                self.on_line(line, arrival_time)
+            if not self.reading and self.pending.qsize() <= self.hub.low_water:
+                self._resume_reading()
+
+    def close(self):
+        if self.reading:
+            self.hub.loop.remove_reader(self.fd)
+            self.reading = False
+        if self.consumer is not None:
+            self.consumer.cancel()
+        self.ser.close()
+
+# Runs every serial source on a single asyncio event-loop thread. Reads are
+# non-blocking (selector on the port's file descriptor), so stop() returns as
+# soon as the loop processes it instead of waiting out a read timeout.
+# POSIX only: pyserial exposes fileno() for ttys and ptys, not Windows COM ports.
+class AsyncioSerialHub:
+    def __init__(self, clock=time.time, read_chunk_size=READ_CHUNK_SIZE,
+                 high_water=HIGH_WATER_LINES, low_water=LOW_WATER_LINES):
+        self.clock = clock
+        self.read_chunk_size = read_chunk_size
+        self.high_water = high_water
+        self.low_water = low_water
+        self.loop = None
+        self.thread = None
+        self.sources = {}
+
+    @staticmethod
+    def is_supported():
+        return os.name == "posix"
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self):
+        if self.is_running():
+            return
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(ready,), daemon=True)
+        self.thread.start()
+        ready.wait()
+
+    def _run(self, ready):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(ready.set)
+        self.loop.run_forever()
+        self.loop.close()
+
+    # Open a port on the loop thread; on_line(raw_line, arrival_time) is called on
+    # that thread for every complete line, on_error(port, exc) when the port fails.
+    # serial_kwargs (baudrate, bytesize, ...) are passed through to serial.Serial.
+    def add_source(self, port, on_line, on_error=None, delimiter=b"\n", **serial_kwargs):
+        return asyncio.run_coroutine_threadsafe(
+            self._add_source(port, on_line, on_error, delimiter, serial_kwargs), self.loop
+        )
+
+    async def _add_source(self, port, on_line, on_error, delimiter, serial_kwargs):
+        if port in self.sources:
+            return self.sources[port]
+        source = _AsyncSerialSource(self, port, on_line, on_error, delimiter, serial_kwargs)
+        self.sources[port] = source
+        source.start()
+        return source
+
+    async def remove_source(self, port, error=None):
+        source = self.sources.pop(port, None)
+        if source is None:
+            return
+        source.close()
+        if source.consumer is not None:
+            await asyncio.gather(source.consumer, return_exceptions=True)
+        if error is not None and source.on_error is not None:
+            source.on_error(port, error)
+
+    async def _shutdown(self):
+        for port in list(self.sources):
+            await self.remove_source(port)
+        self.loop.stop()
+
+    def stop(self, timeout=2.0):
+        if not self.is_running():
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
+        self.thread.join(timeout)
@@ -0,0 +1,66 @@
+import numpy as np
+
+# Deterministic synthetic flight telemetry for benchmarks and the pty stand-in.
+# A cycle is pad -> boost -> coast -> descent -> landed, repeated for long datasets.
+PAD_S = 10.0
+BOOST_S = 3.0
+BOOST_ACCEL = 80.0      # m/s^2
+DESCENT_RATE = -8.0     # m/s under parachute
+LANDED_S = 10.0
+G = 9.81
+
+def _cycle_profile(t):
+    apogee_t = BOOST_S + BOOST_ACCEL * BOOST_S / G
+    burnout_v = BOOST_ACCEL * BOOST_S
+    burnout_alt = 0.5 * BOOST_ACCEL * BOOST_S ** 2
+    apogee_alt = burnout_alt + burnout_v ** 2 / (2 * G)
+    landing_t = apogee_t + apogee_alt / -DESCENT_RATE
+    cycle_s = PAD_S + landing_t + LANDED_S
+
+    t = np.mod(t, cycle_s) - PAD_S
+    velocity = np.zeros_like(t)
+    altitude = np.zeros_like(t)
+
+    boost = (t >= 0) & (t < BOOST_S)
+    velocity[boost] = BOOST_ACCEL * t[boost]
+    altitude[boost] = 0.5 * BOOST_ACCEL * t[boost] ** 2
+
+    coast = (t >= BOOST_S) & (t < apogee_t)
+    tc = t[coast] - BOOST_S
+    velocity[coast] = burnout_v - G * tc
+    altitude[coast] = burnout_alt + burnout_v * tc - 0.5 * G * tc ** 2
+
+    descent = (t >= apogee_t) & (t < landing_t)
+    velocity[descent] = DESCENT_RATE
+    altitude[descent] = apogee_alt + DESCENT_RATE * (t[descent] - apogee_t)
+    return velocity, altitude
+
+# Return (time, {channel: values}) for n samples at the given rate, starting at
+# sample index `start`. Each (seed, start) pair has its own noise stream, so a
+# long dataset can be produced chunk by chunk.
+def generate_flight(n, rate=100.0, seed=0, start=0):
+    rng = np.random.default_rng([seed, start])
+    t = (np.arange(n) + start) / rate
+    velocity, altitude = _cycle_profile(t)
+    velocity += rng.normal(0.0, 0.2, n)
+    altitude += rng.normal(0.0, 0.3, n)
+    temperature = 25.0 - 0.0065 * altitude + rng.normal(0.0, 0.05, n)
+    pressure = 1013.25 * (1.0 - np.clip(altitude, 0.0, None) / 44330.0) ** 5.255 + rng.normal(0.0, 0.05, n)
+    return t, {
+        "Velocity": np.round(velocity, 2),
+        "Altitude": np.round(altitude, 2),
+        "Temperature": np.round(temperature, 2),
+        "Pressure": np.round(pressure, 2),
+    }
+
+# Telemetry lines in the flight computer's format, generated in chunks so that
+# very large datasets never need to be held in memory as strings
+def generate_flight_lines(n, rate=100.0, seed=0, chunk=100000, sequence_key=None):
+    for start in range(0, n, chunk):
+        _, channels = generate_flight(min(chunk, n - start), rate, seed, start)
+        names = list(channels)
+        for i, row in enumerate(zip(*(channels[name].tolist() for name in names))):
+            line = ",".join(f"{name}:{value:.2f}" for name, value in zip(names, row))
+            if sequence_key:
+                line += f",{sequence_key}:{(start + i) % 65536}"
+            yield line
@@ -0,0 +1,85 @@
+import numpy as np
+from channels import TIME_ENCODING
+
+# Growable array of samples kept in a channel's compact storage dtype.
+# Values are only widened to float64 when they are read back for plotting/analysis.
+class CompactSeries:
+    def __init__(self, encoding, capacity=1024):
+        self.encoding = encoding
+        self._raw = np.empty(capacity, dtype=encoding.dtype)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def _reserve(self, extra):
+        needed = self._size + extra
+        if needed > len(self._raw):
+            capacity = max(needed, 2 * len(self._raw))
+            raw = np.empty(capacity, dtype=self._raw.dtype)
+            raw[:self._size] = self._raw[:self._size]
+            self._raw = raw
+
+    def append(self, value):
+        self._reserve(1)
+        self._raw[self._size] = self.encoding.encode(value)
+        self._size += 1
+
+    def extend(self, values):
+        encoded = self.encoding.encode(values)
+        self._reserve(len(encoded))
+        self._raw[self._size:self._size + len(encoded)] = encoded
+        self._size += len(encoded)
+
+    def keep_last(self, n):
+        n = max(0, min(n, self._size))
+        self._raw[:n] = self._raw[self._size - n:self._size]
+        self._size = n
+
+    def clear(self):
+        self._size = 0
+
+    def raw(self):
+        return self._raw[:self._size]
+
+    def to_float64(self, start=0, stop=None):
+        return self.encoding.decode(self.raw()[start:stop])
+
+    def tail(self, n):
+        return self.to_float64(max(self._size - n, 0))
+
+    # Decode up to len(out) most recent samples into out, returning the filled view
+    def tail_into(self, out):
+        n = min(len(out), self._size)
+        return self.encoding.decode(self._raw[self._size - n:self._size], out[:n])
+
+    def nbytes(self):
+        return self._size * self._raw.itemsize
+
+    # Independent copy of the stored samples, safe to hand to another thread
+    def copy(self):
+        copy = CompactSeries(self.encoding, max(self._size, 1))
+        copy._raw[:self._size] = self._raw[:self._size]
+        copy._size = self._size
+        return copy
+
+# Sample-synchronous history: every parsed line is one timestamped row across all
+# channels, so the time column and each channel column always have the same length
+class RecordStore:
+    def __init__(self, schema, capacity=1024):
+        self.time = CompactSeries(TIME_ENCODING, capacity)
+        self.series = [CompactSeries(channel.encoding, capacity) for channel in schema]
+
+    def __len__(self):
+        return len(self.time)
+
+    # times: (n,), rows: (n, width) with columns in channel.index order
+    def append_rows(self, times, rows):
+        self.time.extend(times)
+        for index, series in enumerate(self.series):
+            series.extend(rows[:, index])
+
+    def clear(self):
+        self.time.clear()
+        for series in self.series:
+            series.clear()
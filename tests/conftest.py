@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Tests import the app's flat top-level modules and run Qt without a display
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -0,0 +1,95 @@
+import json
+import threading
+import pytest
+from PyQt5.QtWidgets import QApplication
+import archive_service
+from archive_service import ArchiveService
+from launch_catalog import LaunchCatalog
+
+def launch_id(i):
+    return f"2024-05-01_12-{i // 60:02d}-{i % 60:02d}"
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication([])
+
+@pytest.fixture
+def service(tmp_path):
+    service = ArchiveService(str(tmp_path / "catalog.db"))
+    yield service
+    service.stop()
+
+def test_writes_run_in_order_on_one_thread(service, monkeypatch, app):
+    threads = []
+    rename_many = service.writer_catalog.rename_many
+    def recording_rename_many(names):
+        threads.append(threading.get_ident())
+        rename_many(names)
+    monkeypatch.setattr(service.writer_catalog, "rename_many", recording_rename_many)
+
+    done = []
+    service.add_launches_async({launch_id(0): {"name": "first"}}, lambda _: done.append("add"))
+    for i in range(50):
+        service.rename_many_async({launch_id(0): f"name {i}"}, lambda _, i=i: done.append(i))
+    assert service.flush(5.0)
+    app.processEvents()
+    assert done == ["add"] + list(range(50))
+    assert len(set(threads)) == 1 and threads[0] != threading.get_ident()
+    assert service.get(launch_id(0))["name"] == "name 49"
+
+def test_reads_see_every_earlier_write(service, app):
+    seen = {}
+    for i in range(30):
+        service.add_launches_async({launch_id(i): {"name": str(i)}})
+        service.read_async(lambda catalog: len(catalog), lambda count, i=i: seen.__setitem__(i, count))
+    service.pool.shutdown(wait=True)
+    app.processEvents()
+    # Later writes may also be visible, earlier ones always are
+    assert sorted(seen) == list(range(30))
+    assert all(count >= i + 1 for i, count in seen.items())
+
+def test_stop_finishes_queued_writes(tmp_path):
+    path = str(tmp_path / "catalog.db")
+    service = ArchiveService(path)
+    for i in range(100):
+        service.add_launches_async({launch_id(i): {"name": str(i)}})
+    service.rename_many_async({launch_id(99): "last"})
+    service.stop()
+    catalog = LaunchCatalog(path, readonly=True)
+    assert len(catalog) == 100
+    assert catalog.get(launch_id(99))["name"] == "last"
+    catalog.close()
+
+def test_failed_save_reports_the_error(service, app):
+    failures, errors, saved = [], [], []
+    service.failed.connect(lambda operation, message: failures.append(operation))
+    # No series to write: the save raises on the writer thread
+    service.save_launch_async(launch_id(0), {"name": "broken"}, None, None, saved.append, errors.append)
+    assert service.flush(5.0)
+    app.processEvents()
+    assert failures == ["save"] and len(errors) == 1 and saved == []
+    assert service.get(launch_id(0)) is None
+
+def test_legacy_import_is_the_writers_first_job(tmp_path, monkeypatch, app):
+    legacy = tmp_path / "past_launches.json"
+    with open(legacy, "w") as f:
+        json.dump({launch_id(0): {"name": "old", "data": ["not a telemetry line"]}}, f)
+    threads = []
+    import_legacy_launches = archive_service.import_legacy_launches
+    def recording_import(catalog, legacy_json):
+        threads.append(threading.get_ident())
+        import_legacy_launches(catalog, legacy_json)
+    monkeypatch.setattr(archive_service, "import_legacy_launches", recording_import)
+
+    service = ArchiveService(str(tmp_path / "catalog.db"), str(legacy))
+    try:
+        seen = []
+        service.read_async(lambda catalog: catalog.get(launch_id(0)), seen.append)
+        assert service.flush(5.0)
+        service.pool.shutdown(wait=True)
+        app.processEvents()
+        assert threads and threads[0] == service.thread.ident
+        # The read was queued before the import finished and still saw it
+        assert seen[0]["name"] == "old"
+    finally:
+        service.stop()
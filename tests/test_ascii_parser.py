@@ -0,0 +1,43 @@
+import math
+import os
+from ascii_parser import AsciiParser
+from channels import load_channel_schema
+
+SCHEMA = load_channel_schema(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "channels.json"))
+
+def parse(line):
+    parser = AsciiParser(SCHEMA)
+    row = parser.new_row()
+    parsed = parser.parse_into(line, row)
+    return parser, row, parsed
+
+def value(row, name):
+    return row[SCHEMA[name].index]
+
+def test_well_formed_line():
+    parser, row, parsed = parse("Velocity:1.5,Altitude:20")
+    assert parsed == 2
+    assert value(row, "Velocity") == 1.5
+    assert value(row, "Altitude") == 20.0
+    assert parser.fields_malformed == 0
+
+def test_field_with_two_colons_is_malformed():
+    parser, row, parsed = parse("Velocity:1:2,Altitude")
+    assert parsed == 0
+    assert math.isnan(value(row, "Velocity"))
+    assert parser.fields_malformed == 2
+    assert parser.fields_unknown == 0
+    assert parser.lines_rejected == 1
+
+def test_bad_field_does_not_reject_the_line():
+    parser, row, parsed = parse("Velocity:1:2,Altitude:7")
+    assert parsed == 1
+    assert value(row, "Altitude") == 7.0
+    assert math.isnan(value(row, "Velocity"))
+    assert parser.fields_malformed == 1
+
+def test_unknown_and_non_numeric_fields_are_counted():
+    parser, row, parsed = parse("Velocity:abc,Pressure2:3,Altitude:4")
+    assert parsed == 1
+    assert parser.fields_malformed == 1
+    assert parser.fields_unknown == 1
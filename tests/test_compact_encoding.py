@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from channels import ChannelEncoding
+from telemetry_store import CompactSeries
+
+def round_trip(encoding, values):
+    return encoding.decode(encoding.encode(values))
+
+def test_nan_is_stored_as_the_sentinel():
+    encoding = ChannelEncoding("int16", scale=0.1)
+    raw = encoding.encode([1.0, np.nan, -2.5])
+    assert raw.dtype == np.int16 and raw[1] == np.iinfo(np.int16).min
+    decoded = encoding.decode(raw)
+    assert np.isnan(decoded[1]) and not np.isnan(decoded[[0, 2]]).any()
+    # Float storage keeps NaN as it is
+    assert np.isnan(round_trip(ChannelEncoding("float32"), [np.nan])[0])
+
+@pytest.mark.parametrize("dtype", ["int8", "int16", "int32", "uint16"])
+def test_out_of_range_values_clip_to_the_dtype_limits(dtype):
+    encoding = ChannelEncoding(dtype, scale=0.5, offset=10.0)
+    info = np.iinfo(dtype)
+    top = info.max * 0.5 + 10.0
+    bottom = (info.min + 1) * 0.5 + 10.0  # The minimum itself is the NaN sentinel
+    decoded = round_trip(encoding, [top * 10 + 1e6, -abs(bottom) * 10 - 1e6, top, bottom])
+    assert decoded.tolist() == [top, bottom, top, bottom]
+    assert not np.isnan(decoded).any()
+
+@pytest.mark.parametrize("dtype, scale, offset", [("int16", 0.1, 0.0), ("int16", 0.01, 100.0),
+                                                  ("int32", 0.001, -50.0), ("uint8", 1.0, 0.0)])
+def test_values_round_trip_within_half_a_scale_step(dtype, scale, offset):
+    encoding = ChannelEncoding(dtype, scale, offset)
+    info = np.iinfo(dtype)
+    low, high = (info.min + 1) * scale + offset, info.max * scale + offset
+    values = np.random.default_rng(0).uniform(low, high, 10000)
+    error = np.abs(round_trip(encoding, values) - values)
+    assert error.max() <= scale / 2 * (1 + 1e-9)
+
+def test_encoding_survives_its_dict_form():
+    encoding = ChannelEncoding.from_dict(ChannelEncoding("int16", 0.25, -3.0).to_dict())
+    assert (encoding.dtype, encoding.scale, encoding.offset) == (np.dtype("int16"), 0.25, -3.0)
+
+def test_tail_into_after_the_store_grows():
+    encoding = ChannelEncoding("int16", scale=0.1)
+    series = CompactSeries(encoding, capacity=4)
+    values = np.round(np.linspace(-100.0, 100.0, 1000), 1)
+    values[500] = np.nan
+    for start in range(0, len(values), 7):
+        series.extend(values[start:start + 7])
+    assert len(series) == len(values) and len(series._raw) >= len(values)
+
+    out = np.empty(600)
+    tail = series.tail_into(out)
+    assert np.shares_memory(tail, out)  # Decoded in place, nothing allocated
+    np.testing.assert_allclose(tail, values[-600:], atol=0.05)
+    assert np.isnan(tail[100])
+    # A buffer longer than the store is filled only as far as there are samples
+    assert len(series.tail_into(np.empty(5000))) == len(values)
+
+    series.keep_last(10)
+    series.append(7.5)
+    np.testing.assert_allclose(series.tail_into(np.empty(3)), [values[-2], values[-1], 7.5], atol=0.05)
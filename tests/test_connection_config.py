@@ -0,0 +1,30 @@
+import json
+import pytest
+import serial
+from connection_config import ConnectionConfig, load_connection_config, save_connection_config
+
+def test_serial_kwargs_follow_the_data_format():
+    kwargs = ConnectionConfig(baudrate=115200, data_format="7e2").serial_kwargs()
+    assert kwargs == {"baudrate": 115200, "bytesize": serial.SEVENBITS, "parity": serial.PARITY_EVEN,
+                      "stopbits": serial.STOPBITS_TWO}
+
+@pytest.mark.parametrize("data_format", ["8N1.5", "9N1", "8X1", "8N", "", None])
+def test_bad_data_format_is_a_value_error(data_format):
+    with pytest.raises(ValueError):
+        ConnectionConfig(data_format=data_format).serial_kwargs()
+
+def test_load_falls_back_from_a_bad_data_format(tmp_path):
+    path = str(tmp_path / "telemetry_config.json")
+    with open(path, "w") as f:
+        json.dump({"port": "/dev/ttyUSB0", "data_format": "8N1.5"}, f)
+    config = load_connection_config(path)
+    assert config.port == "/dev/ttyUSB0"
+    assert config.data_format == "8N1"
+    assert config.serial_kwargs()["stopbits"] == serial.STOPBITS_ONE
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "telemetry_config.json")
+    save_connection_config(ConnectionConfig(port="/dev/pts/3", baudrate=57600, data_format="8E1"), path)
+    config = load_connection_config(path)
+    assert (config.port, config.baudrate, config.data_format) == ("/dev/pts/3", 57600, "8E1")
+    assert not (tmp_path / "telemetry_config.json.tmp").exists()
@@ -0,0 +1,63 @@
+import os
+from collections import deque
+import pytest
+from PyQt5.QtWidgets import QApplication
+from channels import load_channel_schema
+from instrumentation import instrumentation
+from synthetic_flight import generate_flight_lines
+import dashboard
+
+SCHEMA = load_channel_schema(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "channels.json"))
+
+@pytest.fixture
+def live_dashboard(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    app = QApplication.instance() or QApplication([])
+    board = dashboard.Dashboard(lambda *args: None, None, SCHEMA)
+    instrumentation.enabled = True
+    instrumentation.reset()
+    yield board
+    instrumentation.enabled = False
+    instrumentation.reset()
+    board.deleteLater()
+    app.processEvents()
+
+def test_pending_gauges_follow_the_backlog(live_dashboard):
+    for line in generate_flight_lines(30):
+        live_dashboard.process_serial_data(line)
+    live_dashboard.ingest_pending()
+    gauges = instrumentation.snapshot()["gauges"]
+    assert gauges["pending_rows"] == 30
+    assert gauges["pending_high_water"] == 30
+    assert gauges["pending_dropped"] == 0
+    live_dashboard.ingest_pending()
+    gauges = instrumentation.snapshot()["gauges"]
+    assert gauges["pending_rows"] == 0
+    assert gauges["pending_high_water"] == 30
+
+def test_overflow_drops_the_oldest_rows_and_counts_them(live_dashboard, monkeypatch):
+    monkeypatch.setattr(dashboard, "PENDING_MAX_ROWS", 10)
+    live_dashboard.pending_stamps = deque(maxlen=10)
+    for line in generate_flight_lines(25):
+        live_dashboard.process_serial_data(line)
+    assert len(live_dashboard.pending_stamps) == 10
+    live_dashboard.ingest_pending()
+    gauges = instrumentation.snapshot()["gauges"]
+    assert gauges["pending_dropped"] == 15
+    assert gauges["pending_high_water"] == 10
+    assert len(live_dashboard.history) == 10
+
+def test_ingest_timer_stops_when_the_link_dies_while_hidden(live_dashboard, monkeypatch):
+    streaming = [True]
+    monkeypatch.setattr(live_dashboard, "is_streaming", lambda: streaming[0])
+    live_dashboard.hide()
+    live_dashboard.update_timer_state()
+    assert live_dashboard.ingest_timer.isActive() and not live_dashboard.timer.isActive()
+    for line in generate_flight_lines(5):
+        live_dashboard.process_serial_data(line)
+
+    streaming[0] = False
+    live_dashboard.ingest_timer.timeout.emit()
+    assert not live_dashboard.ingest_timer.isActive()
+    # Rows that arrived before the link stopped are still stored
+    assert len(live_dashboard.history) == 5 and not live_dashboard.pending_stamps
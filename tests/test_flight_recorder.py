@@ -0,0 +1,50 @@
+import os
+import numpy as np
+from channels import load_channel_schema
+from derived_channels import DerivedChannelEngine
+from event_detection import EventDetector
+from flight_recorder import FlightRecorder
+from synthetic_flight import generate_flight
+
+SCHEMA = load_channel_schema(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "channels.json"))
+
+# A synthetic flight fed to a recorder in 10-row batches the way the dashboard does,
+# starting `offset` seconds after the dashboard opened
+def record(n, offset=100.0):
+    t, channels = generate_flight(n)
+    t = t + offset
+    rows = np.full((n, len(SCHEMA)), np.nan)
+    for name, values in channels.items():
+        if name in SCHEMA.index:
+            rows[:, SCHEMA.index[name]] = values
+    engine, detector, recorder = DerivedChannelEngine(SCHEMA), EventDetector(SCHEMA), FlightRecorder(SCHEMA)
+    for i in range(0, n, 10):
+        batch_t, batch = t[i:i + 10], rows[i:i + 10]
+        engine.process(batch_t, batch)
+        recorder.add(batch_t, batch, detector.process(batch_t, batch))
+    return recorder
+
+def test_snapshot_uses_one_time_base():
+    series, time_series, segments, events = record(6000).snapshot()
+    times = time_series.to_float64()
+    liftoff = [event for event in events if event["event"] == "liftoff"]
+    assert liftoff and liftoff[0]["time"] == 0.0
+    assert segments["liftoff"] == 0.0
+    start, end = segments["full_rate"]
+    assert times[0] <= start < 0.0 < end <= times[-1]
+    # Full rate starts about pre_trigger_s before liftoff
+    assert abs(start + segments["pre_trigger_s"]) < 0.1
+    assert len(series["Altitude"]) == len(times)
+
+def test_snapshot_before_liftoff_covers_the_ring():
+    _, time_series, segments, events = record(500).snapshot()
+    times = time_series.to_float64()
+    assert segments["liftoff"] is None and not events
+    assert segments["full_rate"][1] == times[-1]
+
+def test_snapshot_is_a_copy():
+    recorder = record(6000)
+    series, _, _, _ = recorder.snapshot()
+    before = series["Altitude"].raw().copy()
+    recorder.add(np.array([1000.0]), np.zeros((1, len(SCHEMA))))
+    assert np.array_equal(series["Altitude"].raw(), before)
@@ -0,0 +1,119 @@
+import os
+import numpy as np
+import pytest
+import launch_cache
+from channels import TIME_ENCODING, load_channel_schema
+from launch_cache import LaunchCache, LaunchSummary, content_key, LEVEL_FACTOR
+from launch_storage import TIME_COLUMN, launch_dir, write_launch_samples
+from synthetic_flight import generate_flight, generate_flight_lines
+from telemetry_store import CompactSeries
+
+SCHEMA = load_channel_schema(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "channels.json"))
+
+# Archive a synthetic flight the way the dashboard saves one, returning its launch entry
+def archive_flight(launch_id, n=20000, seed=0):
+    t, channels = generate_flight(n, seed=seed)
+    series = {}
+    for name, values in channels.items():
+        series[name] = CompactSeries(SCHEMA[name].encoding)
+        series[name].extend(values)
+    series[TIME_COLUMN] = CompactSeries(TIME_ENCODING)
+    series[TIME_COLUMN].extend(t)
+    return {"name": launch_id, "events": [], "samples": write_launch_samples(launch_id, series)}
+
+def legacy_launch(seed):
+    return {"name": f"legacy {seed}", "data": list(generate_flight_lines(2000, seed=seed))}
+
+@pytest.fixture(autouse=True)
+def in_tmp(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+def test_lru_evicts_against_the_byte_cap():
+    launches = {f"2024-05-0{i}_12-00-00": legacy_launch(i) for i in range(1, 5)}
+    ids = list(launches)
+    size = LaunchCache(SCHEMA, persist=False).get(ids[0], launches[ids[0]]).nbytes()
+    cache = LaunchCache(SCHEMA, max_bytes=int(2.5 * size), persist=False)
+    for launch_id in ids[:3]:
+        cache.get(launch_id, launches[launch_id])
+    assert list(cache.entries) == ids[1:3]
+    # A hit makes the entry the most recently used, so the other one goes next
+    cache.get(ids[1], launches[ids[1]])
+    cache.get(ids[3], launches[ids[3]])
+    assert list(cache.entries) == [ids[1], ids[3]]
+    assert cache.total_bytes == sum(entry.nbytes() for entry in cache.entries.values()) <= cache.max_bytes
+    assert (cache.hits, cache.misses) == (1, 4)
+
+def test_a_single_entry_larger_than_the_cap_is_kept():
+    cache = LaunchCache(SCHEMA, max_bytes=1, persist=False)
+    cache.get("2024-05-01_12-00-00", legacy_launch(1))
+    assert list(cache.entries) == ["2024-05-01_12-00-00"]
+
+def test_changed_sources_are_decoded_again():
+    launch_id = "2024-05-01_12-00-00"
+    launch = archive_flight(launch_id)
+    cache = LaunchCache(SCHEMA, persist=False)
+    first = cache.get(launch_id, launch)
+    assert cache.get(launch_id, launch) is first
+    # Renames do not change the content
+    assert content_key(launch_id, dict(launch, name="renamed")) == first.key
+    # Rewritten sample files do
+    path = os.path.join(launch_dir(launch_id), launch["samples"]["channels"]["Altitude"]["file"])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    second = cache.get(launch_id, launch)
+    assert second is not first and second.key != first.key
+    # And so does other metadata, e.g. events detected later
+    third = cache.get(launch_id, dict(launch, events=[{"event": "liftoff", "time": 0.0}]))
+    assert third.key != second.key and third.events == [{"event": "liftoff", "time": 0.0}]
+
+def test_sidecar_round_trip(monkeypatch):
+    launch_id = "2024-05-01_12-00-00"
+    launch = archive_flight(launch_id)
+    built = LaunchCache(SCHEMA).get(launch_id, launch)
+    assert os.path.exists(os.path.join(launch_dir(launch_id), launch_cache.SIDECAR_FILE))
+
+    # A fresh cache (e.g. after a restart) reads the sidecar instead of decoding
+    def no_decoding(*args):
+        raise AssertionError("decoded although the sidecar is current")
+    monkeypatch.setattr(launch_cache, "build_summary", no_decoding)
+    loaded = LaunchCache(SCHEMA).get(launch_id, launch)
+    assert loaded.key == built.key and loaded.events == built.events
+    np.testing.assert_array_equal(loaded.time, built.time)
+    assert list(loaded.channels) == list(built.channels)
+    for name, values in built.channels.items():
+        np.testing.assert_array_equal(loaded.channels[name], values)
+        assert len(loaded.levels[name]) == len(built.levels[name])
+        for got, expected in zip(loaded.levels[name], built.levels[name]):
+            for a, b in zip(got, expected):
+                np.testing.assert_array_equal(a, b)
+
+def test_stale_sidecar_is_ignored():
+    launch_id = "2024-05-01_12-00-00"
+    launch = archive_flight(launch_id)
+    LaunchCache(SCHEMA).get(launch_id, launch)
+    assert LaunchSummary.load(launch_id, os.path.join(launch_dir(launch_id), launch_cache.SIDECAR_FILE),
+                              "another key") is None
+
+def test_plot_data_picks_the_coarsest_level_that_fits():
+    n = 100000
+    time = np.arange(n, dtype=np.float64)
+    values = np.sin(time / 1000.0)
+    values[54321] = 50.0  # A spike that decimation must not hide
+    summary = LaunchSummary("2024-05-01_12-00-00", "key", time, {"Altitude": values}, [])
+    sizes = [len(xs) for xs, _, _ in summary.levels["Altitude"]]
+    assert sizes == [n // LEVEL_FACTOR ** k for k in range(1, len(sizes) + 1)]
+
+    # Everything fits: the raw samples
+    x, y = summary.plot_data("Altitude", max_points=n)
+    assert len(x) == n
+    for max_points in (4000, 2 * sizes[1], 2 * sizes[1] - 1):
+        x, y = summary.plot_data("Altitude", max_points=max_points)
+        level = next(k for k, size in enumerate(sizes) if 2 * size <= max_points)
+        xs, lo, hi = summary.levels["Altitude"][level]
+        assert len(x) == 2 * sizes[level] <= max_points
+        np.testing.assert_array_equal(y[0::2], lo)
+        np.testing.assert_array_equal(y[1::2], hi)
+        assert y.max() == 50.0
+    # Too few points asked for: the coarsest level
+    x, _ = summary.plot_data("Altitude", max_points=10)
+    assert len(x) == 2 * sizes[-1]
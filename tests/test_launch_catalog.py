@@ -0,0 +1,50 @@
+import json
+from launch_catalog import LaunchCatalog, open_catalog
+from synthetic_flight import generate_flight_lines
+
+# A launch from before the catalog: raw telemetry lines, no events
+LEGACY_ID = "2024-05-01_12-00-00"
+
+def legacy_archive(tmp_path):
+    path = tmp_path / "past_launches.json"
+    with open(path, "w") as f:
+        json.dump({LEGACY_ID: {"name": "Old flight", "data": list(generate_flight_lines(6000))}}, f)
+    return str(path)
+
+def test_listings_leave_sample_data_out(tmp_path):
+    catalog = LaunchCatalog(str(tmp_path / "catalog.db"))
+    launch = {"name": "Flight", "samples": {"length": 3, "channels": {}}, "data": ["Altitude:1.00"]}
+    catalog.add_launch(LEGACY_ID, launch)
+    listed = catalog.search()[LEGACY_ID]
+    assert "samples" not in listed and "data" not in listed
+    _, _, _, page = catalog.page(0)
+    assert "samples" not in page[LEGACY_ID] and "data" not in page[LEGACY_ID]
+    assert catalog.get(LEGACY_ID) == launch
+    assert catalog.all_launches()[LEGACY_ID] == launch
+    catalog.close()
+
+def test_rename_keeps_sample_data(tmp_path):
+    catalog = LaunchCatalog(str(tmp_path / "catalog.db"))
+    catalog.add_launch(LEGACY_ID, {"name": "Flight", "data": ["Altitude:1.00"]})
+    catalog.rename(LEGACY_ID, "Renamed")
+    assert catalog.get(LEGACY_ID) == {"name": "Renamed", "data": ["Altitude:1.00"]}
+    catalog.close()
+
+def test_legacy_import_detects_events(tmp_path):
+    catalog = open_catalog(str(tmp_path / "catalog.db"), legacy_archive(tmp_path))
+    launch = catalog.get(LEGACY_ID)
+    assert [event["event"] for event in launch["events"]][:2] == ["liftoff", "burnout"]
+    apogee = [event for event in launch["events"] if event["event"] == "apogee"][0]
+    assert LEGACY_ID in catalog.search(apogee_above=apogee["altitude"] - 1)
+    assert LEGACY_ID not in catalog.search(apogee_above=apogee["altitude"] + 1)
+    assert catalog.statistics(LEGACY_ID)["Altitude"][1] >= apogee["altitude"]
+    catalog.close()
+
+def test_unreadable_legacy_launch_is_imported_without_events(tmp_path):
+    path = tmp_path / "past_launches.json"
+    with open(path, "w") as f:
+        json.dump({LEGACY_ID: {"name": "Broken", "data": ["not a telemetry line"]}}, f)
+    catalog = open_catalog(str(tmp_path / "catalog.db"), str(path))
+    assert catalog.get(LEGACY_ID).get("events") is None
+    assert LEGACY_ID in catalog.search()
+    catalog.close()
@@ -0,0 +1,34 @@
+import numpy as np
+from launch_cache import LaunchSummary
+from launch_compare import delta_curves, overlay_data
+from synthetic_flight import generate_flight
+
+def summary(launch_id, seed, shift=0.0, n=40000):
+    t, channels = generate_flight(n, seed=seed)
+    events = [{"event": "liftoff", "time": 10.0 + shift}]
+    return LaunchSummary(launch_id, launch_id, t + shift, {"Altitude": channels["Altitude"]}, events)
+
+def test_delta_of_flights_differing_only_in_noise_is_within_the_noise():
+    a, b = summary("a", seed=1), summary("b", seed=2)
+    true_max = np.abs(b.channels["Altitude"] - a.channels["Altitude"]).max()
+    x, deltas = delta_curves([a, b], "Altitude", max_points=1500)
+    assert len(x) == 1500
+    assert np.nanmax(np.abs(deltas["b"])) <= true_max
+
+def test_delta_is_taken_after_alignment():
+    a, b = summary("a", seed=1), summary("b", seed=2, shift=7.5)
+    _, deltas = delta_curves([a, b], "Altitude", align="liftoff", max_points=1000)
+    # Unaligned, a 7.5 s shift during boost/coast would differ by hundreds of metres
+    assert np.nanmax(np.abs(deltas["b"])) < 2.0
+
+def test_delta_is_nan_where_a_launch_has_no_data():
+    a, b = summary("a", seed=1), summary("b", seed=2, n=20000)
+    x, deltas = delta_curves([a, b], "Altitude", align="none", max_points=100)
+    assert np.isnan(deltas["b"][x > 210]).all()
+    assert np.isfinite(deltas["b"][x < 190]).all()
+
+def test_overlay_keeps_the_envelope_for_drawing():
+    a, b = summary("a", seed=1), summary("b", seed=2)
+    curves = overlay_data([a, b], "Altitude", max_points=4000)
+    assert [launch_id for launch_id, _, _ in curves] == ["a", "b"]
+    assert all(len(x) < len(a.time) for _, x, _ in curves)
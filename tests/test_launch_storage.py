@@ -0,0 +1,106 @@
+import os
+import numpy as np
+import pytest
+from channels import TIME_ENCODING, load_channel_schema
+from launch_storage import (BLOCK_SAMPLES, TIME_COLUMN, query_block_stats, query_launch, query_rows,
+                            read_launch_samples, write_launch_samples)
+from synthetic_flight import generate_flight
+from telemetry_store import CompactSeries
+
+SCHEMA = load_channel_schema(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "channels.json"))
+LAUNCH_ID = "2024-05-01_12-00-00"
+N = 3 * BLOCK_SAMPLES + BLOCK_SAMPLES // 2  # The last block is partial
+
+# An archived flight and everything in it decoded, to check queries against
+@pytest.fixture
+def flight(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    t, channels = generate_flight(N)
+    channels["Altitude"][100:200] = np.nan  # A dropout inside the first block
+    series = {}
+    for name, values in channels.items():
+        series[name] = CompactSeries(SCHEMA[name].encoding)
+        series[name].extend(values)
+    series[TIME_COLUMN] = CompactSeries(TIME_ENCODING)
+    series[TIME_COLUMN].extend(t)
+    launch = {"name": LAUNCH_ID, "samples": write_launch_samples(LAUNCH_ID, series)}
+    return launch, read_launch_samples(LAUNCH_ID, launch)
+
+def expect(full, start, stop):
+    time = full[TIME_COLUMN]
+    mask = (time >= start) & (time <= stop)
+    return time[mask], full["Altitude"][mask]
+
+def check(launch, full, start, stop):
+    time, values = query_launch(LAUNCH_ID, launch, ["Altitude"], start, stop)
+    expected_time, expected_values = expect(full, start, stop)
+    np.testing.assert_array_equal(time, expected_time)
+    np.testing.assert_array_equal(values["Altitude"], expected_values)
+    return len(time)
+
+def test_ranges_on_block_boundaries(flight):
+    launch, full = flight
+    t = full[TIME_COLUMN]
+    b = BLOCK_SAMPLES
+    # Exactly the second block
+    assert check(launch, full, t[b], t[2 * b - 1]) == b
+    assert query_rows(LAUNCH_ID, launch, t[b], t[2 * b - 1]) == b
+    # The last sample of one block and the first of the next
+    assert check(launch, full, t[b - 1], t[b]) == 2
+    assert query_rows(LAUNCH_ID, launch, t[b - 1], t[b]) == 2 * b
+    # A single sample on either edge of a block
+    assert check(launch, full, t[2 * b], t[2 * b]) == 1
+    assert check(launch, full, t[2 * b - 1], t[2 * b - 1]) == 1
+    # Into the partial last block
+    assert check(launch, full, t[3 * b], np.inf) == N - 3 * b
+    assert query_rows(LAUNCH_ID, launch, t[3 * b], np.inf) == N - 3 * b
+
+def test_ranges_between_samples(flight):
+    launch, full = flight
+    t = full[TIME_COLUMN]
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        start, stop = np.sort(rng.uniform(t[0] - 1.0, t[-1] + 1.0, 2))
+        check(launch, full, start, stop)
+
+def test_ranges_outside_the_recording(flight):
+    launch, full = flight
+    t = full[TIME_COLUMN]
+    for start, stop in ((t[-1] + 0.001, t[-1] + 10.0), (t[0] - 10.0, t[0] - 0.001)):
+        assert check(launch, full, start, stop) == 0
+        assert query_rows(LAUNCH_ID, launch, start, stop) == 0
+        assert len(query_block_stats(LAUNCH_ID, launch, "Altitude", start, stop)["count"]) == 0
+    # Overlapping both ends is the whole recording
+    assert check(launch, full, t[0] - 10.0, t[-1] + 10.0) == N
+    assert query_rows(LAUNCH_ID, launch) == N
+    # An inverted range is empty
+    assert check(launch, full, t[100], t[50]) == 0
+
+def test_block_stats_agree_with_a_full_scan(flight):
+    launch, full = flight
+    values = full["Altitude"]
+    stats = query_block_stats(LAUNCH_ID, launch, "Altitude")
+    assert len(stats["count"]) == -(-N // BLOCK_SAMPLES)
+    for block in range(len(stats["count"])):
+        chunk = values[block * BLOCK_SAMPLES:(block + 1) * BLOCK_SAMPLES]
+        finite = chunk[np.isfinite(chunk)]
+        assert stats["count"][block] == len(finite)
+        assert stats["min"][block] == finite.min()
+        assert stats["max"][block] == finite.max()
+        assert stats["mean"][block] == pytest.approx(finite.mean())
+    assert stats["t_min"][0] == full[TIME_COLUMN][0] and stats["t_max"][-1] == full[TIME_COLUMN][-1]
+
+    # Restricted to a range, the blocks overlapping it
+    t = full[TIME_COLUMN]
+    stats = query_block_stats(LAUNCH_ID, launch, "Altitude", t[BLOCK_SAMPLES + 10], t[2 * BLOCK_SAMPLES])
+    assert len(stats["count"]) == 2
+    assert stats["min"].min() <= np.nanmin(values[BLOCK_SAMPLES + 10:2 * BLOCK_SAMPLES + 1])
+    assert stats["max"].max() >= np.nanmax(values[BLOCK_SAMPLES + 10:2 * BLOCK_SAMPLES + 1])
+    assert query_block_stats(LAUNCH_ID, launch, "No such channel") is None
+
+def test_legacy_launches_are_filtered_after_reading():
+    launch = {"name": "old", "data": [f"Altitude:{i}.00" for i in range(10)]}
+    time, values = query_launch(LAUNCH_ID, launch, ["Altitude"], 2, 5)
+    np.testing.assert_array_equal(time, [2, 3, 4, 5])
+    np.testing.assert_array_equal(values["Altitude"], [2, 3, 4, 5])
+    assert query_rows(LAUNCH_ID, launch) == 10
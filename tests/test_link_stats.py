@@ -0,0 +1,45 @@
+from link_stats import LinkStats, SourceLinkStats
+
+def observe_all(sequences):
+    source = SourceLinkStats("test")
+    for i, sequence in enumerate(sequences):
+        source.observe(sequence, i * 0.01)
+    return source.summary()
+
+def test_in_order_sequence_is_clean():
+    summary = observe_all(range(100))
+    assert (summary["dropped"], summary["duplicates"], summary["out_of_order"]) == (0, 0, 0)
+    assert summary["delivery_ratio"] == 1.0
+
+def test_gap_counts_dropped_packets():
+    summary = observe_all([0, 1, 2, 6, 7])
+    assert summary["dropped"] == 3
+
+def test_duplicate_of_a_late_packet_is_a_duplicate():
+    summary = observe_all([0, 1, 2, 5, 3, 3, 6, 7, 4])
+    assert summary["out_of_order"] == 2
+    assert summary["duplicates"] == 1
+    assert summary["dropped"] == 0
+
+def test_counter_reset_resyncs():
+    summary = observe_all([100, 101, 0, 1, 2, 3])
+    assert summary["resyncs"] == 1
+    assert summary["out_of_order"] == 0
+    assert summary["dropped"] == 0
+    assert summary["duplicates"] == 0
+
+def test_wraparound_is_not_a_reset():
+    summary = observe_all([65534, 65535, 0, 1])
+    assert summary["resyncs"] == 0
+    assert summary["dropped"] == 0
+
+def test_totals_across_sources():
+    stats = LinkStats()
+    for sequence in [0, 1, 3]:
+        stats.source("a").observe(sequence, 0.0)
+    for sequence in [0, 0]:
+        stats.source("b").observe(sequence, 0.0)
+    summary = stats.summary()
+    assert summary["dropped"] == 1
+    assert summary["duplicates"] == 1
+    assert set(summary["sources"]) == {"a", "b"}
@@ -0,0 +1,57 @@
+import time
+import pytest
+from PyQt5.QtWidgets import QApplication
+from archive_service import ArchiveService
+import past_launches
+from past_launches import PastLaunchesScreen
+from launch_catalog import PAGE_SIZE
+
+LAUNCHES = {f"2024-05-{day:02d}_12-00-00": {"name": f"Flight {day}", "data": ["Altitude:1.00"]}
+            for day in range(1, PAGE_SIZE + 6)}
+
+@pytest.fixture
+def screen(tmp_path, monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    archive = ArchiveService(str(tmp_path / "catalog.db"))
+    archive.add_launches_async(LAUNCHES)
+    monkeypatch.setattr(past_launches, "_archive", archive)
+    screen = PastLaunchesScreen(lambda launch_id: None, lambda: None, lambda *args: None)
+    settle(app, screen)
+    yield screen
+    screen.deleteLater()
+    past_launches.close_archive()
+    app.processEvents()
+
+# Run the event loop until the page requested last is listed
+def settle(app, screen, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while screen.shown_request != screen.page_request and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+    assert screen.shown_request == screen.page_request
+
+def rows(screen):
+    return screen.scroll_layout.count()
+
+def test_searching_and_paging_replace_the_rows(screen):
+    app = QApplication.instance()
+    assert rows(screen) == PAGE_SIZE
+    screen.search_field.setText("no such flight")
+    screen.run_search()
+    settle(app, screen)
+    assert rows(screen) == 0 and screen.compare_boxes == {}
+    screen.search_field.setText("")
+    screen.run_search()
+    settle(app, screen)
+    assert rows(screen) == PAGE_SIZE
+    screen.show_page(1)
+    settle(app, screen)
+    assert rows(screen) == len(LAUNCHES) - PAGE_SIZE
+    assert set(screen.compare_boxes) == set(screen.past_launches)
+    screen.show_page(0)
+    settle(app, screen)
+    assert rows(screen) == PAGE_SIZE
+
+def test_renames_of_launches_no_longer_listed_are_ignored(screen):
+    screen.rename_launch("1999-01-01_00-00-00", "Gone")
+    assert screen.pending_renames == {}
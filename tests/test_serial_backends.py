@@ -0,0 +1,91 @@
+import time
+import threading
+import pytest
+from pty_standin import PtyStandIn
+from serial_backends import AsyncioSerialHub, LineFramer
+from synthetic_flight import generate_flight_lines
+
+pytestmark = pytest.mark.skipif(not AsyncioSerialHub.is_supported(), reason="needs POSIX ptys")
+
+LINES = list(generate_flight_lines(300, sequence_key="Seq"))
+
+def wait_for(condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+@pytest.fixture
+def standin():
+    # Blocking writes: nothing is overrun, so every line must arrive
+    standin = PtyStandIn(LINES, baudrate=921600, loop=False, block=True)
+    yield standin
+    standin.close()
+
+def test_framer_keeps_partial_lines():
+    framer = LineFramer(b"\r\n")
+    assert framer.feed(b"Altitude:1.00\r\nAlt") == [b"Altitude:1.00"]
+    assert framer.feed(b"itude:2.00\r") == []
+    assert framer.feed(b"\nAltitude:3.00\r\n") == [b"Altitude:2.00", b"Altitude:3.00"]
+
+def test_hub_reads_every_line_from_the_standin(standin):
+    received = []
+    lock = threading.Lock()
+    def on_line(raw, arrival_time):
+        with lock:
+            received.append((raw, arrival_time))
+
+    hub = AsyncioSerialHub()
+    hub.start()
+    try:
+        hub.add_source(standin.device_path, on_line, delimiter=b"\r\n", baudrate=921600).result(timeout=2.0)
+        standin.start()
+        assert wait_for(lambda: len(received) >= len(LINES))
+    finally:
+        hub.stop()
+
+    assert standin.stats()["overrun_bytes"] == 0
+    # The stand-in writes 16-byte chunks, so lines were split across reads
+    assert [raw.decode("utf-8") for raw, _ in received] == LINES
+    arrivals = [arrival_time for _, arrival_time in received]
+    assert arrivals == sorted(arrivals)
+
+def test_stop_closes_the_ports_and_the_loop(standin):
+    received = []
+    errors = []
+    hub = AsyncioSerialHub()
+    hub.start()
+    hub.add_source(standin.device_path, lambda raw, arrival_time: received.append(raw),
+                   lambda port, error: errors.append(error), b"\r\n", baudrate=921600).result(timeout=2.0)
+    source = hub.sources[standin.device_path]
+    standin.start()
+    assert wait_for(lambda: len(received) >= 10)
+
+    hub.stop()
+    assert not hub.is_running()
+    assert hub.sources == {}
+    assert not source.ser.is_open
+    assert errors == []
+    # Nothing is delivered once stopped, and stopping again is harmless
+    count = len(received)
+    time.sleep(0.1)
+    assert len(received) == count
+    hub.stop()
+
+def test_a_slow_consumer_pauses_reading_without_losing_lines(standin):
+    received = []
+    def on_line(raw, arrival_time):
+        time.sleep(0.001)
+        received.append(raw)
+
+    hub = AsyncioSerialHub(high_water=8, low_water=2)
+    hub.start()
+    try:
+        hub.add_source(standin.device_path, on_line, delimiter=b"\r\n", baudrate=921600).result(timeout=2.0)
+        source = hub.sources[standin.device_path]
+        standin.start()
+        assert wait_for(lambda: len(received) >= len(LINES))
+        assert source.paused_count > 0
+    finally:
+        hub.stop()
+    assert [raw.decode("utf-8") for raw in received] == LINES
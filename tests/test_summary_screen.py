@@ -0,0 +1,52 @@
+import os
+import time
+import pytest
+from PyQt5.QtWidgets import QApplication
+from channels import load_channel_schema
+from launch_cache import LaunchCache
+from launch_loader import LaunchLoader
+from synthetic_flight import generate_flight_lines
+from dashboard import SummaryScreen
+
+SCHEMA = load_channel_schema(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "channels.json"))
+
+# Legacy launches decode from their lines; listed-only ones are not in any archive and fail
+LAUNCHES = {
+    "2024-05-01_12-00-00": {"name": "gone"},
+    "2024-05-02_12-00-00": {"name": "first", "data": list(generate_flight_lines(3000, seed=1))},
+    "2024-05-03_12-00-00": {"name": "second", "data": list(generate_flight_lines(3000, seed=2))},
+    "2024-05-04_12-00-00": {"name": "also gone"},
+}
+
+@pytest.fixture
+def screen(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    app = QApplication.instance() or QApplication([])
+    loader = LaunchLoader(LaunchCache(SCHEMA, persist=False), lambda launch_id: None)
+    screen = SummaryScreen(lambda: None, SCHEMA, loader=loader)
+    yield screen
+    loader.stop()
+    screen.deleteLater()
+    app.processEvents()
+
+def compare(screen, launch_ids, deltas=True, timeout=10.0):
+    screen.compare_launches(launch_ids, LAUNCHES, "liftoff", deltas)
+    deadline = time.monotonic() + timeout
+    while screen.status_label.text().startswith("Loading") and time.monotonic() < deadline:
+        QApplication.instance().processEvents()
+        time.sleep(0.005)
+    return screen.status_label.text()
+
+def test_comparing_launches_that_all_fail(screen):
+    status = compare(screen, ["2024-05-01_12-00-00", "2024-05-04_12-00-00"])
+    assert status.startswith("Could not load any of the launches")
+
+def test_failed_reference_is_named_in_the_title(screen):
+    status = compare(screen, ["2024-05-01_12-00-00", "2024-05-02_12-00-00", "2024-05-03_12-00-00"])
+    assert "difference to 2024-05-02_12-00-00 instead of 2024-05-01_12-00-00" in status
+    assert "could not load 2024-05-01_12-00-00" in status
+
+def test_overlay_names_the_launches_that_failed(screen):
+    status = compare(screen, ["2024-05-02_12-00-00", "2024-05-04_12-00-00"], deltas=False)
+    assert status.startswith("Comparing (overlay")
+    assert "instead of" not in status and "could not load 2024-05-04_12-00-00" in status